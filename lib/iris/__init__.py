@@ -94,6 +94,18 @@ All the load functions share very similar arguments:
                     experiment_id, long_name='experiment_id')
                 cube.add_aux_coord(experiment_coord)
 
+    * workers:
+        The number of worker threads with which to load the files. By
+        default, files are loaded one after another. When more than one
+        worker is requested, the identification and conversion of each
+        file is performed on a pool of threads. The resulting cubes are
+        identical to, and in the same order as, those of a serial load.
+
+        For example::
+
+            # Load a large archive of PP files using four threads.
+            load(uris, workers=4)
+
 """
 
 from __future__ import (absolute_import, division, print_function)
@@ -126,8 +138,8 @@ __version__ = '1.11.0-DEV'
 
 # Restrict the names imported when using "from iris import *"
 __all__ = ['load', 'load_cube', 'load_cubes', 'load_raw',
-           'save', 'Constraint', 'AttributeConstraint', 'sample_data_path',
-           'site_configuration', 'Future', 'FUTURE',
+           'save', 'Constraint', 'AttributeConstraint', 'CellRange',
+           'sample_data_path', 'site_configuration', 'Future', 'FUTURE',
            'IrisDeprecation']
 
 
@@ -138,6 +150,7 @@ if iris.config.IMPORT_LOGGER:
 
 Constraint = iris._constraints.Constraint
 AttributeConstraint = iris._constraints.AttributeConstraint
+CellRange = iris._constraints.CellRange
 
 
 class Future(threading.local):
@@ -282,7 +295,7 @@ else:
     _update(site_configuration)
 
 
-def _generate_cubes(uris, callback, constraints):
+def _generate_cubes(uris, callback, constraints, workers=None):
     """Returns a generator of cubes given the URIs and a callback."""
     if isinstance(uris, six.string_types):
         uris = [uris]
@@ -295,7 +308,8 @@ def _generate_cubes(uris, callback, constraints):
         # Call each scheme handler with the appropriate URIs
         if scheme == 'file':
             part_names = [x[1] for x in groups]
-            for cube in iris.io.load_files(part_names, callback, constraints):
+            for cube in iris.io.load_files(part_names, callback, constraints,
+                                           workers=workers):
                 yield cube
         elif scheme in ['http', 'https']:
             urls = [':'.join(x) for x in groups]
@@ -305,9 +319,9 @@ def _generate_cubes(uris, callback, constraints):
             raise ValueError('Iris cannot handle the URI scheme: %s' % scheme)
 
 
-def _load_collection(uris, constraints=None, callback=None):
+def _load_collection(uris, constraints=None, callback=None, workers=None):
     try:
-        cubes = _generate_cubes(uris, callback, constraints)
+        cubes = _generate_cubes(uris, callback, constraints, workers)
         result = iris.cube._CubeFilterCollection.from_cubes(cubes, constraints)
     except EOFError as e:
         raise iris.exceptions.TranslationError(
@@ -315,7 +329,7 @@ def _load_collection(uris, constraints=None, callback=None):
     return result
 
 
-def load(uris, constraints=None, callback=None):
+def load(uris, constraints=None, callback=None, workers=None):
     """
     Loads any number of Cubes for each constraint.
 
@@ -333,15 +347,18 @@ def load(uris, constraints=None, callback=None):
         One or more constraints.
     * callback:
         A modifier/filter function.
+    * workers:
+        The number of worker threads with which to load the files.
 
     Returns:
         An :class:`iris.cube.CubeList`.
 
     """
-    return _load_collection(uris, constraints, callback).merged().cubes()
+    collection = _load_collection(uris, constraints, callback, workers)
+    return collection.merged().cubes()
 
 
-def load_cube(uris, constraint=None, callback=None):
+def load_cube(uris, constraint=None, callback=None, workers=None):
     """
     Loads a single cube.
 
@@ -359,6 +376,8 @@ def load_cube(uris, constraint=None, callback=None):
         A constraint.
     * callback:
         A modifier/filter function.
+    * workers:
+        The number of worker threads with which to load the files.
 
     Returns:
         An :class:`iris.cube.Cube`.
@@ -368,7 +387,8 @@ def load_cube(uris, constraint=None, callback=None):
     if len(constraints) != 1:
         raise ValueError('only a single constraint is allowed')
 
-    cubes = _load_collection(uris, constraints, callback).merged().cubes()
+    collection = _load_collection(uris, constraints, callback, workers)
+    cubes = collection.merged().cubes()
 
     try:
         cube = cubes.merge_cube()
@@ -380,7 +400,7 @@ def load_cube(uris, constraint=None, callback=None):
     return cube
 
 
-def load_cubes(uris, constraints=None, callback=None):
+def load_cubes(uris, constraints=None, callback=None, workers=None):
     """
     Loads exactly one Cube for each constraint.
 
@@ -398,13 +418,16 @@ def load_cubes(uris, constraints=None, callback=None):
         One or more constraints.
     * callback:
         A modifier/filter function.
+    * workers:
+        The number of worker threads with which to load the files.
 
     Returns:
         An :class:`iris.cube.CubeList`.
 
     """
     # Merge the incoming cubes
-    collection = _load_collection(uris, constraints, callback).merged()
+    collection = _load_collection(uris, constraints, callback,
+                                  workers).merged()
 
     # Make sure we have exactly one merged cube per constraint
     bad_pairs = [pair for pair in collection.pairs if len(pair) != 1]
@@ -417,7 +440,7 @@ def load_cubes(uris, constraints=None, callback=None):
     return collection.cubes()
 
 
-def load_raw(uris, constraints=None, callback=None):
+def load_raw(uris, constraints=None, callback=None, workers=None):
     """
     Loads non-merged cubes.
 
@@ -441,12 +464,14 @@ def load_raw(uris, constraints=None, callback=None):
         One or more constraints.
     * callback:
         A modifier/filter function.
+    * workers:
+        The number of worker threads with which to load the files.
 
     Returns:
         An :class:`iris.cube.CubeList`.
 
     """
-    return _load_collection(uris, constraints, callback).cubes()
+    return _load_collection(uris, constraints, callback, workers).cubes()
 
 
 save = iris.io.save
@@ -23,12 +23,14 @@ from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
+import bisect
 from collections import defaultdict, namedtuple
 from copy import deepcopy
 
 import biggus
 import numpy as np
 
+import iris._merge
 import iris.coords
 import iris.cube
 from iris.util import guess_coord_axis, array_equal, unify_time_units
@@ -234,6 +236,33 @@ class _CoordExtent(namedtuple('CoordExtent',
     __slots__ = ()
 
 
+class _SourceCube(namedtuple('SourceCube',
+                             ['cube', 'cube_signature', 'coord_signature',
+                              'key'])):
+    """
+    A candidate source-cube, together with everything that is needed to
+    register it with a :class:`_ProtoCube`.
+
+    Args:
+
+    * cube:
+        The :class:`iris.cube.Cube`.
+
+    * cube_signature:
+        The :class:`_CubeSignature` of the cube.
+
+    * coord_signature:
+        The :class:`_CoordSignature` of the cube.
+
+    * key:
+        A hashable summary of the cube signature. Cubes with matching
+        signatures always have equal keys.
+
+    """
+
+    __slots__ = ()
+
+
 def concatenate(cubes, error_on_mismatch=False, check_aux_coords=True):
     """
     Concatenate the provided cubes over common existing dimensions.
@@ -254,21 +283,50 @@ def concatenate(cubes, error_on_mismatch=False, check_aux_coords=True):
         A :class:`iris.cube.CubeList` of concatenated :class:`iris.cube.Cube`
         instances.
 
+    """
+    concatenated_cubes = _concatenate(cubes, error_on_mismatch,
+                                      check_aux_coords)
+
+    # Perform concatenation until we've reached an equilibrium.
+    count = len(concatenated_cubes)
+    while count != 1 and count != len(cubes):
+        cubes = concatenated_cubes
+        concatenated_cubes = _concatenate(cubes)
+        count = len(concatenated_cubes)
+
+    return concatenated_cubes
+
+
+def _concatenate(cubes, error_on_mismatch=False, check_aux_coords=True):
+    """
+    Perform a single pass of concatenation over the provided cubes.
+
+    See :func:`concatenate`.
+
     """
     proto_cubes_by_name = defaultdict(list)
+    proto_cubes_by_key = defaultdict(list)
     # Initialise the nominated axis (dimension) of concatenation
     # which requires to be negotiated.
     axis = None
 
     # Register each cube with its appropriate proto-cube.
     for cube in cubes:
+        source = _ProtoCube.source(cube)
         name = cube.standard_name or cube.long_name
-        proto_cubes = proto_cubes_by_name[name]
+        if error_on_mismatch:
+            # Try every proto-cube of the same name, so that the reason for
+            # any mismatch is reported.
+            proto_cubes = proto_cubes_by_name[name]
+        else:
+            # Only the proto-cubes with the same key as the cube can
+            # possibly match it.
+            proto_cubes = proto_cubes_by_key[source.key]
         registered = False
 
         # Register cube with an existing proto-cube.
         for proto_cube in proto_cubes:
-            registered = proto_cube.register(cube, axis, error_on_mismatch,
+            registered = proto_cube.register(source, axis, error_on_mismatch,
                                              check_aux_coords)
             if registered:
                 axis = proto_cube.axis
@@ -276,7 +334,9 @@ def concatenate(cubes, error_on_mismatch=False, check_aux_coords=True):
 
         # Create a new proto-cube for an unregistered cube.
         if not registered:
-            proto_cubes.append(_ProtoCube(cube))
+            proto_cube = _ProtoCube(source)
+            proto_cubes_by_name[name].append(proto_cube)
+            proto_cubes_by_key[source.key].append(proto_cube)
 
     # Construct a concatenated cube from each of the proto-cubes.
     concatenated_cubes = iris.cube.CubeList()
@@ -290,14 +350,38 @@ def concatenate(cubes, error_on_mismatch=False, check_aux_coords=True):
             # Construct the concatenated cube.
             concatenated_cubes.append(proto_cube.concatenate())
 
-    # Perform concatenation until we've reached an equilibrium.
-    count = len(concatenated_cubes)
-    if count != 1 and count != len(cubes):
-        concatenated_cubes = concatenate(concatenated_cubes)
-
     return concatenated_cubes
 
 
+def _signature_key(cube_signature):
+    """
+    Return a hashable key that summarises the given :class:`_CubeSignature`.
+
+    Only names, dimensions, types and hashable attribute values contribute
+    to the key, such that signatures that match always have equal keys. The
+    converse does not hold, so cubes with equal keys must still be matched
+    in full.
+
+    """
+    defn = cube_signature.defn
+    attributes = tuple((name,
+                        iris._merge._attribute_key(defn.attributes[name]))
+                       for name in sorted(defn.attributes))
+    cell_methods = tuple(cell_method.method
+                         for cell_method in defn.cell_methods)
+    dims = tuple((metadata.name(), tuple(metadata.dims))
+                 for metadata in cube_signature.dim_metadata)
+    auxs = tuple((metadata.name(), tuple(metadata.dims))
+                 for metadata in cube_signature.aux_metadata)
+    scalars = tuple(coord.name() for coord in cube_signature.scalar_coords)
+    cell_measures = tuple((cell_measure.name(), tuple(dims))
+                          for cell_measure, dims in
+                          cube_signature.cell_measures_and_dims)
+    return (defn.standard_name, defn.long_name, defn.var_name, attributes,
+            cell_methods, cube_signature.ndim, cube_signature.data_type,
+            dims, auxs, scalars, cell_measures)
+
+
 class _CubeSignature(object):
     """
     Template for identifying a specific type of :class:`iris.cube.Cube` based
@@ -604,19 +688,33 @@ class _ProtoCube(object):
         Args:
 
         * cube:
-            Source :class:`iris.cube.Cube` of the :class:`_ProtoCube`.
+            Source :class:`iris.cube.Cube` of the :class:`_ProtoCube`, or
+            its :class:`_SourceCube` as returned by :meth:`source`.
 
         """
+        if not isinstance(cube, _SourceCube):
+            cube = self.source(cube)
+        cube, cube_signature, coord_signature, key = cube
+
         # Cache the source-cube of this proto-cube.
         self._cube = cube
 
         # The cube signature is a combination of cube and coordinate
         # metadata that defines this proto-cube.
-        self._cube_signature = _CubeSignature(cube)
+        self._cube_signature = cube_signature
 
         # The coordinate signature allows suitable non-overlapping
         # source-cubes to be identified.
-        self._coord_signature = _CoordSignature(self._cube_signature)
+        self._coord_signature = coord_signature
+
+        # The hashable summary of the cube signature.
+        self.key = key
+
+        # The extents of the source-cubes over the axis of the last
+        # sequencing check, kept in sorted order.
+        self._extents = []
+        self._extents_axis = None
+        self._extents_valid = True
 
         # The list of source-cubes relevant to this proto-cube.
         self._skeletons = []
@@ -625,6 +723,26 @@ class _ProtoCube(object):
         # The nominated axis of concatenation.
         self._axis = None
 
+    @staticmethod
+    def source(cube):
+        """
+        Return the :class:`_SourceCube` of the given cube.
+
+        This derives the signatures of the cube, and their hashable key, just
+        once, so that a matching :class:`_ProtoCube` can be found by key and
+        the cube then registered with it, without repeating the work.
+
+        Args:
+
+        * cube:
+            The :class:`iris.cube.Cube`.
+
+        """
+        cube_signature = _CubeSignature(cube)
+        coord_signature = _CoordSignature(cube_signature)
+        key = _signature_key(cube_signature)
+        return _SourceCube(cube, cube_signature, coord_signature, key)
+
     @property
     def axis(self):
         """Return the nominated dimension of concatenation."""
@@ -686,7 +804,8 @@ class _ProtoCube(object):
 
         * cube:
             The :class:`iris.cube.Cube` source-cube candidate for
-            concatenation.
+            concatenation, or its :class:`_SourceCube` as returned by
+            :meth:`source`.
 
         Kwargs:
 
@@ -707,13 +826,15 @@ class _ProtoCube(object):
                 'to negotiated axis [{}]'.format(axis, self.axis)
             raise ValueError(msg)
 
+        if not isinstance(cube, _SourceCube):
+            cube = self.source(cube)
+        cube, cube_signature, coord_signature, _ = cube
+
         # Check for compatible cube signatures.
-        cube_signature = _CubeSignature(cube)
         match = self._cube_signature.match(cube_signature, error_on_mismatch)
 
         # Check for compatible coordinate signatures.
         if match:
-            coord_signature = _CoordSignature(cube_signature)
             candidate_axis = self._coord_signature.candidate_axis(
                 coord_signature)
             match = candidate_axis is not None and \
@@ -773,6 +894,9 @@ class _ProtoCube(object):
         """
         skeleton = _SkeletonCube(coord_signature, data)
         self._skeletons.append(skeleton)
+        if self._extents_axis is not None:
+            bisect.insort(self._extents,
+                          coord_signature.dim_extents[self._extents_axis])
 
     def _build_aux_coordinates(self):
         """
@@ -896,6 +1020,9 @@ class _ProtoCube(object):
         this :class:`_ProtoCube` into non-overlapping segments for the
         given axis.
 
+        The registered extents are kept in sorted order, so only the
+        neighbours of the given extent need to be checked.
+
         Args:
 
         * extent:
@@ -908,50 +1035,54 @@ class _ProtoCube(object):
             Boolean.
 
         """
-        result = True
+        if axis != self._extents_axis:
+            self._extents = sorted(skeleton.signature.dim_extents[axis]
+                                   for skeleton in self._skeletons)
+            self._extents_axis = axis
+            self._extents_valid = all(
+                self._separate(lower, upper)
+                for lower, upper in zip(self._extents[:-1],
+                                        self._extents[1:]))
+
+        result = self._extents_valid
+        if result:
+            index = bisect.bisect(self._extents, extent)
+            if index > 0:
+                result = self._separate(self._extents[index - 1], extent)
+            if result and index < len(self._extents):
+                result = self._separate(extent, self._extents[index])
+
+        return result
 
-        # Add the new extent to the current extents collection.
-        dim_extents = [skeleton.signature.dim_extents[axis]
-                       for skeleton in self._skeletons]
-        dim_extents.append(extent)
+    @staticmethod
+    def _separate(lower, upper):
+        """
+        Determine whether the lower and upper extents, which are in sorted
+        order, are strictly monotonic and do not overlap.
 
-        # Sort into the appropriate dimension order.
-        order = self._coord_signature.dim_order[axis]
-        dim_extents.sort(reverse=(order == _DECREASING))
+        The order of the extents on their axis does not matter, as an
+        increasing sequence of extents is simply the reverse of the
+        equivalent decreasing sequence.
 
-        # Ensure that the extents don't overlap.
-        if len(dim_extents) > 1:
-            for i, extent in enumerate(dim_extents[1:]):
-                # Check the points - must be strictly monotonic.
-                if order == _DECREASING:
-                    big = dim_extents[i].points.min
-                    small = extent.points.max
-                else:
-                    small = dim_extents[i].points.max
-                    big = extent.points.min
-
-                if small >= big:
-                    result = False
-                    break
-
-                # Check the bounds - must be strictly monotonic.
-                if extent.bounds is not None:
-                    if order == _DECREASING:
-                        big_0 = dim_extents[i].bounds[0].min
-                        big_1 = dim_extents[i].bounds[1].min
-                        small_0 = extent.bounds[0].max
-                        small_1 = extent.bounds[1].max
-                    else:
-                        small_0 = dim_extents[i].bounds[0].max
-                        small_1 = dim_extents[i].bounds[1].max
-                        big_0 = extent.bounds[0].min
-                        big_1 = extent.bounds[1].min
-
-                    lower_bound_fail = small_0 >= big_0
-                    upper_bound_fail = small_1 >= big_1
-
-                    if lower_bound_fail or upper_bound_fail:
-                        result = False
-                        break
+        Args:
+
+        * lower:
+            The lesser :class:`_CoordExtent`.
+
+        * upper:
+            The greater :class:`_CoordExtent`.
+
+        Returns:
+            Boolean.
+
+        """
+        # Check the points - must be strictly monotonic.
+        result = not lower.points.max >= upper.points.min
+
+        # Check the bounds - must be strictly monotonic.
+        if result and upper.bounds is not None:
+            lower_bound_fail = lower.bounds[0].max >= upper.bounds[0].min
+            upper_bound_fail = lower.bounds[1].max >= upper.bounds[1].min
+            result = not (lower_bound_fail or upper_bound_fail)
 
         return result
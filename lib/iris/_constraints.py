@@ -26,10 +26,12 @@ import six
 import collections
 import operator
 
+import cf_units
 import numpy as np
 
 import iris.coords
 import iris.exceptions
+import iris.time
 
 
 class Constraint(object):
@@ -77,6 +79,12 @@ class Constraint(object):
               returning True or False if the value of the Cell is desired.
               e.g. ``model_level_number=lambda cell: 5 < cell < 10``
 
+            * **range** - a :class:`CellRange`, which matches as the
+              equivalent function does, but compares all of the cells of
+              the coordinate at once where possible.
+              e.g. ``model_level_number=CellRange(5, 10, min_inclusive=False,
+              max_inclusive=False)``
+
         The :ref:`user guide <loading_iris_cubes>` covers cube much of
         constraining in detail, however an example which uses all of the
         features of this class is given here for completeness::
@@ -256,7 +264,11 @@ class _CoordConstraint(object):
             raise iris.exceptions.CoordinateMultiDimError(msg)
 
         try_quick = False
-        if callable(self._coord_thing):
+        desired_values = None
+        cell_range = None
+        if isinstance(self._coord_thing, CellRange):
+            call_func = cell_range = self._coord_thing
+        elif callable(self._coord_thing):
             call_func = self._coord_thing
         elif (isinstance(self._coord_thing, collections.Iterable) and
                 not isinstance(self._coord_thing,
@@ -268,6 +280,7 @@ class _CoordConstraint(object):
             else:
                 call_func = lambda cell: cell.point in desired_values
         else:
+            desired_values = [self._coord_thing]
             call_func = lambda c: c == self._coord_thing
             try_quick = (isinstance(coord, iris.coords.DimCoord) and
                          not isinstance(self._coord_thing, iris.coords.Cell))
@@ -283,7 +296,14 @@ class _CoordConstraint(object):
             if coord.cell(i) == self._coord_thing:
                 r[i] = True
         else:
-            r = np.array([call_func(cell) for cell in coord.cells()])
+            r = None
+            # Compare all of the cells at once, where possible.
+            if desired_values is not None:
+                r = _matching_cells(coord, desired_values)
+            elif cell_range is not None:
+                r = _cells_in_range(coord, cell_range)
+            if r is None:
+                r = np.array([call_func(cell) for cell in coord.cells()])
         if dims:
             cube_cim[dims[0]] = r
         elif not all(r):
@@ -291,6 +311,290 @@ class _CoordConstraint(object):
         return cube_cim
 
 
+def _matching_cells(coord, values):
+    """
+    Return whether each cell of the one-dimensional coordinate equals any of
+    the values, as a :class:`iris.coords.Cell` compares with a value, from
+    whole-array operations on the coordinate's points and bounds.
+
+    Returns None if the cells must be compared with the values one at a
+    time, e.g. for a mixture of value types.
+
+    """
+    points = coord.points
+    datetime_cells = (iris.FUTURE.cell_datetime_objects and
+                      coord.units.is_time_reference())
+
+    if all(isinstance(value, (int, float, np.number)) for value in values):
+        if datetime_cells or points.dtype.kind not in 'iuf':
+            return None
+        values = np.sort(np.array(values).ravel())
+        if not coord.has_bounds():
+            return np.in1d(points, values)
+        # A value matches a bounded cell if it lies within the bounds, so
+        # count the values between the minimum and maximum of each cell.
+        bounds = coord.bounds
+        lower = np.searchsorted(values, bounds.min(axis=-1), side='left')
+        upper = np.searchsorted(values, bounds.max(axis=-1), side='right')
+        return upper > lower
+
+    if all(isinstance(value, six.string_types) for value in values):
+        if coord.has_bounds() or points.dtype.kind not in 'SU':
+            return None
+        values = np.array(values)
+        if values.dtype.kind != points.dtype.kind:
+            return None
+        return np.in1d(points, values)
+
+    if all(isinstance(value, iris.time.PartialDateTime) for value in values):
+        if not datetime_cells or coord.has_bounds():
+            return None
+        fields = _date_fields(coord.units, points)
+        # Compare each field which is given by any of the values in turn,
+        # as a PartialDateTime compares with a datetime.
+        result = np.zeros(points.shape, dtype=bool)
+        for value in values:
+            match = np.ones(points.shape, dtype=bool)
+            for name in value.__slots__:
+                expected = getattr(value, name)
+                if expected is None:
+                    continue
+                if fields[name] is not None:
+                    match &= fields[name] == expected
+                elif name != 'microsecond':
+                    # Only the microseconds are optional.
+                    return None
+            result |= match
+        return result
+
+    return None
+
+
+def _cells_in_range(coord, cell_range):
+    """
+    Return whether each cell of the one-dimensional coordinate is within the
+    :class:`CellRange`, as a :class:`iris.coords.Cell` compares with a
+    value, from whole-array operations on the coordinate's points and
+    bounds.
+
+    Returns None if the cells must be compared with the range one at a time.
+
+    """
+    points = coord.points
+    datetime_cells = (iris.FUTURE.cell_datetime_objects and
+                      coord.units.is_time_reference())
+    comparisons = cell_range._comparisons()
+    limits = [limit for limit, _ in comparisons]
+    result = np.ones(points.shape, dtype=bool)
+    if not comparisons:
+        return result
+
+    if all(isinstance(limit, (int, float, np.number)) for limit in limits):
+        if datetime_cells or points.dtype.kind not in 'iuf':
+            return None
+        for limit, operator_method in comparisons:
+            values = points
+            if coord.has_bounds():
+                # A bounded cell is greater than, or less than or equal to,
+                # a value if its minimum bound is, and otherwise compares as
+                # its maximum bound does.
+                if operator_method in (operator.gt, operator.le):
+                    values = coord.bounds.min(axis=-1)
+                else:
+                    values = coord.bounds.max(axis=-1)
+            result &= operator_method(values, limit)
+        return result
+
+    if all(isinstance(limit, iris.time.PartialDateTime) for limit in limits):
+        if not datetime_cells or coord.has_bounds():
+            return None
+        fields = _date_fields(coord.units, points)
+        for limit, operator_method in comparisons:
+            order = _date_order(fields, limit)
+            if order is None:
+                return None
+            result &= operator_method(order, 0)
+        return result
+
+    return None
+
+
+def _date_order(fields, value):
+    """
+    Return the order of each date, given by its fields, relative to the
+    :class:`iris.time.PartialDateTime`, as -1, 0 or 1, as a PartialDateTime
+    compares with a datetime.
+
+    Returns None if the order cannot be determined from the fields.
+
+    """
+    if value.microsecond is not None:
+        return None
+    order = 0
+    # The dates are ordered by the first of the given fields which differs.
+    for name in value.__slots__[:-1]:
+        expected = getattr(value, name)
+        if expected is None:
+            continue
+        if fields[name] is None:
+            return None
+        order = np.where(order == 0, np.sign(fields[name] - expected),
+                         order)
+    return order
+
+
+#: The length of each month of the calendars whose years are all the same
+#: length.
+_FIXED_YEAR_MONTHS = {
+    cf_units.CALENDAR_360_DAY: [30] * 12,
+    cf_units.CALENDAR_365_DAY: [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30,
+                                31],
+    cf_units.CALENDAR_366_DAY: [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30,
+                                31]}
+_FIXED_YEAR_MONTHS[cf_units.CALENDAR_NO_LEAP] = \
+    _FIXED_YEAR_MONTHS[cf_units.CALENDAR_365_DAY]
+_FIXED_YEAR_MONTHS[cf_units.CALENDAR_ALL_LEAP] = \
+    _FIXED_YEAR_MONTHS[cf_units.CALENDAR_366_DAY]
+
+#: The number of microseconds in each time interval of a time reference.
+_INTERVAL_MICROSECONDS = {'microseconds': 1, 'milliseconds': 1000,
+                          'seconds': 10 ** 6, 'minutes': 60 * 10 ** 6,
+                          'hours': 3600 * 10 ** 6,
+                          'days': 86400 * 10 ** 6}
+
+
+def _days_from_civil(year, month, day):
+    # The number of days since 1970-01-01 of a date of the proleptic
+    # Gregorian calendar.
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5
+    day_of_year += day - 1
+    day_of_era = (year_of_era * 365 + year_of_era // 4 -
+                  year_of_era // 100 + day_of_year)
+    return era * 146097 + day_of_era - 719468
+
+
+def _civil_from_days(days):
+    # The year, month and day of each of the numbers of days since
+    # 1970-01-01, in the proleptic Gregorian calendar.
+    days = days + 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 -
+                   day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 -
+                                year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = np.where(shifted_month < 10, shifted_month + 3,
+                     shifted_month - 9)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+
+#: The first day of the Gregorian calendar, as the number of days since
+#: 1970-01-01. The "standard" calendar is Julian before this day.
+_GREGORIAN_START = _days_from_civil(1582, 10, 15)
+
+
+def _date_fields(units, points):
+    """
+    Return a dictionary of the year, month, day, hour, minute, second and
+    microsecond of the dates of the points of the time reference units, as
+    arrays, or as None where the dates do not have that field.
+
+    """
+    fields = _calendar_date_fields(units, points)
+    if fields is None:
+        # Convert each point to a datetime instead.
+        dates = list(np.asarray(units.num2date(points)).flat)
+        fields = {}
+        for name in iris.time.PartialDateTime.__slots__:
+            try:
+                field = [getattr(date, name) for date in dates]
+            except AttributeError:
+                field = None
+            else:
+                field = np.array(field, dtype=int).reshape(points.shape)
+            fields[name] = field
+    return fields
+
+
+def _calendar_date_fields(units, points):
+    """
+    Return a dictionary of the date fields of the points of the time
+    reference units, as :func:`_date_fields`, from integer arithmetic on
+    the points.
+
+    Returns None if the calendar or the units are not supported, in which
+    case the points must be converted to datetimes.
+
+    """
+    calendar = units.calendar
+    gregorian = calendar in (cf_units.CALENDAR_STANDARD,
+                             cf_units.CALENDAR_GREGORIAN,
+                             cf_units.CALENDAR_PROLEPTIC_GREGORIAN)
+    if not gregorian and calendar not in _FIXED_YEAR_MONTHS:
+        return None
+    try:
+        utime = units.utime()
+        origin, interval = utime.origin, utime.units
+        tzoffset = utime.tzoffset
+    except (AttributeError, ValueError):
+        return None
+    if (interval not in _INTERVAL_MICROSECONDS or tzoffset or
+            points.dtype.kind not in 'iuf'):
+        return None
+
+    if gregorian:
+        to_days = _days_from_civil
+    else:
+        month_starts = np.cumsum([0] + _FIXED_YEAR_MONTHS[calendar])
+        year_length = month_starts[-1]
+
+        def to_days(year, month, day):
+            return ((year - 1970) * year_length + month_starts[month - 1] +
+                    day - 1)
+
+    # The number of microseconds since 1970-01-01 of each point.
+    day_length = 86400 * 10 ** 6
+    origin_days = int(to_days(origin.year, origin.month, origin.day))
+    origin_microseconds = (
+        origin_days * day_length +
+        ((origin.hour * 60 + origin.minute) * 60 + origin.second) * 10 ** 6 +
+        getattr(origin, 'microsecond', 0))
+    interval = _INTERVAL_MICROSECONDS[interval]
+    if points.dtype.kind == 'f':
+        with np.errstate(invalid='ignore'):
+            microseconds = np.round(points.astype(np.float64) * interval)
+        if not np.all(np.abs(microseconds) < 2 ** 62):
+            return None
+    else:
+        microseconds = points.astype(np.int64) * interval
+    microseconds = microseconds.astype(np.int64) + origin_microseconds
+
+    days = microseconds // day_length
+    microseconds = microseconds - days * day_length
+    if gregorian:
+        if (calendar != cf_units.CALENDAR_PROLEPTIC_GREGORIAN and
+                (origin_days < _GREGORIAN_START or
+                 days.size and days.min() < _GREGORIAN_START)):
+            return None
+        year, month, day = _civil_from_days(days)
+    else:
+        year = days // year_length
+        day_of_year = days - year * year_length
+        year += 1970
+        month = np.searchsorted(month_starts, day_of_year, side='right')
+        day = day_of_year - month_starts[month - 1] + 1
+    seconds = microseconds // 10 ** 6
+    return {'year': year, 'month': month, 'day': day,
+            'hour': seconds // 3600, 'minute': seconds // 60 % 60,
+            'second': seconds % 60, 'microsecond': microseconds % 10 ** 6}
+
+
 class _ColumnIndexManager(object):
     """
     A class to represent column aligned slices which can be operated on
@@ -471,3 +775,69 @@ class AttributeConstraint(Constraint):
 
     def __repr__(self):
         return 'AttributeConstraint(%r)' % self._attributes
+
+
+class CellRange(object):
+    """
+    Provides a coordinate condition of a :class:`Constraint` which matches
+    the cells within a range, and which is evaluated over all of the cells
+    of the coordinate at once where possible.
+
+    """
+    def __init__(self, minimum=None, maximum=None, min_inclusive=True,
+                 max_inclusive=True):
+        """
+        A cell matches the range as it does the equivalent comparisons of
+        a :class:`iris.coords.Cell`, so a bounded cell matches if it
+        overlaps the range.
+
+        Example usage::
+
+            iris.Constraint(latitude=iris.CellRange(-30, 30))
+
+            iris.Constraint(time=iris.CellRange(
+                PartialDateTime(2000), PartialDateTime(2001),
+                max_inclusive=False))
+
+        Kwargs:
+
+        * minimum:
+            The number or :class:`iris.time.PartialDateTime` at the lower
+            end of the range, or None for no lower limit.
+        * maximum:
+            The number or :class:`iris.time.PartialDateTime` at the upper
+            end of the range, or None for no upper limit.
+        * min_inclusive (bool):
+            Whether a cell equal to the minimum is within the range.
+            Defaults to True.
+        * max_inclusive (bool):
+            Whether a cell equal to the maximum is within the range.
+            Defaults to True.
+
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.min_inclusive = min_inclusive
+        self.max_inclusive = max_inclusive
+
+    def __repr__(self):
+        return 'CellRange(%r, %r, min_inclusive=%r, max_inclusive=%r)' % (
+            self.minimum, self.maximum, self.min_inclusive,
+            self.max_inclusive)
+
+    def __call__(self, cell):
+        for limit, operator_method in self._comparisons():
+            if not operator_method(cell, limit):
+                return False
+        return True
+
+    def _comparisons(self):
+        # The limits of the range, with the comparison of a cell with each.
+        comparisons = []
+        if self.minimum is not None:
+            comparisons.append((self.minimum, operator.ge
+                                if self.min_inclusive else operator.gt))
+        if self.maximum is not None:
+            comparisons.append((self.maximum, operator.le
+                                if self.max_inclusive else operator.lt))
+        return comparisons
@@ -0,0 +1,396 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Routines for realising lazy data.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+from collections import deque, OrderedDict
+from multiprocessing.pool import ThreadPool
+import numbers
+import threading
+
+import biggus
+import numpy as np
+import numpy.ma as ma
+
+import iris.config
+
+
+#: The number of worker threads which decode the data of batched sources.
+#: A value of 0 or 1 decodes the data in the calling thread.
+_DECODE_WORKERS = iris.config.DECODE_WORKERS
+
+# The number of workers and the pool of worker threads which decode the
+# data of batched sources, which is created when first needed and shared by
+# all subsequent realisations.
+_DECODE_POOL = None
+_DECODE_POOL_LOCK = threading.Lock()
+
+
+def _decode_pool():
+    """Return the shared pool of :data:`_DECODE_WORKERS` worker threads."""
+    global _DECODE_POOL
+    with _DECODE_POOL_LOCK:
+        if _DECODE_POOL is None or _DECODE_POOL[0] != _DECODE_WORKERS:
+            _DECODE_POOL = (_DECODE_WORKERS, ThreadPool(_DECODE_WORKERS))
+        return _DECODE_POOL[1]
+
+
+class BatchedArrayStack(biggus.ArrayStack):
+    """
+    A :class:`biggus.ArrayStack` which realises the data of its sub-arrays
+    in batches.
+
+    Where a sub-array adapts a concrete data source whose type provides a
+    ``_read_batch`` class method, all of the sources of that type in the
+    stack are read through a single call. The method receives a list of the
+    sources, and yields the index of each source within that list together
+    with a function of no arguments which returns that source's data, in any
+    order. This allows a data source to order and combine the reads of many
+    sources, e.g. to coalesce the reads of many fields in a file.
+
+    The data functions are called on a shared pool of worker threads, each
+    of which writes its result directly into the realised data and mask
+    arrays. They must
+    therefore be safe to call concurrently, as is the case when they only
+    decode data which has already been read.
+
+    """
+    def _getitem_full_keys(self, keys):
+        result = super(BatchedArrayStack, self)._getitem_full_keys(keys)
+        if type(result) is biggus.ArrayStack:
+            result = BatchedArrayStack(result._stack)
+        return result
+
+    def ndarray(self):
+        data = np.empty(self.shape, dtype=self.dtype)
+        self._realise(data)
+        return data
+
+    def masked_array(self):
+        # The workers write into plain data and mask arrays, as assigning
+        # to a shared masked array may replace its mask, losing the
+        # assignments of the other workers.
+        data = np.empty(self.shape, dtype=self.dtype)
+        mask = np.zeros(self.shape, dtype=bool)
+        self._realise(data, mask)
+        if not mask.any():
+            mask = ma.nomask
+        return ma.masked_array(data, mask=mask, fill_value=self.fill_value)
+
+    def _realise(self, data, mask=None):
+        # Group the sub-arrays by the batch reader of their data source.
+        batches = OrderedDict()
+        for index, item in _stack_items(self):
+            read_batch = None
+            if isinstance(item, (biggus.NumpyArrayAdapter,
+                                 biggus.OrthoArrayAdapter)):
+                read_batch = getattr(type(item.concrete), '_read_batch',
+                                     None)
+            batches.setdefault(read_batch, []).append((index, item))
+
+        for read_batch, items in batches.items():
+            if read_batch is None:
+                for index, item in items:
+                    _realise_item(item, index, data, mask)
+            else:
+                self._realise_batch(data, mask, read_batch, items)
+
+    @staticmethod
+    def _realise_batch(data, mask, read_batch, items):
+        def realise(source_index, load):
+            index, item = items[source_index]
+            # Apply the adapter's keys to the source's data.
+            item = type(item)(load(), item._keys)
+            _realise_item(item, index, data, mask)
+
+        sources = [item.concrete for _, item in items]
+        if _DECODE_WORKERS < 2 or len(sources) < 2:
+            for source_index, load in read_batch(sources):
+                realise(source_index, load)
+            return
+
+        # Read the sources in this thread, while the workers decode them.
+        # The number of sources which have been read but not decoded is
+        # bounded, to bound the memory used.
+        pool = _decode_pool()
+        pending = deque()
+        try:
+            for source_index, load in read_batch(sources):
+                pending.append(pool.apply_async(realise,
+                                                (source_index, load)))
+                if len(pending) > 2 * _DECODE_WORKERS:
+                    pending.popleft().get()
+            while pending:
+                pending.popleft().get()
+        finally:
+            # As the pool is shared, wait for any outstanding workers after
+            # an error, rather than terminating them, so that none are left
+            # writing into the data.
+            for result in pending:
+                result.wait()
+
+
+def _stack_items(stack, stack_index=()):
+    """
+    Generate the index within the outermost stack and the sub-array of each
+    of the items of a, possibly nested, :class:`biggus.ArrayStack`.
+
+    """
+    for index in np.ndindex(stack._stack.shape):
+        item = stack._stack[index]
+        if isinstance(item, biggus.ArrayStack):
+            for item_index_item in _stack_items(item, stack_index + index):
+                yield item_index_item
+        else:
+            yield stack_index + index, item
+
+
+def _realise_item(item, index, data, mask=None):
+    """
+    Realise the sub-array into the given index of the data array and, if
+    given, of the mask array.
+
+    """
+    if mask is None:
+        data[index] = item.ndarray()
+    else:
+        result = item.masked_array()
+        data[index] = ma.getdata(result)
+        mask[index] = ma.getmaskarray(result)
+
+
+class RollingWindowProxy(object):
+    """
+    A data proxy for the rolling window aggregation of a lazy array.
+
+    Each read only realises the part of the lazy array which is spanned by
+    the requested windows, so e.g. a lazy aggregation or save of the result
+    streams through the lazy array along its other dimensions.
+
+    """
+    def __init__(self, array, axis, window, func, dtype):
+        """
+        Args:
+
+        * array (:class:`biggus.Array`):
+            The lazy array to aggregate.
+        * axis (int):
+            The axis of the windows.
+        * window (int):
+            The length of the windows.
+        * func (callable):
+            | *Call signature*: (data)
+
+            Returns the aggregation of each window along the axis of the
+            realised data.
+        * dtype (:class:`numpy.dtype`):
+            The data type of the aggregation.
+
+        """
+        self.array = array
+        self.axis = axis
+        self.window = window
+        self.func = func
+        self.dtype = np.dtype(dtype)
+        shape = list(array.shape)
+        shape[axis] -= window - 1
+        self.shape = tuple(shape)
+        self.fill_value = ma.default_fill_value(self.dtype)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __getitem__(self, keys):
+        if not isinstance(keys, tuple):
+            keys = (keys,)
+        keys = keys + (slice(None),) * (self.ndim - len(keys))
+
+        # Read the run of the array which is spanned by the windows,
+        # keeping any dimensions which are indexed by an integer.
+        windows = np.atleast_1d(np.arange(self.shape[self.axis])[
+            keys[self.axis]])
+        start = windows.min() if windows.size else 0
+        stop = windows.max() + self.window if windows.size else self.window
+        array_keys = []
+        drop_keys = []
+        for dim, key in enumerate(keys):
+            drop_key = slice(None)
+            if dim == self.axis:
+                key = slice(start, stop)
+            elif isinstance(key, numbers.Integral):
+                key = slice(key, key + 1 or None)
+                drop_key = 0
+            array_keys.append(key)
+            drop_keys.append(drop_key)
+        data = self.array[tuple(array_keys)].masked_array()
+        if ma.count_masked(data) == 0:
+            data = data.data
+
+        result = self.func(data).take(windows - start, axis=self.axis)
+        if isinstance(keys[self.axis], numbers.Integral):
+            drop_keys[self.axis] = 0
+        result = result[tuple(drop_keys)]
+        if result.dtype != self.dtype:
+            result = result.astype(self.dtype)
+        return result
+
+    def __repr__(self):
+        fmt = '<{self.__class__.__name__} shape={self.shape}' \
+              ' dtype={self.dtype!r} window={self.window}' \
+              ' axis={self.axis}>'
+        return fmt.format(self=self)
+
+
+#: The maximum number of values of its lazy array which a
+#: :class:`SlabProxy` realises at once.
+_SLAB_SIZE = 8 * 1024 * 1024
+
+
+class SlabProxy(object):
+    """
+    A data proxy for an operation which is applied independently to each
+    slab of a lazy array, e.g. regridding each horizontal slice.
+
+    A slab spans the whole of the operated dimensions of the lazy array,
+    and each read only realises the slabs which it needs, a few at a time,
+    so e.g. a save of the result streams through the lazy array along its
+    other dimensions.
+
+    """
+    def __init__(self, array, dims, shape, func, dtype=None):
+        """
+        Args:
+
+        * array (:class:`biggus.Array`):
+            The lazy array to operate on.
+        * dims (iterable of int):
+            The dimensions of the array which the operation spans.
+        * shape (iterable of int):
+            The shape of the result of the operation, which differs from
+            that of the array only in the operated dimensions.
+        * func (callable):
+            | *Call signature*: (data)
+
+            Returns the result of the operation on the realised data, which
+            retains all of the dimensions of the array.
+
+        Kwargs:
+
+        * dtype (:class:`numpy.dtype`):
+            The data type of the result. If None, this is found by applying
+            the operation to a single slab of zeros, so that any error which
+            the operation raises regardless of the data is raised here.
+
+        """
+        self.array = array
+        self.dims = tuple(dims)
+        self.shape = tuple(shape)
+        self.func = func
+        if dtype is None:
+            zeros_shape = [size if dim in self.dims else 1
+                           for dim, size in enumerate(array.shape)]
+            dtype = func(np.zeros(zeros_shape, dtype=array.dtype)).dtype
+        self.dtype = np.dtype(dtype)
+        self.fill_value = ma.default_fill_value(self.dtype)
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __getitem__(self, keys):
+        if not isinstance(keys, tuple):
+            keys = (keys,)
+        keys = keys + (slice(None),) * (self.ndim - len(keys))
+
+        # Read whole slabs at the indices given by the keys of the other
+        # dimensions, keeping any dimensions which are indexed by an
+        # integer, and apply the keys of the operated dimensions to the
+        # result of the operation instead.
+        indices = {}
+        result_keys = []
+        for dim, key in enumerate(keys):
+            result_key = slice(None)
+            if dim in self.dims:
+                result_key = key
+            else:
+                if isinstance(key, numbers.Integral):
+                    result_key = 0
+                elif isinstance(key, tuple):
+                    key = list(key)
+                indices[dim] = np.atleast_1d(np.arange(self.shape[dim])[key])
+            result_keys.append(result_key)
+        result = self._realise(indices)
+
+        # Apply the keys one dimension at a time, as they are orthogonal.
+        for dim in reversed(range(self.ndim)):
+            key = result_keys[dim]
+            if not (isinstance(key, slice) and key == slice(None)):
+                result = result[(slice(None),) * dim + (key,)]
+        return result
+
+    def _realise(self, indices):
+        # Combine as many of the trailing other dimensions into each read
+        # as will fit within _SLAB_SIZE values, and iterate over the rest.
+        iter_dims = sorted(indices)
+        size = np.prod([self.array.shape[dim] for dim in self.dims])
+        while iter_dims and size * indices[iter_dims[-1]].size <= _SLAB_SIZE:
+            size *= indices[iter_dims.pop()].size
+
+        shape = [indices[dim].size if dim in indices else length
+                 for dim, length in enumerate(self.shape)]
+        result = ma.masked_array(np.empty(shape, dtype=self.dtype),
+                                 mask=np.zeros(shape, dtype=bool))
+        # Index the lazy array just once for each read, as e.g. a
+        # biggus.NumpyArrayAdapter reads all of its data for some
+        # combinations of keys.
+        array_keys = [slice(None)] * self.ndim
+        for dim, dim_indices in indices.items():
+            array_keys[dim] = _indices_key(dim_indices)
+        for index in np.ndindex(*[indices[dim].size for dim in iter_dims]):
+            result_keys = [slice(None)] * self.ndim
+            for dim, i in zip(iter_dims, index):
+                array_keys[dim] = _indices_key(indices[dim][i:i + 1])
+                result_keys[dim] = slice(i, i + 1)
+            data = self.array[tuple(array_keys)].masked_array()
+            if ma.count_masked(data) == 0:
+                data = data.data
+            result[tuple(result_keys)] = self.func(data)
+        if not result.mask.any():
+            result = result.data
+        return result
+
+    def __repr__(self):
+        fmt = '<{self.__class__.__name__} shape={self.shape}' \
+              ' dtype={self.dtype!r} dims={self.dims}>'
+        return fmt.format(self=self)
+
+
+def _indices_key(indices):
+    """
+    Return a key which selects the given indices of a dimension, as a slice
+    if they are contiguous and increasing.
+
+    """
+    if indices.size and np.all(np.diff(indices) == 1):
+        indices = slice(indices[0], indices[-1] + 1)
+    return indices
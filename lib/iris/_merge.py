@@ -28,11 +28,14 @@ import six
 
 from collections import namedtuple, OrderedDict
 from copy import deepcopy
+import numbers
 
 import biggus
 import numpy as np
 import numpy.ma as ma
 
+from iris._lazy_data import BatchedArrayStack
+import iris.config
 import iris.cube
 import iris.coords
 import iris.exceptions
@@ -452,6 +455,35 @@ class _FactoryDefn(namedtuple('_FactoryDefn',
     __slots__ = ()
 
 
+class _SourceCube(namedtuple('SourceCube',
+                             ['cube', 'cube_signature', 'coord_payload',
+                              'key'])):
+    """
+    A candidate source-cube, together with everything that is needed to
+    register it with a :class:`ProtoCube`.
+
+    Args:
+
+    * cube:
+        The :class:`iris.cube.Cube`.
+
+    * cube_signature:
+        The :class:`_CubeSignature` of the cube.
+
+    * coord_payload:
+        The :class:`_CoordPayload` of the cube.
+
+    * key:
+        A hashable summary of the cube and coordinate signatures. Cubes
+        with matching signatures always have equal keys, so this may be used
+        to find the only :class:`ProtoCube` instances that a source-cube
+        could be registered with.
+
+    """
+
+    __slots__ = ()
+
+
 class _Relation(namedtuple('Relation',
                            ['separable', 'inseparable'])):
     """
@@ -472,6 +504,64 @@ class _Relation(namedtuple('Relation',
     __slots__ = ()
 
 
+# Placeholder for values that do not contribute to a merge key.
+_UNKEYED = object()
+
+
+def _attribute_key(value):
+    """
+    Return a hashable representative of an attribute value, which is
+    equal for any two values that compare equal.
+
+    """
+    if isinstance(value, six.string_types + (numbers.Number, np.generic)):
+        key = value
+    else:
+        # Values that compare equal to their own string, such as a STASH
+        # code, are represented by that string. Anything else is left out of
+        # the key.
+        key = _UNKEYED
+        if not isinstance(value, np.ndarray):
+            string = str(value)
+            try:
+                if bool(value == string):
+                    key = string
+            except (TypeError, ValueError):
+                pass
+    return key
+
+
+def _merge_key(cube_signature, coord_payload):
+    """
+    Return a hashable key that summarises the given signatures.
+
+    Only names, dimensions, types and hashable attribute values contribute
+    to the key, such that signatures that match always have equal keys. The
+    converse does not hold, so cubes with equal keys must still be matched
+    in full.
+
+    """
+    defn = cube_signature.defn
+    attributes = tuple((name, _attribute_key(defn.attributes[name]))
+                       for name in sorted(defn.attributes))
+    cell_methods = tuple(cell_method.method
+                         for cell_method in defn.cell_methods)
+    cell_measures = tuple((cell_measure.name(), tuple(dims))
+                          for cell_measure, dims in
+                          cube_signature.cell_measures_and_dims)
+    scalars = tuple(defn.name() for defn in coord_payload.scalar.defns)
+    vector_dims = tuple((coord.name(), dims) for coord, dims in
+                        coord_payload.vector.dim_coords_and_dims)
+    vector_auxs = tuple((coord.name(), dims) for coord, dims in
+                        coord_payload.vector.aux_coords_and_dims)
+    factories = tuple((factory_defn.class_,
+                       tuple(key for key, _ in factory_defn.dependency_defns))
+                      for factory_defn in coord_payload.factory_defns)
+    return (defn.standard_name, defn.long_name, defn.var_name, attributes,
+            cell_methods, cube_signature.data_shape, cube_signature.data_type,
+            cell_measures, scalars, vector_dims, vector_auxs, factories)
+
+
 _COMBINATION_JOIN = '-'
 
 
@@ -756,6 +846,10 @@ def _is_dependent(dependent, independent, positions, function_mapping=None):
         Boolean.
 
     """
+    if isinstance(positions, _CodedPositions):
+        return positions.is_dependent(dependent, independent,
+                                      function_mapping)
+
     valid = True
     relation = {}
 
@@ -997,6 +1091,12 @@ def _build_combination_group(space, group, positions, function_matrix):
     for name in group:
         function_matrix[name] = {}
 
+    if isinstance(positions, _CodedPositions):
+        # Only the first position with each cell is needed.
+        positions = positions.unique_positions(
+            [int(member) if member.isdigit() else member
+             for member in members])
+
     for position in positions:
         # Note, the cell double-tuple! This ensures that the cell value for
         # each member of the group is kept bound together as one key.
@@ -1068,6 +1168,126 @@ def derive_space(groups, relation_matrix, positions, function_matrix=None):
     return space
 
 
+class _CodedPositions(object):
+    """
+    The positions of the source-cubes, with the scalar values of each
+    candidate dimension encoded as integer category codes.
+
+    This supports a vectorised alternative to :func:`build_indexes` and
+    :func:`derive_relation_matrix`, and may be passed as the positions to
+    :func:`derive_space`.
+
+    """
+    def __init__(self, positions):
+        """
+        Args:
+
+        * positions:
+            A list containing a dictionary of candidate dimension key to
+            scalar value pairs for each source-cube.
+
+        """
+        self.positions = positions
+        self.names = list(positions[0].keys())
+        self._column_by_name = {name: column
+                                for column, name in enumerate(self.names)}
+        #: The codes of the scalar values of each source-cube, with one
+        #: column for each candidate dimension.
+        self.codes = np.empty((len(positions), len(self.names)),
+                              dtype=np.int64)
+        #: The mapping of scalar value to code for each candidate dimension.
+        #: This can stand in for the cross-reference dictionary of
+        #: :func:`build_indexes`, when only its scalar values are required.
+        self.indexes = {}
+        for column, name in enumerate(self.names):
+            values = [position[name] for position in positions]
+            code_by_value = {value: code
+                             for code, value in enumerate(set(values))}
+            self.codes[:, column] = [code_by_value[value]
+                                     for value in values]
+            self.indexes[name] = code_by_value
+
+    def _combination_codes(self, names):
+        """
+        Return the codes of the combinations of the scalar values of the
+        given candidate dimensions, and the number of distinct combinations.
+
+        """
+        codes = np.zeros(len(self.positions), dtype=np.int64)
+        count = 1
+        for name in names:
+            codes = codes * len(self.indexes[name]) + \
+                self.codes[:, self._column_by_name[name]]
+            # Re-number the combinations, to keep the codes small.
+            unique, codes = np.unique(codes, return_inverse=True)
+            count = len(unique)
+        return codes, count
+
+    def separable(self, name1, name2):
+        """
+        Determine whether two candidate dimensions are separable.
+
+        Each scalar value of the first maps to the same set of scalar
+        values of the second if, and only if, every combination of their
+        values occurs. So the relationship is symmetric.
+
+        """
+        _, count = self._combination_codes([name1, name2])
+        return count == len(self.indexes[name1]) * len(self.indexes[name2])
+
+    def relation_matrix(self):
+        """
+        Return the relation dictionary for each candidate dimension, as
+        from :func:`derive_relation_matrix`.
+
+        """
+        relation_matrix = {name: _Relation(set(), set())
+                           for name in self.names}
+        for i, name1 in enumerate(self.names):
+            for name2 in self.names[i + 1:]:
+                if self.separable(name1, name2):
+                    relation_matrix[name1].separable.add(name2)
+                    relation_matrix[name2].separable.add(name1)
+                else:
+                    relation_matrix[name1].inseparable.add(name2)
+                    relation_matrix[name2].inseparable.add(name1)
+        return relation_matrix
+
+    def is_dependent(self, dependent, independent, function_mapping=None):
+        """
+        Determine whether the dependent candidate dimension is a function
+        of the independent candidate dimension/s, as :func:`_is_dependent`.
+
+        It is, if and only if adding the dependent values to the
+        independent values creates no new distinct combinations.
+        The function mapping is only populated when it is valid.
+
+        """
+        independent = list(independent)
+        codes, count = self._combination_codes(independent)
+        _, dependent_count = self._combination_codes(independent +
+                                                     [dependent])
+        valid = count == dependent_count
+        if valid and isinstance(function_mapping, dict):
+            for position in self._first_positions(codes):
+                item = tuple([position[name] for name in independent])
+                function_mapping[item] = position[dependent]
+        return valid
+
+    def _first_positions(self, codes):
+        _, first = np.unique(codes, return_index=True)
+        return [self.positions[i] for i in sorted(first)]
+
+    def unique_positions(self, names):
+        """
+        Return the first position for each distinct combination of the
+        scalar values of the given candidate dimensions.
+
+        """
+        codes, _ = self._combination_codes(names)
+        return self._first_positions(codes)
+
+
 class ProtoCube(object):
     """
     Framework for merging source-cubes into one or more higher
@@ -1075,23 +1295,31 @@ class ProtoCube(object):
 
     """
 
+    # Default hint ordering for candidate dimension coordinates.
+    _hints = ['time', 'forecast_reference_time', 'forecast_period',
+              'model_level_number']
+
     def __init__(self, cube):
         """
         Create a new ProtoCube from the given cube and record the cube
         as a source-cube.
 
-        """
+        Args:
 
-        # Default hint ordering for candidate dimension coordinates.
-        self._hints = ['time', 'forecast_reference_time', 'forecast_period',
-                       'model_level_number']
+        * cube:
+            The :class:`iris.cube.Cube`, or its :class:`_SourceCube` as
+            returned by :meth:`source`.
+
+        """
+        if not isinstance(cube, _SourceCube):
+            cube = self.source(cube)
+        cube, cube_signature, coord_payload, key = cube
 
         # The cube signature is metadata that defines this ProtoCube.
-        self._cube_signature = self._build_signature(cube)
+        self._cube_signature = cube_signature
 
-        # Extract the scalar and vector coordinate data and metadata
-        # from the cube.
-        coord_payload = self._extract_coord_payload(cube)
+        # The hashable summary of the cube and coordinate signatures.
+        self.key = key
 
         # The coordinate signature defines the scalar and vector
         # coordinates of this ProtoCube.
@@ -1161,12 +1389,22 @@ class ProtoCube(object):
         """
         positions = [{i: v for i, v in enumerate(skeleton.scalar_values)}
                      for skeleton in self._skeletons]
-        indexes = build_indexes(positions)
-        relation_matrix = derive_relation_matrix(indexes)
+        engine = iris.config.MERGE_ENGINE
+        if engine == 'vectorised':
+            space_positions = _CodedPositions(positions)
+            indexes = space_positions.indexes
+            relation_matrix = space_positions.relation_matrix()
+        elif engine == 'legacy':
+            space_positions = positions
+            indexes = build_indexes(positions)
+            relation_matrix = derive_relation_matrix(indexes)
+        else:
+            msg = 'Unknown merge engine {!r}: expected {!r} or {!r}.'
+            raise ValueError(msg.format(engine, 'vectorised', 'legacy'))
         groups = derive_groups(relation_matrix)
 
         function_matrix = {}
-        space = derive_space(groups, relation_matrix, positions,
+        space = derive_space(groups, relation_matrix, space_positions,
                              function_matrix=function_matrix)
         self._define_space(space, positions, indexes, function_matrix)
         self._build_coordinates()
@@ -1212,7 +1450,7 @@ class ProtoCube(object):
                     data = biggus.NumpyArrayAdapter(data)
                 stack[nd_index] = data
 
-            merged_data = biggus.ArrayStack(stack)
+            merged_data = BatchedArrayStack(stack)
             if all_have_data:
                 merged_data = merged_data.masked_array()
                 # Unmask the array only if it is filled.
@@ -1237,7 +1475,8 @@ class ProtoCube(object):
 
         * cube:
             Candidate :class:`iris.cube.Cube` to be associated with
-            this :class:`ProtoCube`.
+            this :class:`ProtoCube`, or its :class:`_SourceCube` as
+            returned by :meth:`source`.
 
         Kwargs:
 
@@ -1250,10 +1489,11 @@ class ProtoCube(object):
             this :class:`ProtoCube`.
 
         """
-        match = self._cube_signature.match(self._build_signature(cube),
-                                           error_on_mismatch)
+        if not isinstance(cube, _SourceCube):
+            cube = self.source(cube)
+        cube, cube_signature, coord_payload, _ = cube
+        match = self._cube_signature.match(cube_signature, error_on_mismatch)
         if match:
-            coord_payload = self._extract_coord_payload(cube)
             match = coord_payload.match_signature(self._coord_signature,
                                                   error_on_mismatch)
         if match:
@@ -1261,6 +1501,26 @@ class ProtoCube(object):
             self._add_cube(cube, coord_payload)
         return match
 
+    @classmethod
+    def source(cls, cube):
+        """
+        Return the :class:`_SourceCube` of the given cube.
+
+        This derives the signatures of the cube, and their hashable key, just
+        once, so that a matching :class:`ProtoCube` can be found by key and
+        the cube then registered with it, without repeating the work.
+
+        Args:
+
+        * cube:
+            The :class:`iris.cube.Cube`.
+
+        """
+        cube_signature = cls._build_signature(cube)
+        coord_payload = cls._extract_coord_payload(cube)
+        key = _merge_key(cube_signature, coord_payload)
+        return _SourceCube(cube, cube_signature, coord_payload, key)
+
     def _guess_axis(self, name):
         """
         Returns a "best guess" axis name of the candidate dimension.
@@ -1571,7 +1831,8 @@ class ProtoCube(object):
                               self._vector_aux_coords_dims):
             aux_coords_and_dims.append(_CoordAndDims(item.coord, dims))
 
-    def _build_signature(self, cube):
+    @staticmethod
+    def _build_signature(cube):
         """Generate the signature that defines this cube."""
         array = cube.lazy_data()
         return _CubeSignature(cube.metadata, cube.shape, array.dtype,
@@ -1590,7 +1851,8 @@ class ProtoCube(object):
                 self._coord_metadata[i] = metadata
         self._skeletons.append(skeleton)
 
-    def _extract_coord_payload(self, cube):
+    @classmethod
+    def _extract_coord_payload(cls, cube):
         """
         Extract all relevant coordinate data and metadata from the cube.
 
@@ -1617,8 +1879,8 @@ class ProtoCube(object):
 
         # Coordinate hint ordering dictionary - from most preferred to least.
         # Copes with duplicate hint entries, where the most preferred is king.
-        hint_dict = {name: i for i, name in zip(range(len(self._hints), 0, -1),
-                                                self._hints[::-1])}
+        hint_dict = {name: i for i, name in zip(range(len(cls._hints), 0, -1),
+                                                cls._hints[::-1])}
         # Coordinate axis ordering dictionary.
         axis_dict = {'T': 0, 'Z': 1, 'Y': 2, 'X': 3}
 
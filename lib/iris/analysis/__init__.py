@@ -51,6 +51,7 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
 import collections
+import functools
 
 import biggus
 import numpy as np
@@ -62,14 +63,16 @@ from iris.analysis._area_weighted import AreaWeightedRegridder
 from iris.analysis._interpolation import (EXTRAPOLATION_MODES,
                                           RectilinearInterpolator)
 from iris.analysis._regrid import RectilinearRegridder
+from iris.analysis._regrid_cache import RegridderCache
 import iris.coords
+from iris._lazy_data import RollingWindowProxy
 from iris.exceptions import LazyAggregatorError
 
 __all__ = ('COUNT', 'GMEAN', 'HMEAN', 'MAX', 'MEAN', 'MEDIAN', 'MIN',
            'PEAK', 'PERCENTILE', 'PROPORTION', 'RMS', 'STD_DEV', 'SUM',
            'VARIANCE', 'WPERCENTILE', 'coord_comparison', 'Aggregator',
            'WeightedAggregator', 'clear_phenomenon_identity', 'Linear',
-           'AreaWeighted', 'Nearest')
+           'AreaWeighted', 'Nearest', 'REGRIDDER_CACHE')
 
 
 class _CoordGroup(object):
@@ -505,6 +508,104 @@ class _Aggregator(object):
 
         return result
 
+    def _aggregate_groups(self, data, axis, groups, **kwargs):
+        """
+        Perform the aggregation function over each of the groups of indices
+        along the axis of the data, in a single pass of segment reductions.
+
+        Returns the aggregated data, with the groups along the axis, or None
+        if the aggregation function has no segment reduction for the given
+        keywords.
+
+        """
+        segment_func = _SEGMENT_FUNCS.get(self.call_func)
+        if segment_func is None:
+            return None
+
+        kwargs = dict(list(self._kwargs.items()) + list(kwargs.items()))
+        mdtol = kwargs.pop('mdtol', None)
+
+        # Label each index along the axis with its group, and gather the
+        # groups into contiguous segments.
+        labels = np.empty(data.shape[axis], dtype=int)
+        for label, group in enumerate(groups):
+            if isinstance(group, tuple):
+                group = list(group)
+            labels[group] = label
+        order = np.argsort(labels, kind='mergesort')
+        if np.any(np.diff(order) != 1):
+            data = data.take(order, axis=axis)
+        starts = np.searchsorted(labels[order], np.arange(len(groups)))
+
+        try:
+            result = segment_func(data, axis, starts, **kwargs)
+        except TypeError:
+            # TypeError - when unexpected keywords passed through.
+            return None
+
+        if ma.isMaskedArray(data):
+            count = _segment_count(data, axis, starts)
+            mask = count == 0
+            if mdtol is not None:
+                sizes = np.diff(np.append(starts, data.shape[axis]))
+                shape = [1] * data.ndim
+                shape[axis] = len(sizes)
+                mask |= 1 - mdtol > count / sizes.reshape(shape)
+            result = ma.masked_array(result, mask=mask)
+        return result
+
+    def _aggregate_windows(self, data, axis, window, **kwargs):
+        """
+        Perform the aggregation function over each run of window values
+        along the axis of the data, in a single pass.
+
+        Returns the aggregated data, with the windows along the axis, or
+        None if the aggregation function has no rolling window form for the
+        given keywords.
+
+        """
+        window_func = _WINDOW_FUNCS.get(self.call_func)
+        if window_func is None or data.size == 0:
+            return None
+
+        kwargs = dict(list(self._kwargs.items()) + list(kwargs.items()))
+        mdtol = kwargs.pop('mdtol', None)
+
+        try:
+            result = window_func(data, axis, window, **kwargs)
+        except TypeError:
+            # TypeError - when unexpected keywords passed through.
+            return None
+
+        # As with the aggregation functions, the result is always masked.
+        mask = ma.nomask
+        if ma.isMaskedArray(data):
+            count = _window_count(data, axis, window)
+            mask = count == 0
+            if mdtol is not None:
+                mask |= 1 - mdtol > count / window
+        return ma.masked_array(result, mask=mask)
+
+    def _lazy_aggregate_windows(self, data, axis, window, **kwargs):
+        """
+        Return a lazy array of the rolling window aggregation of the lazy
+        data, as :meth:`_aggregate_windows`, or None if the aggregation
+        function has no rolling window form for the given keywords.
+
+        """
+        # Aggregate a window of zeros, to check the keywords and to find
+        # the data type of the result.
+        shape = [1] * data.ndim
+        shape[axis] = window
+        sample = self._aggregate_windows(np.zeros(shape, dtype=data.dtype),
+                                         axis, window, **kwargs)
+        if sample is None:
+            return None
+        func = functools.partial(self._aggregate_windows, axis=axis,
+                                 window=window, **kwargs)
+        proxy = RollingWindowProxy(data, axis, window, func, sample.dtype)
+        return biggus.OrthoArrayAdapter(proxy)
+
     def update_metadata(self, cube, coords, **kwargs):
         """
         Update common cube metadata w.r.t the aggregation function.
@@ -1213,6 +1314,169 @@ def _sum(array, **kwargs):
     return rvalue
 
 
+def _sum_dtype(dtype):
+    # The data type of a sum of values of the given type.
+    return np.zeros(1, dtype=dtype).sum().dtype
+
+
+def _mask_invalid_means(data, means):
+    # As with ma.average, mask the means of masked data which are not
+    # finite.
+    if ma.isMaskedArray(data):
+        means = ma.masked_invalid(means)
+    return means
+
+
+def _segment_count(data, axis, starts):
+    # The number of unmasked values in each segment along the axis.
+    return np.add.reduceat(~ma.getmaskarray(data), starts, axis=axis,
+                           dtype=_sum_dtype(bool))
+
+
+def _segment_sum(data, axis, starts):
+    return np.add.reduceat(ma.filled(data, 0), starts, axis=axis,
+                           dtype=_sum_dtype(data.dtype))
+
+
+def _segment_mean(data, axis, starts):
+    # The data type of a mean of the data, which depends on whether the
+    # data is masked.
+    dtype = ma.average(data[(slice(0, 1),) * data.ndim], axis=axis).dtype
+    total = np.add.reduceat(ma.filled(data, 0), starts, axis=axis,
+                            dtype=dtype)
+    count = _segment_count(data, axis, starts)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = (total / np.maximum(count, 1)).astype(dtype)
+    return _mask_invalid_means(data, result)
+
+
+def _segment_max(data, axis, starts):
+    return np.maximum.reduceat(ma.filled(data, ma.maximum_fill_value(data)),
+                               starts, axis=axis)
+
+
+def _segment_min(data, axis, starts):
+    return np.minimum.reduceat(ma.filled(data, ma.minimum_fill_value(data)),
+                               starts, axis=axis)
+
+
+def _segment_count_function(data, axis, starts, function):
+    if not callable(function):
+        raise ValueError('function must be a callable. Got %s.'
+                         % type(function))
+    return np.add.reduceat(ma.filled(function(data), False), starts,
+                           axis=axis, dtype=_sum_dtype(bool))
+
+
+def _axis_keys(ndim, axis, key):
+    # The keys which index the axis of an array with the key.
+    keys = [slice(None)] * ndim
+    keys[axis] = key
+    return tuple(keys)
+
+
+def _window_sums(values, axis, window, dtype=None):
+    # The sum of each run of window values along the axis, by differencing
+    # their cumulative sum.
+    total = np.cumsum(values, axis=axis, dtype=dtype)
+    shape = list(total.shape)
+    shape[axis] = 1
+    total = np.concatenate([np.zeros(shape, dtype=total.dtype), total],
+                           axis=axis)
+    return (total[_axis_keys(total.ndim, axis, slice(window, None))] -
+            total[_axis_keys(total.ndim, axis, slice(None, -window))])
+
+
+def _window_float_sums(values, axis, window, dtype):
+    # As _window_sums, but where a non-finite value only affects the sums
+    # of the windows which contain it.
+    finite = np.isfinite(values)
+    if finite.all():
+        return _window_sums(values, axis, window, dtype)
+    result = _window_sums(np.where(finite, values, 0), axis, window, dtype)
+    posinf = _window_sums(values == np.inf, axis, window) > 0
+    neginf = _window_sums(values == -np.inf, axis, window) > 0
+    nan = _window_sums(np.isnan(values), axis, window) > 0
+    result[posinf] = np.inf
+    result[neginf] = -np.inf
+    result[nan | (posinf & neginf)] = np.nan
+    return result
+
+
+def _window_count(data, axis, window):
+    # The number of unmasked values in each window along the axis.
+    return _window_sums(~ma.getmaskarray(data), axis, window,
+                        dtype=_sum_dtype(bool))
+
+
+def _window_sum(data, axis, window):
+    dtype = _sum_dtype(data.dtype)
+    values = ma.filled(data, 0)
+    if dtype.kind != 'f':
+        return _window_sums(values, axis, window, dtype)
+    # Accumulate in at least double precision, to limit the loss of
+    # precision from differencing the cumulative sum.
+    total_dtype = np.promote_types(dtype, np.float64)
+    return _window_float_sums(values, axis, window,
+                              total_dtype).astype(dtype)
+
+
+def _window_mean(data, axis, window):
+    # The data type of a mean of the data, which depends on whether the
+    # data is masked.
+    dtype = ma.average(data[(slice(0, 1),) * data.ndim], axis=axis).dtype
+    total_dtype = np.promote_types(dtype, np.float64)
+    values = ma.filled(data, 0)
+    if total_dtype.kind == 'f':
+        total = _window_float_sums(values, axis, window, total_dtype)
+    else:
+        total = _window_sums(values, axis, window, total_dtype)
+    count = _window_count(data, axis, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = (total / np.maximum(count, 1)).astype(dtype)
+    return _mask_invalid_means(data, result)
+
+
+def _window_extreme(ufunc, values, axis, window, fill_value):
+    # The extreme of each run of window values along the axis, by the van
+    # Herk/Gil-Werman algorithm: the values are split into blocks of the
+    # window length, and each window is the combination of the extreme of
+    # the end of one block and the extreme of the start of the next.
+    values = np.rollaxis(values, axis, values.ndim)
+    size = values.shape[-1]
+    n_blocks = -(-size // window)
+    shape = values.shape[:-1] + (n_blocks * window,)
+    padded = np.empty(shape, dtype=values.dtype)
+    padded[..., :size] = values
+    padded[..., size:] = fill_value
+    blocks = padded.reshape(values.shape[:-1] + (n_blocks, window))
+    starts = ufunc.accumulate(blocks, axis=-1).reshape(shape)
+    ends = ufunc.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+    ends = ends.reshape(shape)
+    result = ufunc(ends[..., :size - window + 1], starts[..., window - 1:size])
+    return np.rollaxis(result, -1, axis)
+
+
+def _window_max(data, axis, window):
+    fill_value = ma.maximum_fill_value(data)
+    return _window_extreme(np.maximum, ma.filled(data, fill_value), axis,
+                           window, fill_value)
+
+
+def _window_min(data, axis, window):
+    fill_value = ma.minimum_fill_value(data)
+    return _window_extreme(np.minimum, ma.filled(data, fill_value), axis,
+                           window, fill_value)
+
+
+def _window_count_function(data, axis, window, function):
+    if not callable(function):
+        raise ValueError('function must be a callable. Got %s.'
+                         % type(function))
+    return _window_sums(ma.filled(function(data), False), axis, window,
+                        dtype=_sum_dtype(bool))
+
+
 def _peak(array, **kwargs):
     def column_segments(column):
         nan_indices = np.where(np.isnan(column))[0]
@@ -1728,6 +1992,31 @@ Additional kwargs associated with the use of this aggregator:
 """
 
 
+#: The segment reductions of the aggregation functions, as used by
+#: :meth:`_Aggregator._aggregate_groups`. Each is called with the data, the
+#: axis and the start index of each segment of the axis, along with any
+#: keywords.
+_SEGMENT_FUNCS = {
+    _count: _segment_count_function,
+    _sum: _segment_sum,
+    ma.average: _segment_mean,
+    ma.max: _segment_max,
+    ma.min: _segment_min,
+}
+
+
+#: The rolling window forms of the aggregation functions, as used by
+#: :meth:`_Aggregator._aggregate_windows`. Each is called with the data, the
+#: axis and the window length, along with any keywords.
+_WINDOW_FUNCS = {
+    _count: _window_count_function,
+    _sum: _window_sum,
+    ma.average: _window_mean,
+    ma.max: _window_max,
+    ma.min: _window_min,
+}
+
+
 class _Groupby(object):
     """
     Convenience class to determine group slices over one or more group-by
@@ -2327,6 +2616,18 @@ class Nearest(object):
         return RectilinearRegridder(src_grid, target_grid, 'nearest',
                                     self.extrapolation_mode)
 
+
+#: The cache of the regridders used by :meth:`iris.cube.Cube.regrid`, so
+#: that regridding many cubes between the same grids does not repeat the
+#: calculation of the regridding weights. Its ``hits`` and ``misses``
+#: attributes count the regridders reused and created, and its ``clear``
+#: method discards all of the cached regridders. The number of regridders
+#: kept defaults to :data:`iris.config.REGRIDDER_CACHE_SIZE`, but can be
+#: changed at any time, e.g.::
+#:
+#:     iris.analysis.REGRIDDER_CACHE.maxsize = 64
+REGRIDDER_CACHE = RegridderCache((Linear, AreaWeighted, Nearest))
+
 # Import "iris.analysis.interpolate" to replicate older automatic imports.
 # NOTE: do this at end, as otherwise its import of 'Linear' will fail.
 from . import _interpolate_backdoor as interpolate
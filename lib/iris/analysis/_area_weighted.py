@@ -68,6 +68,12 @@ class AreaWeightedRegridder(object):
         # current usage of the experimental regrid function.
         self._target_grid_cube_cache = None
 
+        # Calculate the area weights once, so that they can be re-used
+        # for every cube regridded.
+        self._regrid_info = \
+            eregrid._regrid_area_weighted_rectilinear_src_and_grid__prepare(
+                src_grid_cube, self._target_grid_cube)
+
     @property
     def _target_grid_cube(self):
         if self._target_grid_cube_cache is None:
@@ -98,9 +104,14 @@ class AreaWeightedRegridder(object):
             this cube will be converted to values on the new grid using
             area-weighted regridding.
 
+        .. note::
+
+            If the given cube has lazy data, the result also has lazy data,
+            which is regridded one slab at a time when it is realised.
+
         """
         if get_xy_dim_coords(cube) != self._src_grid:
             raise ValueError('The given cube is not defined on the same '
                              'source grid as this regridder.')
-        return eregrid.regrid_area_weighted_rectilinear_src_and_grid(
-            cube, self._target_grid_cube, mdtol=self._mdtol)
+        return eregrid._regrid_area_weighted_rectilinear_src_and_grid__perform(
+            cube, self._regrid_info, mdtol=self._mdtol)
@@ -42,6 +42,7 @@ import iris.coord_systems
 import iris.coords
 from iris._deprecation import warn_deprecated
 import iris.exceptions
+import iris.util
 
 
 def _ll_to_cart(lon, lat):
@@ -76,22 +77,11 @@ def _cartesian_sample_points(sample_points, sample_point_coord_names):
     if i_lat is None or i_lon is None:
         return sample_points.transpose()
 
-    num_points = len(sample_points[0])
-    cartesian_points = [None] * num_points
-
-    # Get the point coordinates without the latlon
-    for p in range(num_points):
-        cartesian_points[p] = [sample_points[c][p] for c in i_non_latlon]
-
-    # Add cartesian xyz coordinates from latlon
+    # Get the point coordinates without the latlon, and add cartesian xyz
+    # coordinates from latlon
     x, y, z = _ll_to_cart(sample_points[i_lon], sample_points[i_lat])
-    for p in range(num_points):
-        cartesian_point = cartesian_points[p]
-        cartesian_point.append(x[p])
-        cartesian_point.append(y[p])
-        cartesian_point.append(z[p])
-
-    return cartesian_points
+    columns = [sample_points[c] for c in i_non_latlon] + [x, y, z]
+    return np.column_stack(columns)
 
 
 def nearest_neighbour_indices(cube, sample_points):
@@ -200,6 +190,10 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_point, cache=None):
     This function is adapted for points sampling a multi-dimensional coord,
     and can currently only do nearest neighbour interpolation.
 
+    The sample point values may also be 1-dimensional arrays of equal length,
+    defining a sequence of points, e.g. along a trajectory. In that case the
+    indices for each sampled dimension are arrays of the same length.
+
     Because this function can be slow for multidimensional coordinates,
     a 'cache' dictionary can be provided by the calling code.
 
@@ -236,7 +230,9 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_point, cache=None):
         point.append((coord, value))
 
     # Reformat sample_point for use in _cartesian_sample_points(), below.
-    sample_point = np.array([[value] for coord, value in point])
+    values = [np.asarray(value) for coord, value in point]
+    scalar_point = all(value.ndim == 0 for value in values)
+    sample_point = np.array([np.atleast_1d(value) for value in values])
     sample_point_coords = [coord for coord, value in point]
     sample_point_coord_names = [coord.name() for coord, value in point]
 
@@ -268,22 +264,26 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_point, cache=None):
     # Convert the sample point to cartesian coords.
     # If there is no latlon within the coordinate there will be no change.
     # Otherwise, geographic latlon is replaced with cartesian xyz.
-    cartesian_sample_point = _cartesian_sample_points(sample_point, sample_point_coord_names)[0]
+    cartesian_sample_point = _cartesian_sample_points(sample_point, sample_point_coord_names)
+    if scalar_point:
+        cartesian_sample_point = cartesian_sample_point[0]
 
     sample_space_coords = sample_space_cube.dim_coords + sample_space_cube.aux_coords
     sample_space_coords_and_dims = [(coord, sample_space_cube.coord_dims(coord)) for coord in sample_space_coords]
 
+    sample_space_shape = sample_space_cube.shape
     if cache is not None and cube in cache:
         kdtree = cache[cube]
     else:
         # Create a "sample space position" for each datum: sample_space_data_positions[coord_index][datum_index]
-        sample_space_data_positions = np.empty((len(sample_space_coords_and_dims), sample_space_cube.data.size), dtype=float)
-        for d, ndi in enumerate(np.ndindex(sample_space_cube.data.shape)):
-            for c, (coord, coord_dims) in enumerate(sample_space_coords_and_dims):
-                # Index of this datum along this coordinate (could be nD).
-                keys = tuple(ndi[ind] for ind in coord_dims) if coord_dims else slice(None, None)
-                # Position of this datum along this coordinate.
-                sample_space_data_positions[c][d] = coord.points[keys]
+        sample_space_data_positions = np.empty((len(sample_space_coords_and_dims), int(np.prod(sample_space_shape))), dtype=float)
+        for c, (coord, coord_dims) in enumerate(sample_space_coords_and_dims):
+            # Position of each datum along this coordinate (could be nD).
+            if coord_dims:
+                positions = iris.util.broadcast_to_shape(coord.points, sample_space_shape, coord_dims)
+            else:
+                positions = coord.points
+            sample_space_data_positions[c] = np.ravel(positions)
 
         # Convert to cartesian coordinates. Flatten for kdtree compatibility.
         cartesian_space_data_coords = _cartesian_sample_points(sample_space_data_positions, sample_point_coord_names)
@@ -292,7 +292,7 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_point, cache=None):
         kdtree = scipy.spatial.cKDTree(cartesian_space_data_coords)
 
     cartesian_distance, datum_index = kdtree.query(cartesian_sample_point)
-    sample_space_ndi = np.unravel_index(datum_index, sample_space_cube.data.shape)
+    sample_space_ndi = np.unravel_index(datum_index, sample_space_shape)
 
     # Turn sample_space_ndi into a main cube slice.
     # Map sample cube to main cube dims and leave the rest as a full slice.
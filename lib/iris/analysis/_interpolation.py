@@ -20,13 +20,16 @@ from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 
 from collections import namedtuple
+import functools
 from itertools import product
 import operator
 
+import biggus
 from numpy.lib.stride_tricks import as_strided
 import numpy as np
 import numpy.ma as ma
 
+from iris._lazy_data import SlabProxy
 from iris.analysis._scipy_interpolate import _RegularGridInterpolator
 from iris.analysis.cartography import wrap_lons as wrap_circular_points
 from iris.coords import DimCoord, AuxCoord
@@ -192,13 +195,10 @@ class RectilinearInterpolator(object):
                 set to NaN.
 
         """
-        # Trigger any deferred loading of the source cube's data and snapshot
-        # its state to ensure that the interpolator is impervious to external
-        # changes to the original source cube. The data is loaded to prevent
-        # the snaphot having lazy data, avoiding the potential for the
-        # same data to be loaded again and again.
-        if src_cube.has_lazy_data():
-            src_cube.data
+        # Snapshot the state of the source cube to ensure that the
+        # interpolator is impervious to external changes to the original
+        # source cube. Any lazy data is left lazy, and is interpolated one
+        # slab at a time when the result of each interpolation is realised.
         self._src_cube = src_cube.copy()
         # Coordinates defining the dimensions to be interpolated.
         self._src_coords = [self._src_cube.coord(coord) for coord in coords]
@@ -455,7 +455,7 @@ class RectilinearInterpolator(object):
             result = np.result_type(_DEFAULT_DTYPE, dtype)
         return result
 
-    def _points(self, sample_points, data, data_dims=None):
+    def _points(self, sample_points, data, data_dims=None, pointwise=False):
         """
         Interpolate the given data values at the specified list of orthogonal
         (coord, points) pairs.
@@ -478,6 +478,13 @@ class RectilinearInterpolator(object):
             cube passed through to this interpolator's constructor. If None,
             the data dimensions must map one-to-one onto the increasing
             dimension order of the cube.
+        * pointwise:
+            If True, the sample points for each coordinate must all be the
+            same length, and are taken together to define a sequence of
+            points, e.g. along a trajectory, rather than the orthogonal
+            grid of their cross-product. The interpolated dimensions of the
+            data are then replaced by a single, last, dimension of the
+            points. Defaults to False.
 
         Returns:
             An :class:`~numpy.ndarray` or :class:`~numpy.ma.MaskedArray`
@@ -528,12 +535,25 @@ class RectilinearInterpolator(object):
             interp_points.append(points)
             interp_shape.append(points.size)
 
+        if pointwise:
+            if len(set(interp_shape)) > 1:
+                msg = 'Expected the same number of sample points for ' \
+                    'each coordinate, got {}.'
+                raise ValueError(msg.format(interp_shape))
+            interp_shape = interp_shape[:1]
+
         interp_shape.extend(length for dim, length in enumerate(data.shape) if
                             dim not in di)
 
-        # Convert the interpolation points into a cross-product array
-        # with shape (n_cross_points, n_dims)
-        interp_points = np.asarray([pts for pts in product(*interp_points)])
+        if pointwise:
+            # Combine the interpolation points into an array with shape
+            # (n_points, n_dims)
+            interp_points = np.column_stack(interp_points)
+        else:
+            # Convert the interpolation points into a cross-product array
+            # with shape (n_cross_points, n_dims)
+            interp_points = np.asarray([pts for pts in
+                                        product(*interp_points)])
 
         # Adjust for circularity.
         interp_points, data = self._account_for_circular(interp_points, data)
@@ -546,7 +566,11 @@ class RectilinearInterpolator(object):
         result = self._interpolate(data, interp_points)
         result = result.reshape(interp_shape)
 
-        if src_order != dims:
+        if pointwise:
+            # The remaining dimensions are already in their original
+            # order, so just move the points to the last dimension.
+            result = np.rollaxis(result, 0, result.ndim)
+        elif src_order != dims:
             # Restore the interpolated result to the original
             # source cube dimensional order.
             result = np.transpose(result, src_order)
@@ -575,6 +599,12 @@ class RectilinearInterpolator(object):
             of the cube will be the number of original cube dimensions minus
             the number of scalar coordinates, if collapse_scalar is True.
 
+        .. note::
+
+            If the source cube has lazy data, the result also has lazy data,
+            which is interpolated one slab at a time when it is realised,
+            except when the extrapolation mode is 'nanmask'.
+
         """
         if len(sample_points) != len(self._src_coords):
             msg = 'Expected sample points for {} coordinates, got {}.'
@@ -584,9 +614,21 @@ class RectilinearInterpolator(object):
         sample_points = _canonical_sample_points(self._src_coords,
                                                  sample_points)
 
-        data = self._src_cube.data
         # Interpolate the cube payload.
-        interpolated_data = self._points(sample_points, data)
+        # NB. The result of the 'nanmask' extrapolation mode depends on
+        # whether the source data is masked as a whole, so cannot be
+        # computed one slab at a time.
+        if self._src_cube.has_lazy_data() and self._mode != 'nanmask':
+            shape = list(self._src_cube.shape)
+            for dim, points in zip(self._interp_dims, sample_points):
+                shape[dim] = np.array(points, ndmin=1).size
+            interpolate = functools.partial(self._points, sample_points)
+            interpolated_data = biggus.OrthoArrayAdapter(
+                SlabProxy(self._src_cube.lazy_data(), self._interp_dims,
+                          shape, interpolate))
+        else:
+            interpolated_data = self._points(sample_points,
+                                             self._src_cube.data)
 
         if collapse_scalar:
             # When collapse_scalar is True, keep track of the dimensions for
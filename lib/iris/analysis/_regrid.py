@@ -23,9 +23,11 @@ import copy
 import functools
 import warnings
 
+import biggus
 import numpy as np
 import numpy.ma as ma
 
+from iris._lazy_data import SlabProxy
 from iris.analysis._interpolation import (EXTRAPOLATION_MODES,
                                           extend_circular_coord_and_data,
                                           get_xy_dim_coords, snapshot_grid)
@@ -33,6 +35,10 @@ from iris.analysis._scipy_interpolate import _RegularGridInterpolator
 import iris.cube
 
 
+#: The number of source values to interpolate in each batch of 2d slices.
+_REGRID_BATCH_SIZE = 2 ** 16
+
+
 class RectilinearRegridder(object):
     """
     This class provides support for performing nearest-neighbour or
@@ -91,6 +97,10 @@ class RectilinearRegridder(object):
             msg = 'Invalid extrapolation mode {!r}'
             raise ValueError(msg.format(extrapolation_mode))
         self._extrapolation_mode = extrapolation_mode
+        # The sample grid and interpolation weights, which depend only on
+        # the source and target grids and so are calculated at most once.
+        self._sample_grid_cache = None
+        self._weights_cache = {}
 
     @property
     def method(self):
@@ -141,7 +151,8 @@ class RectilinearRegridder(object):
     def _regrid(src_data, x_dim, y_dim,
                 src_x_coord, src_y_coord,
                 sample_grid_x, sample_grid_y,
-                method='linear', extrapolation_mode='nanmask'):
+                method='linear', extrapolation_mode='nanmask',
+                weights_cache=None):
         """
         Regrid the given data from the src grid to the sample grid.
 
@@ -193,6 +204,13 @@ class RectilinearRegridder(object):
 
             The default mode of extrapolation is 'nanmask'.
 
+        * weights_cache:
+            A dictionary in which to keep the interpolation weights, so that
+            they can be re-used by later calls with the same source
+            coordinates, sample grid, method and extrapolation mode.
+            Defaults to None, in which case the weights are always
+            calculated afresh.
+
         Returns:
             The regridded data as an N-dimensional NumPy array. The lengths
             of the X and Y dimensions will now match those of the sample
@@ -223,12 +241,6 @@ class RectilinearRegridder(object):
             if dtype.kind == 'i':
                 dtype = np.promote_types(dtype, np.float16)
 
-        if isinstance(src_data, ma.MaskedArray):
-            data = ma.empty(shape, dtype=dtype)
-            data.mask = np.zeros(data.shape, dtype=np.bool)
-        else:
-            data = np.empty(shape, dtype=dtype)
-
         # The interpolation class requires monotonically increasing
         # coordinates, so flip the coordinate(s) and data if the aren't.
         reverse_x = src_x_coord.points[0] > src_x_coord.points[1]
@@ -273,66 +285,87 @@ class RectilinearRegridder(object):
         interpolator.bounds_error = mode.bounds_error
         interpolator.fill_value = mode.fill_value
 
-        # Construct the target coordinate points array, suitable for passing to
-        # the interpolator multiple times.
-        interp_coords = [sample_grid_x.astype(np.float64)[..., np.newaxis],
-                         sample_grid_y.astype(np.float64)[..., np.newaxis]]
-
-        # Map all the requested values into the range of the source
-        # data (centred over the centre of the source data to allow
-        # extrapolation where required).
-        min_x, max_x = x_points.min(), x_points.max()
-        min_y, max_y = src_y_coord.points.min(), src_y_coord.points.max()
-        if src_x_coord.units.modulus:
-            modulus = src_x_coord.units.modulus
-            offset = (max_x + min_x - modulus) * 0.5
-            interp_coords[0] -= offset
-            interp_coords[0] = (interp_coords[0] % modulus) + offset
-
-        interp_coords = np.dstack(interp_coords)
-
-        weights = interpolator.compute_interp_weights(interp_coords)
+        if weights_cache is None:
+            weights_cache = {}
+        weights = weights_cache.get('weights')
+        if weights is None:
+            # Construct the target coordinate points array, suitable for
+            # passing to the interpolator multiple times.
+            interp_coords = [
+                sample_grid_x.astype(np.float64)[..., np.newaxis],
+                sample_grid_y.astype(np.float64)[..., np.newaxis]]
+
+            # Map all the requested values into the range of the source
+            # data (centred over the centre of the source data to allow
+            # extrapolation where required).
+            min_x, max_x = x_points.min(), x_points.max()
+            if src_x_coord.units.modulus:
+                modulus = src_x_coord.units.modulus
+                offset = (max_x + min_x - modulus) * 0.5
+                interp_coords[0] -= offset
+                interp_coords[0] = (interp_coords[0] % modulus) + offset
+
+            interp_coords = np.dstack(interp_coords)
+
+            weights = interpolator.compute_interp_weights(interp_coords)
+            weights_cache['weights'] = weights
+
+        # Interpolate the 2d slices of the data in batches, combining as many
+        # of the trailing non-grid dimensions into each batch as will fit
+        # within _REGRID_BATCH_SIZE source values. The interpolator carries
+        # a batch through the pre-computed weights as a single trailing
+        # dimension.
+        other_dims = [dim for dim in range(src_data.ndim)
+                      if dim not in (x_dim, y_dim)]
+        other_shape = [src_data.shape[dim] for dim in other_dims]
+        batch_size = src_data.shape[x_dim] * src_data.shape[y_dim]
+        n_batch_dims = 0
+        for size in reversed(other_shape):
+            if batch_size * size > _REGRID_BATCH_SIZE:
+                break
+            batch_size *= size
+            n_batch_dims += 1
+        iter_shape = other_shape[:len(other_shape) - n_batch_dims]
+        batch_shape = other_shape[len(other_shape) - n_batch_dims:]
+        n_slices = int(np.prod(batch_shape))
 
         def interpolate(data):
-            # Update the interpolator for this data slice.
-            data = data.astype(interpolator.values.dtype)
-            if y_dim < x_dim:
-                data = data.T
-            interpolator.values = data
+            # Update the interpolator for this batch of data slices.
+            # NB. Any mask is dropped here, as it is interpolated separately.
+            data = np.asarray(data, dtype=interpolator.values.dtype)
+            data = data.reshape((n_slices,) + data.shape[-2:])
+            interpolator.values = data.transpose(1, 2, 0)
             data = interpolator.interp_using_pre_computed_weights(weights)
-            if y_dim > x_dim:
-                data = data.T
-            return data
-
-        # Build up a shape suitable for passing to ndindex, inside the loop we
-        # will insert slice(None) on the data indices.
-        iter_shape = list(shape)
-        iter_shape[x_dim] = iter_shape[y_dim] = 1
-
-        # Iterate through each 2d slice of the data, updating the interpolator
-        # with the new data as we go.
-        for index in np.ndindex(tuple(iter_shape)):
-            index = list(index)
-            index[x_dim] = index[y_dim] = slice(None)
-
-            src_subset = src_data[tuple(index)]
+            data = data.transpose(2, 0, 1)
+            return data.reshape(batch_shape + list(data.shape[1:]))
+
+        # Work through views of the source and result with the non-grid
+        # dimensions first, followed by the grid dimensions in the order
+        # expected by the interpolator and returned by it.
+        src_stack = src_data.transpose(other_dims + [x_dim, y_dim])
+        data = np.empty(shape, dtype=dtype)
+        data_stack = data.transpose(other_dims + [y_dim, x_dim])
+        new_mask = None
+        if isinstance(src_data, ma.MaskedArray) or mode.force_mask:
+            new_mask = np.empty(shape, dtype=np.bool)
+            mask_stack = new_mask.transpose(other_dims + [y_dim, x_dim])
+
+        for index in np.ndindex(*iter_shape):
+            src_subset = src_stack[index]
             interpolator.fill_value = mode.fill_value
-            data[tuple(index)] = interpolate(src_subset)
+            data_stack[index] = interpolate(src_subset)
 
-            if isinstance(data, ma.MaskedArray) or mode.force_mask:
+            if new_mask is not None:
                 # NB. np.ma.getmaskarray returns an array of `False` if
                 # `src_subset` is not a masked array.
                 src_mask = np.ma.getmaskarray(src_subset)
                 interpolator.fill_value = mode.mask_fill_value
                 mask_fraction = interpolate(src_mask)
-                new_mask = (mask_fraction > 0)
+                mask_stack[index] = (mask_fraction > 0)
 
-                if np.ma.isMaskedArray(data):
-                    data.mask[tuple(index)] = new_mask
-                elif np.any(new_mask):
-                    # Set mask=False to ensure we have an expanded mask array.
-                    data = np.ma.MaskedArray(data, mask=False)
-                    data.mask[tuple(index)] = new_mask
+        if isinstance(src_data, ma.MaskedArray) or (new_mask is not None and
+                                                    np.any(new_mask)):
+            data = ma.MaskedArray(data, mask=new_mask)
 
         return data
 
@@ -354,7 +387,8 @@ class RectilinearRegridder(object):
         Args:
 
         * data:
-            The regridded data as an N-dimensional NumPy array.
+            The regridded data as an N-dimensional NumPy array or
+            :class:`biggus.Array`.
         * src:
             The source Cube.
         * x_dim:
@@ -491,6 +525,12 @@ class RectilinearRegridder(object):
             this cube will be converted to values on the new grid using
             either nearest-neighbour or linear interpolation.
 
+        .. note::
+
+            If the given cube has lazy data, the result also has lazy data,
+            which is regridded one slab at a time when it is realised,
+            except when the extrapolation mode is 'nanmask'.
+
         """
         # Validity checks.
         if not isinstance(src, iris.cube.Cube):
@@ -522,16 +562,37 @@ class RectilinearRegridder(object):
             self._check_units(coord)
 
         # Convert the grid to a 2D sample grid in the src CRS.
-        sample_grid = self._sample_grid(src_cs, grid_x_coord, grid_y_coord)
-        sample_grid_x, sample_grid_y = sample_grid
+        if self._sample_grid_cache is None:
+            self._sample_grid_cache = self._sample_grid(src_cs, grid_x_coord,
+                                                        grid_y_coord)
+        sample_grid_x, sample_grid_y = self._sample_grid_cache
 
         # Compute the interpolated data values.
         x_dim = src.coord_dims(src_x_coord)[0]
         y_dim = src.coord_dims(src_y_coord)[0]
-        data = self._regrid(src.data, x_dim, y_dim,
-                            src_x_coord, src_y_coord,
-                            sample_grid_x, sample_grid_y,
-                            self._method, self._extrapolation_mode)
+        # NB. The result of the 'nanmask' extrapolation mode depends on
+        # whether the source data is masked as a whole, so cannot be
+        # computed one slab at a time.
+        if src.has_lazy_data() and self._extrapolation_mode != 'nanmask':
+            # Regrid the data lazily, one slab of horizontal slices at a
+            # time.
+            regrid = functools.partial(
+                self._regrid, x_dim=x_dim, y_dim=y_dim,
+                src_x_coord=src_x_coord, src_y_coord=src_y_coord,
+                sample_grid_x=sample_grid_x, sample_grid_y=sample_grid_y,
+                method=self._method,
+                extrapolation_mode=self._extrapolation_mode,
+                weights_cache=self._weights_cache)
+            shape = list(src.shape)
+            shape[y_dim], shape[x_dim] = sample_grid_x.shape
+            data = biggus.OrthoArrayAdapter(
+                SlabProxy(src.lazy_data(), (y_dim, x_dim), shape, regrid))
+        else:
+            data = self._regrid(src.data, x_dim, y_dim,
+                                src_x_coord, src_y_coord,
+                                sample_grid_x, sample_grid_y,
+                                self._method, self._extrapolation_mode,
+                                self._weights_cache)
 
         # Wrap up the data as a Cube.
         regrid_callback = functools.partial(self._regrid,
@@ -0,0 +1,178 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+A cache of the regridders used by :meth:`iris.cube.Cube.regrid`.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import collections
+import threading
+
+from iris.analysis._interpolation import get_xy_dim_coords, snapshot_grid
+import iris.config
+
+
+def _grid_key(grid):
+    """
+    Return a hashable fingerprint of the given (x, y) grid coordinates.
+
+    Grids which are equal always have equal fingerprints, but grids with
+    equal fingerprints must still be compared to be sure they are equal.
+
+    """
+    key = []
+    for coord in grid:
+        bounds = coord.bounds
+        key.append((coord.name(), str(coord.units),
+                    repr(coord.coord_system), coord.shape,
+                    hash(coord.points.tobytes()),
+                    None if bounds is None else hash(bounds.tobytes())))
+    return tuple(key)
+
+
+class RegridderCache(object):
+    """
+    A bounded, thread-safe cache of regridders, keyed by the regridding
+    scheme and the horizontal grids of the source and target cubes.
+
+    Regridders are created by the scheme on a cache miss, and the least
+    recently used regridders are discarded once more than :attr:`maxsize`
+    are cached. Only regridders which depend on nothing more than the
+    scheme and the two grids can be cached, so regridders for any other
+    schemes are always created afresh.
+
+    """
+    def __init__(self, scheme_types, maxsize=None):
+        """
+        Args:
+
+        * scheme_types (tuple of types):
+            The regridding schemes whose regridders can be cached. These
+            must be fully described by their repr, and the regridders they
+            create must depend on nothing more than the horizontal grids of
+            the source and target cubes.
+
+        Kwargs:
+
+        * maxsize (int):
+            The maximum number of regridders to cache. Defaults to
+            :data:`iris.config.REGRIDDER_CACHE_SIZE`.
+
+        """
+        self._scheme_types = tuple(scheme_types)
+        self._lock = threading.Lock()
+        # Lists of the (source grid, target grid, regridder) entries for
+        # each key, with the most recently used key last.
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        if maxsize is None:
+            maxsize = iris.config.REGRIDDER_CACHE_SIZE
+        self._maxsize = maxsize
+        #: The number of requests which reused a cached regridder.
+        self.hits = 0
+        #: The number of requests which had to create a regridder.
+        self.misses = 0
+
+    def __repr__(self):
+        fmt = ('<{self.__class__.__name__} maxsize={self.maxsize} '
+               'size={self._size} hits={self.hits} misses={self.misses}>')
+        return fmt.format(self=self)
+
+    @property
+    def maxsize(self):
+        """The maximum number of regridders to cache."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    @property
+    def size(self):
+        """The number of regridders currently cached."""
+        return self._size
+
+    def regridder(self, src_cube, grid_cube, scheme):
+        """
+        Return a regridder from the horizontal grid of `src_cube` to the
+        horizontal grid of `grid_cube`, as created by the given `scheme`.
+
+        Args:
+
+        * src_cube:
+            The :class:`~iris.cube.Cube` defining the source grid.
+        * grid_cube:
+            The :class:`~iris.cube.Cube` defining the target grid.
+        * scheme:
+            The regridding scheme, e.g. :class:`iris.analysis.Linear`.
+
+        """
+        if type(scheme) not in self._scheme_types:
+            return scheme.regridder(src_cube, grid_cube)
+        try:
+            src_grid = get_xy_dim_coords(src_cube)
+            tgt_grid = get_xy_dim_coords(grid_cube)
+        except ValueError:
+            # Let the scheme raise the appropriate error.
+            return scheme.regridder(src_cube, grid_cube)
+        key = (type(scheme), repr(scheme),
+               _grid_key(src_grid), _grid_key(tgt_grid))
+
+        with self._lock:
+            entries = self._entries.get(key, [])
+            for i, (cached_src, cached_tgt, regridder) in enumerate(entries):
+                if cached_src == src_grid and cached_tgt == tgt_grid:
+                    # Re-insert the key and entry to mark them as the most
+                    # recently used.
+                    del self._entries[key]
+                    self._entries[key] = entries
+                    entries.append(entries.pop(i))
+                    self.hits += 1
+                    return regridder
+            self.misses += 1
+
+        regridder = scheme.regridder(src_cube, grid_cube)
+        entry = (snapshot_grid(src_cube), snapshot_grid(grid_cube), regridder)
+        with self._lock:
+            entries = self._entries.pop(key, [])
+            entries.append(entry)
+            self._entries[key] = entries
+            self._size += 1
+            self._evict()
+        return regridder
+
+    def clear(self):
+        """Discard all of the cached regridders, and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = 0
+
+    def _evict(self):
+        # Discard the least recently used regridders until there are at
+        # most maxsize. Must be called with the lock held.
+        while self._size > max(self._maxsize, 0):
+            key, entries = next(iter(self._entries.items()))
+            entries.pop(0)
+            if not entries:
+                del self._entries[key]
+            self._size -= 1
@@ -24,14 +24,17 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 
 from collections import namedtuple
 import copy
+import functools
 import warnings
 
+import biggus
 import cf_units
 import numpy as np
 import numpy.ma as ma
 
 import cartopy.img_transform
 import cartopy.crs as ccrs
+from iris._lazy_data import SlabProxy
 import iris.analysis
 import iris.coords
 import iris.coord_systems
@@ -473,6 +476,24 @@ def cosine_latitude_weights(cube):
     return broad_weights
 
 
+def _project_slices(data, ydim, xdim, indices, mask):
+    """
+    Gather every y-x slice of the data onto a target grid, given the flat
+    index of the nearest source point of each target point, and the mask of
+    the target points which have no source point.
+
+    """
+    # Flatten the source grid, as the last dimension.
+    other_dims = [dim for dim in range(data.ndim) if dim not in (ydim, xdim)]
+    dims = other_dims + [ydim, xdim]
+    data = data.transpose(dims)
+    data = data.reshape(data.shape[:-2] + (-1,))
+    result = data[..., indices]
+    if np.any(mask):
+        result = ma.masked_array(result, mask=ma.getmaskarray(result) | mask)
+    return result.transpose(np.argsort(dims))
+
+
 def project(cube, target_proj, nx=None, ny=None):
     """
     Nearest neighbour regrid to a specified target projection.
@@ -516,6 +537,13 @@ def project(cube, target_proj, nx=None, ny=None):
         resulting nearest neighbour values.  If masked, the value in the
         resulting cube is set to 0.
 
+    .. note::
+
+        The nearest neighbour of each target point is found once, and used
+        for every latitude-longitude slice of the cube. If the cube has lazy
+        data, so does the resulting cube, and its slices are projected as
+        it is realised.
+
     .. warning::
 
         This function uses a nearest neighbour approach rather than any form
@@ -602,24 +630,16 @@ def project(cube, target_proj, nx=None, ny=None):
                          'to have 1 or 2 dimensions, got {} and '
                          '{}.'.format(lat_coord.ndim, lon_coord.ndim))
 
-    # Create array to store regridded data
-    new_shape = list(cube.shape)
-    new_shape[xdim] = nx
-    new_shape[ydim] = ny
-    new_data = ma.zeros(new_shape, cube.data.dtype)
-
-    # Create iterators to step through cube data in lat long slices
-    new_shape[xdim] = 1
-    new_shape[ydim] = 1
-    index_it = np.ndindex(*new_shape)
-    if lat_coord.ndim == 1 and lon_coord.ndim == 1:
-        slice_it = cube.slices([lat_coord, lon_coord])
-    elif lat_coord.ndim == 2 and lon_coord.ndim == 2:
-        slice_it = cube.slices(lat_coord)
-    else:
-        raise ValueError('Expected the latitude and longitude coordinates '
-                         'to have 1 or 2 dimensions, got {} and '
-                         '{}.'.format(lat_coord.ndim, lon_coord.ndim))
+    # Find the nearest source point of each target point once, by
+    # regridding the flat indices of the source points, rather than building
+    # a KD-tree for each slice of the cube. Target points which cartopy
+    # masks, e.g. those outside of the target projection, are masked.
+    indices = np.arange(source_x.size).reshape(source_x.shape)
+    indices = cartopy.img_transform.regrid(indices, source_x, source_y,
+                                           source_cs, target_proj,
+                                           target_x, target_y)
+    mask = ma.getmaskarray(indices)
+    indices = ma.getdata(indices)
 
 #    # Mask out points outside of extent in source_cs - disabled until
 #    # a way to specify global/limited extent is agreed upon and code
@@ -640,29 +660,24 @@ def project(cube, target_proj, nx=None, ny=None):
 #                           (source_desired_x > source_x.max()) |
 #                           (source_desired_y < source_y.min()) |
 #                           (source_desired_y > source_y.max()))
-#    # Make array a mask by default (rather than a single bool) to allow mask
-#    # to be assigned to slices.
-#    new_data.mask = np.zeros(new_shape)
-
-    # Step through cube data, regrid onto desired projection and insert results
-    # in new_data array
-    for index, ll_slice in zip(index_it, slice_it):
-        # Regrid source data onto target grid
-        index = list(index)
-        index[xdim] = slice(None, None)
-        index[ydim] = slice(None, None)
-        new_data[index] = cartopy.img_transform.regrid(ll_slice.data,
-                                                       source_x, source_y,
-                                                       source_cs,
-                                                       target_proj,
-                                                       target_x, target_y)
-
-#    # Mask out points beyond extent
-#    new_data[index].mask[outof_extent_points] = True
-
-    # Remove mask if it is unnecessary
-    if not np.any(new_data.mask):
-        new_data = new_data.data
+#    mask |= outof_extent_points
+
+    # Gather all of the slices of the cube data onto the target grid, one
+    # slab at a time as it is realised if the data is lazy.
+    new_shape = list(cube.shape)
+    new_shape[xdim] = nx
+    new_shape[ydim] = ny
+    gather = functools.partial(_project_slices, ydim=ydim, xdim=xdim,
+                               indices=indices, mask=mask)
+    if cube.has_lazy_data():
+        new_data = biggus.OrthoArrayAdapter(
+            SlabProxy(cube.lazy_data(), (ydim, xdim), new_shape, gather,
+                      dtype=cube.dtype))
+    else:
+        new_data = gather(cube.data)
+        # Remove mask if it is unnecessary
+        if ma.isMaskedArray(new_data) and not np.any(new_data.mask):
+            new_data = new_data.data
 
     # Create new cube
     new_cube = iris.cube.Cube(new_data)
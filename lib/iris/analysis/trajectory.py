@@ -31,7 +31,8 @@ import iris.coord_systems
 import iris.coords
 import iris.analysis
 from iris.analysis._interpolate_private import \
-    _nearest_neighbour_indices_ndcoords, linear as linear_regrid
+    _nearest_neighbour_indices_ndcoords
+from iris.analysis._interpolation import _canonical_sample_points
 
 
 class _Segment(object):
@@ -207,25 +208,6 @@ def interpolate(cube, sample_points, method=None):
             new_cube.add_aux_coord(new_coord, dest_dims)
             coord_mapping[id(coord)] = new_coord
 
-    # Create all the squished (non derived) coords, not filled in yet.
-    trajectory_dim = len(remaining_dims)
-    for coord in cube.dim_coords + cube.aux_coords:
-        src_dims = cube.coord_dims(coord)
-        if not squish_my_dims.isdisjoint(src_dims):
-            points = np.array([coord.points.flatten()[0]] * trajectory_size)
-            new_coord = iris.coords.AuxCoord(points,
-                                             standard_name=coord.standard_name,
-                                             long_name=coord.long_name,
-                                             units=coord.units,
-                                             bounds=None,
-                                             attributes=coord.attributes,
-                                             coord_system=coord.coord_system)
-            new_cube.add_aux_coord(new_coord, trajectory_dim)
-            coord_mapping[id(coord)] = new_coord
-
-    for factory in cube.aux_factories:
-        new_cube.add_aux_factory(factory.updated(coord_mapping))
-
     # Are the given coords all 1-dimensional? (can we do linear interp?)
     for coord, values in sample_points:
         if coord.ndim > 1:
@@ -234,26 +216,72 @@ def interpolate(cube, sample_points, method=None):
             method = "nearest"
             break
 
-    # Use a cache with _nearest_neighbour_indices_ndcoords()
-    cache = {}
-
-    for i in range(trajectory_size):
-        point = [(coord, values[i]) for coord, values in sample_points]
-
-        if method in ["linear", None]:
-            column = linear_regrid(cube, point)
-            new_cube.data[..., i] = column.data
-        elif method == "nearest":
-            column_index = _nearest_neighbour_indices_ndcoords(cube, point, cache=cache)
-            column = cube[column_index]
-            new_cube.data[..., i] = column.data
-
-        # Fill in the empty squashed (non derived) coords.
-        for column_coord in column.dim_coords + column.aux_coords:
-            src_dims = cube.coord_dims(column_coord)
-            if not squish_my_dims.isdisjoint(src_dims):
-                if len(column_coord.points) != 1:
-                    raise Exception("Expected to find exactly one point. Found %d" % len(column_coord.points))
-                new_cube.coord(column_coord.name()).points[i] = column_coord.points[0]
+    # Sample the data, and the squished (non derived) coords, at all of the
+    # trajectory points in one go.
+    squished_coords = [coord for coord in cube.dim_coords + cube.aux_coords
+                       if not squish_my_dims.isdisjoint(cube.coord_dims(coord))]
+    for coord in squished_coords:
+        if not squish_my_dims.issuperset(cube.coord_dims(coord)):
+            num_points = int(np.prod([size for dim, size in remaining
+                                      if dim in cube.coord_dims(coord)]))
+            raise Exception("Expected to find exactly one point. Found %d" % num_points)
+
+    if method in ["linear", None]:
+        sample_coords = [coord for coord, values in sample_points]
+        interpolator = iris.analysis.Linear().interpolator(cube, sample_coords)
+        sample_values = _canonical_sample_points(
+            interpolator.coords, [values for coord, values in sample_points])
+        new_cube.data[...] = interpolator._points(sample_values,
+                                                  interpolator.cube.data,
+                                                  pointwise=True)
+        sample_coord_ids = [id(coord) for coord in sample_coords]
+
+        def coord_points(coord):
+            if id(coord) in sample_coord_ids:
+                return sample_values[sample_coord_ids.index(id(coord))]
+            # Interpolate the coordinate, which is broadcast over all of
+            # the remaining dimensions.
+            points = interpolator._points(sample_values, coord.points,
+                                          cube.coord_dims(coord),
+                                          pointwise=True)
+            return points[(0,) * (points.ndim - 1)]
+    elif method == "nearest":
+        point = [(coord, np.asarray(values)) for coord, values in sample_points]
+        column_index = _nearest_neighbour_indices_ndcoords(cube, point)
+        # Only realise the data at the sampled indices of each sampled
+        # dimension, then gather the data for all the trajectory points with
+        # fancy indexing, after moving the sampled dimensions to the front.
+        squished_dims = sorted(squish_my_dims)
+        keys = [slice(None)] * cube.ndim
+        indices = []
+        for dim in squished_dims:
+            keys[dim], index = np.unique(column_index[dim],
+                                         return_inverse=True)
+            indices.append(index)
+        data = cube[tuple(keys)].data
+        data = data.transpose(squished_dims + remaining_dims)[tuple(indices)]
+        new_cube.data[...] = np.rollaxis(data, 0, data.ndim)
+
+        def coord_points(coord):
+            dims = cube.coord_dims(coord)
+            return coord.points[tuple(column_index[dim] for dim in dims)]
+
+    # Create all the squished (non derived) coords.
+    trajectory_dim = len(remaining_dims)
+    for coord in squished_coords:
+        points = np.empty(trajectory_size, dtype=coord.points.dtype)
+        points[:] = coord_points(coord)
+        new_coord = iris.coords.AuxCoord(points,
+                                         standard_name=coord.standard_name,
+                                         long_name=coord.long_name,
+                                         units=coord.units,
+                                         bounds=None,
+                                         attributes=coord.attributes,
+                                         coord_system=coord.coord_system)
+        new_cube.add_aux_coord(new_coord, trajectory_dim)
+        coord_mapping[id(coord)] = new_coord
+
+    for factory in cube.aux_factories:
+        new_cube.add_aux_factory(factory.updated(coord_mapping))
 
     return new_cube
@@ -39,6 +39,56 @@ defined by :mod:`ConfigParser`.
     directory supports the subset of Iris unit tests that require data.
     Directory contents accessed via :func:`iris.tests.get_data_path`.
 
+.. py:data:: iris.config.HEADER_CACHE_DIR
+
+    The [optional] local directory in which to cache the headers scanned
+    from PP and FieldsFiles, so that later loads of an unchanged file need
+    not scan it again. Defaults to None, in which case no cache is used.
+
+.. py:data:: iris.config.FILE_HANDLE_POOL_SIZE
+
+    The maximum number of idle file handles which each of the pools in
+    :mod:`iris.fileformats.file_handles` keeps open. Defaults to 16.
+
+.. py:data:: iris.config.DECODE_WORKERS
+
+    The number of worker threads which decode the data of PP and FieldsFile
+    fields as a stack of them is realised. The threads are created when
+    first needed, and shared by all subsequent realisations. A value of 0
+    or 1 decodes the data serially, in the calling thread. Defaults to the
+    number of CPUs.
+
+.. py:data:: iris.config.NETCDF_CHUNK_CACHE_SIZE
+
+    The maximum number of bytes of decompressed data which
+    :data:`iris.fileformats.file_handles.NETCDF_CHUNKS` keeps from the
+    chunks of chunked netCDF variables. Reads of those variables are then
+    made a whole chunk at a time, so that overlapping reads share the
+    decompressed chunks. Defaults to 0, which reads the variables directly.
+
+.. py:data:: iris.config.REGRIDDER_CACHE_SIZE
+
+    The maximum number of regridders which
+    :data:`iris.analysis.REGRIDDER_CACHE` keeps for reuse by
+    :meth:`iris.cube.Cube.regrid`. Defaults to 32.
+
+.. py:data:: iris.config.MERGE_ENGINE
+
+    The engine which :meth:`iris.cube.CubeList.merge` uses to derive the
+    dimensions of the merged cubes from the scalar coordinates of the
+    source cubes. Either "vectorised", the default, which analyses the
+    scalar values as arrays of integer codes, or "legacy", which uses the
+    original dictionary based algorithm. Both give the same result.
+
+.. py:data:: iris.config.NETCDF_TRANSLATOR
+
+    The translator which :func:`iris.fileformats.netcdf.load_cubes` uses to
+    turn each CF-netCDF data variable into a cube. Either "pyke", the
+    default, which runs the "fc_rules_cf" rule base in the PyKE inference
+    engine, or "python", which applies the same rules directly in Python
+    and so avoids the cost of the inference engine. Both give the same
+    result.
+
 .. py:data:: iris.config.PALETTE_PATH
 
     The full path to the Iris palette configuration directory
@@ -68,6 +118,7 @@ from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 
 from six.moves import configparser
+import multiprocessing
 import os.path
 import warnings
 
@@ -135,10 +186,41 @@ TEST_DATA_DIR = get_dir_option(_RESOURCE_SECTION, 'test_data_dir',
 if os.environ.get("override_test_data_repository"):
     TEST_DATA_DIR = None
 
+HEADER_CACHE_DIR = get_dir_option(_RESOURCE_SECTION, 'header_cache_dir')
+
+FILE_HANDLE_POOL_SIZE = int(get_option(_RESOURCE_SECTION,
+                                       'file_handle_pool_size', default=16))
+
+DECODE_WORKERS = int(get_option(_RESOURCE_SECTION, 'decode_workers',
+                                default=multiprocessing.cpu_count()))
+
+NETCDF_CHUNK_CACHE_SIZE = int(get_option(_RESOURCE_SECTION,
+                                         'netcdf_chunk_cache_size',
+                                         default=0))
+
+REGRIDDER_CACHE_SIZE = int(get_option(_RESOURCE_SECTION,
+                                      'regridder_cache_size', default=32))
+
 PALETTE_PATH = get_dir_option(_RESOURCE_SECTION, 'palette_path',
                               os.path.join(CONFIG_PATH, 'palette'))
 
 
+###############
+# Merge options
+_MERGE_SECTION = 'Merge'
+
+
+MERGE_ENGINE = get_option(_MERGE_SECTION, 'engine', default='vectorised')
+
+
+################
+# NetCDF options
+_NETCDF_SECTION = 'Netcdf'
+
+
+NETCDF_TRANSLATOR = get_option(_NETCDF_SECTION, 'translator', default='pyke')
+
+
 #################
 # Logging options
 _LOGGING_SECTION = 'Logging'
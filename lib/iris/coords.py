@@ -28,6 +28,7 @@ import collections
 import copy
 from itertools import chain
 from six.moves import zip_longest
+import numbers
 import operator
 import warnings
 import zlib
@@ -497,6 +498,44 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
         new_coord = self.copy(points=points, bounds=bounds)
         return new_coord
 
+    def _view(self, key):
+        """
+        Returns a new Coord whose points and bounds are read-only views
+        onto those of this coordinate, or None if the key or the
+        coordinate values do not allow a view to be taken.
+
+        Only basic indexing (integers and slices) of realised points and
+        bounds can be expressed as a view.
+
+        """
+        full_slice = iris.util._build_full_slice_given_keys(key, self.ndim)
+        basic = all(isinstance(s, slice) or
+                    (isinstance(s, numbers.Integral) and
+                     not isinstance(s, bool)) for s in full_slice)
+        arrays = [self._points]
+        if self._bounds is not None:
+            arrays.append(self._bounds)
+        if not basic or not all(type(array) is np.ndarray
+                                for array in arrays):
+            return None
+
+        points = self._points[full_slice]
+        if points.shape and min(points.shape) == 0:
+            raise IndexError('Cannot index with zero length slice.')
+        # Indexing with integers alone leaves a scalar array, but coordinate
+        # points always have at least one dimension.
+        points = points.reshape(points.shape or (1,))
+        points.flags.writeable = False
+        # Substitute the views for the original arrays when copying the
+        # coordinate, so that only the metadata is copied.
+        memo = {id(self._points): points}
+        if self._bounds is not None:
+            bounds = self._bounds[full_slice + (Ellipsis,)]
+            bounds = bounds.reshape(points.shape + bounds.shape[-1:])
+            bounds.flags.writeable = False
+            memo[id(self._bounds)] = bounds
+        return copy.deepcopy(self, memo)
+
     def copy(self, points=None, bounds=None):
         """
         Returns a copy of this coordinate.
@@ -1475,6 +1514,12 @@ class DimCoord(Coord):
         coord.circular = self.circular and coord.shape == self.shape
         return coord
 
+    def _view(self, key):
+        coord = super(DimCoord, self)._view(key)
+        if coord is not None:
+            coord.circular = self.circular and coord.shape == self.shape
+        return coord
+
     def collapsed(self, dims_to_collapse=None):
         coord = Coord.collapsed(self, dims_to_collapse=dims_to_collapse)
         if self.circular and self.units.modulus is not None:
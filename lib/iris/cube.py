@@ -442,20 +442,25 @@ class CubeList(list):
 
         """
         # Register each of our cubes with its appropriate ProtoCube.
+        # Only the ProtoCubes with the same key as a cube can possibly match
+        # it, so they are found with a single lookup.
         proto_cubes_by_name = {}
+        proto_cubes_by_key = {}
         for cube in self:
-            name = cube.standard_name
-            proto_cubes = proto_cubes_by_name.setdefault(name, [])
+            source = iris._merge.ProtoCube.source(cube)
+            proto_cubes = proto_cubes_by_key.setdefault(source.key, [])
             proto_cube = None
 
             for target_proto_cube in proto_cubes:
-                if target_proto_cube.register(cube):
+                if target_proto_cube.register(source):
                     proto_cube = target_proto_cube
                     break
 
             if proto_cube is None:
-                proto_cube = iris._merge.ProtoCube(cube)
+                proto_cube = iris._merge.ProtoCube(source)
                 proto_cubes.append(proto_cube)
+                name = cube.standard_name
+                proto_cubes_by_name.setdefault(name, []).append(proto_cube)
 
         # Emulate Python 2 behaviour.
         def _none_sort(item):
@@ -2147,7 +2152,41 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         requested must be applicable directly to the cube.data attribute. All
         metadata will be subsequently indexed appropriately.
 
+        .. seealso:: :attr:`Cube.view` to index the cube without copying its
+            data or coordinate values.
+
+        """
+        return self._getitem(keys)
+
+    @property
+    def view(self):
         """
+        Index the cube without copying its data or coordinate values.
+
+        Indexing ``cube.view[keys]`` is equivalent to ``cube[keys]`` except
+        that, wherever the keys allow it, the resulting cube shares the data
+        of this cube and its coordinates share the points and bounds of
+        this cube's coordinates.  Changes made in place to the data of either
+        cube are therefore seen by the other, whilst the shared coordinate
+        values are read-only.  The cube and coordinate metadata are still
+        copied.
+
+        For example, to process each level of a realised cube without
+        copying it level by level::
+
+            for level in range(cube.shape[0]):
+                process(cube.view[level])
+
+        .. seealso:: :meth:`Cube.slices` and :meth:`Cube.slices_over`, which
+            accept a ``view`` keyword.
+
+        """
+        return _CubeView(self)
+
+    def _getitem(self, keys, view=False):
+        # Index the cube as for __getitem__, but sharing the data and
+        # coordinate values of this cube where possible if view is True.
+
         # turn the keys into a full slice spec (all dims)
         full_slice = iris.util._build_full_slice_given_keys(keys,
                                                             len(self.shape))
@@ -2172,6 +2211,8 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         if first_slice is not None:
             data = self._my_data[first_slice]
+        elif view:
+            data = self._my_data
         else:
             data = copy.deepcopy(self._my_data)
 
@@ -2180,13 +2221,24 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         # We don't want a view of the data, so take a copy of it if it's
         # not already our own.
-        if isinstance(data, biggus.Array) or not data.flags['OWNDATA']:
+        if not view and (isinstance(data, biggus.Array) or
+                         not data.flags['OWNDATA']):
             data = copy.deepcopy(data)
 
         # We can turn a masked array into a normal array if it's full.
         if isinstance(data, ma.core.MaskedArray):
             if ma.count_masked(data) == 0:
-                data = data.filled()
+                # Filling would copy the data, whereas the underlying
+                # array of a view can simply be taken.
+                data = data.data if view else data.filled()
+
+        def slice_coord(coord, coord_keys):
+            new_coord = None
+            if view:
+                new_coord = coord._view(coord_keys)
+            if new_coord is None:
+                new_coord = coord[coord_keys]
+            return new_coord
 
         # Make the new cube slice
         cube = Cube(data)
@@ -2201,7 +2253,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             coord_keys = tuple([full_slice[dim] for dim in
                                 self.coord_dims(coord)])
             try:
-                new_coord = coord[coord_keys]
+                new_coord = slice_coord(coord, coord_keys)
             except ValueError:
                 # TODO make this except more specific to catch monotonic error
                 # Attempt to slice it by converting to AuxCoord first
@@ -2216,7 +2268,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             # Try/Catch to handle slicing that makes the points/bounds
             # non-monotonic
             try:
-                new_coord = coord[coord_keys]
+                new_coord = slice_coord(coord, coord_keys)
                 if not new_dims:
                     # If the associated dimension has been sliced so the coord
                     # is a scalar move the coord to the aux_coords container
@@ -2654,7 +2706,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
                 raise TypeError(msg)
         return coords
 
-    def slices_over(self, ref_to_slice):
+    def slices_over(self, ref_to_slice, view=False):
         """
         Return an iterator of all subcubes along a given coordinate or
         dimension index, or multiple of these.
@@ -2666,6 +2718,12 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             dimensions that are not returned in the subcubes).
             A mix of input types can also be provided.
 
+        Kwargs:
+
+        * view: if True, the subcubes share the data and coordinate values
+            of this cube where possible, as for :attr:`Cube.view`.  Default
+            is False.
+
         Returns:
             An iterator of subcubes.
 
@@ -2706,9 +2764,9 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         all_dims = set(range(self.ndim))
         opposite_dims = list(all_dims - slice_dims)
-        return self.slices(opposite_dims, ordered=False)
+        return self.slices(opposite_dims, ordered=False, view=view)
 
-    def slices(self, ref_to_slice, ordered=True):
+    def slices(self, ref_to_slice, ordered=True, view=False):
         """
         Return an iterator of all subcubes given the coordinates or dimension
         indices desired to be present in each subcube.
@@ -2728,6 +2786,11 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             the resulting cube slices.  If False, the order will follow that of
             the source cube.  Default is True.
 
+        * view: if True, the subcubes share the data and coordinate values
+            of this cube where possible, as for :attr:`Cube.view`.  Subcubes
+            which are reordered to match ``ordered`` have their data copied.
+            Default is False.
+
         Returns:
             An iterator of subcubes.
 
@@ -2784,7 +2847,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         for d in dim_to_slice:
             dims_index[d] = 1
 
-        return _SliceIterator(self, dims_index, dim_to_slice, ordered)
+        return _SliceIterator(self, dims_index, dim_to_slice, ordered, view)
 
     def transpose(self, new_order=None):
         """
@@ -3393,7 +3456,10 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         .. note::
 
-            This operation does not yet have support for lazy evaluation.
+            If the cube has lazy data, and the aggregator supports lazy
+            evaluation and produces a single value for each group, then the
+            result also has lazy data. Each group's data is then only read
+            when the result is realised.
 
         For example:
 
@@ -3481,28 +3547,66 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         # Aggregate the group-by data.
         cube_slice = [slice(None, None)] * len(data_shape)
+        aggregateby_data = None
+
+        # Perform the aggregation in lazy form if possible, as a stack of
+        # the lazy aggregations of each group, so that the data of a group
+        # is only read when the result is realised.
+        if (self.has_lazy_data() and aggregator.lazy_func is not None and
+                not aggregator.aggregate_shape(**kwargs)):
+            lazy_data = self.lazy_data()
+            stack = np.empty(len(groupby), 'object')
+            try:
+                for i, groupby_slice in enumerate(groupby.group()):
+                    cube_slice[dimension_to_groupby] = groupby_slice
+                    stack[i] = aggregator.lazy_aggregate(
+                        lazy_data[tuple(cube_slice)],
+                        axis=dimension_to_groupby, **kwargs)
+            except TypeError:
+                # TypeError - when unexpected keywords passed through.
+                pass
+            else:
+                aggregateby_data = biggus.ArrayStack(stack)
+                if dimension_to_groupby != 0:
+                    # Move the stacked groups into the group-by dimension.
+                    axes = list(range(1, self.ndim))
+                    axes.insert(dimension_to_groupby, 0)
+                    aggregateby_data = aggregateby_data.transpose(axes)
+
+        # Otherwise aggregate all of the groups in a single pass, where the
+        # aggregator supports it.
+        if aggregateby_data is None:
+            aggregateby_data = aggregator._aggregate_groups(
+                self.data, dimension_to_groupby, list(groupby.group()),
+                **kwargs)
+
+        # If we weren't able to complete a group aggregation, compute it
+        # directly now, one group at a time.
+        if aggregateby_data is None:
+            for i, groupby_slice in enumerate(groupby.group()):
+                # Slice the cube with the group-by slice to create a group-by
+                # sub-cube.
+                cube_slice[dimension_to_groupby] = groupby_slice
+                groupby_sub_cube = self[tuple(cube_slice)]
+                # Perform the aggregation over the group-by sub-cube and
+                # repatriate the aggregated data into the aggregate-by cube
+                # data.
+                cube_slice[dimension_to_groupby] = i
+                result = aggregator.aggregate(groupby_sub_cube.data,
+                                              axis=dimension_to_groupby,
+                                              **kwargs)
+
+                # Determine aggregation result data type for the
+                # aggregate-by cube data on first pass.
+                if i == 0:
+                    if isinstance(self.data, ma.MaskedArray):
+                        aggregateby_data = ma.zeros(data_shape,
+                                                    dtype=result.dtype)
+                    else:
+                        aggregateby_data = np.zeros(data_shape,
+                                                    dtype=result.dtype)
 
-        for i, groupby_slice in enumerate(groupby.group()):
-            # Slice the cube with the group-by slice to create a group-by
-            # sub-cube.
-            cube_slice[dimension_to_groupby] = groupby_slice
-            groupby_sub_cube = self[tuple(cube_slice)]
-            # Perform the aggregation over the group-by sub-cube and
-            # repatriate the aggregated data into the aggregate-by cube data.
-            cube_slice[dimension_to_groupby] = i
-            result = aggregator.aggregate(groupby_sub_cube.data,
-                                          axis=dimension_to_groupby,
-                                          **kwargs)
-
-            # Determine aggregation result data type for the aggregate-by cube
-            # data on first pass.
-            if i == 0:
-                if isinstance(self.data, ma.MaskedArray):
-                    aggregateby_data = ma.zeros(data_shape, dtype=result.dtype)
-                else:
-                    aggregateby_data = np.zeros(data_shape, dtype=result.dtype)
-
-            aggregateby_data[tuple(cube_slice)] = result
+                aggregateby_data[tuple(cube_slice)] = result
 
         # Add the aggregation meta data to the aggregate-by cube.
         aggregator.update_metadata(aggregateby_cube,
@@ -3555,7 +3659,12 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         .. note::
 
-            This operation does not yet have support for lazy evaluation.
+            For the :data:`~iris.analysis.MEAN`, :data:`~iris.analysis.SUM`,
+            :data:`~iris.analysis.MIN`, :data:`~iris.analysis.MAX` and
+            :data:`~iris.analysis.COUNT` aggregators without weights, the
+            windows are aggregated in a single pass over the data, and if the
+            cube has lazy data then the result also has lazy data. Other
+            aggregations do not yet have support for lazy evaluation.
 
         For example:
 
@@ -3645,13 +3754,6 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         key[dimension] = slice(None, self.shape[dimension] - window + 1)
         new_cube = self[tuple(key)]
 
-        # take a view of the original data using the rolling_window function
-        # this will add an extra dimension to the data at dimension + 1 which
-        # represents the rolled window (i.e. will have a length of window)
-        rolling_window_data = iris.util.rolling_window(self.data,
-                                                       window=window,
-                                                       axis=dimension)
-
         # now update all of the coordinates to reflect the aggregation
         for coord_ in self.coords(dimensions=dimension):
             if coord_.has_bounds():
@@ -3690,22 +3792,41 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             new_cube, [coord],
             action='with a rolling window of length %s over' % window,
             **kwargs)
-        # and perform the data transformation, generating weights first if
-        # needed
-        if isinstance(aggregator, iris.analysis.WeightedAggregator) and \
-                aggregator.uses_weighting(**kwargs):
-            if 'weights' in kwargs:
-                weights = kwargs['weights']
-                if weights.ndim > 1 or weights.shape[0] != window:
-                    raise ValueError('Weights for rolling window aggregation '
-                                     'must be a 1d array with the same length '
-                                     'as the window.')
-                kwargs = dict(kwargs)
-                kwargs['weights'] = iris.util.broadcast_to_shape(
-                    weights, rolling_window_data.shape, (dimension + 1,))
-        data_result = aggregator.aggregate(rolling_window_data,
-                                           axis=dimension + 1,
-                                           **kwargs)
+        # Perform the data transformation in a single pass over the data,
+        # and lazily if the data is lazy, where the aggregator supports it.
+        if self.has_lazy_data():
+            data_result = aggregator._lazy_aggregate_windows(
+                self.lazy_data(), dimension, window, **kwargs)
+        else:
+            data_result = aggregator._aggregate_windows(
+                self.data, dimension, window, **kwargs)
+
+        if data_result is None:
+            # take a view of the original data using the rolling_window
+            # function this will add an extra dimension to the data at
+            # dimension + 1 which represents the rolled window (i.e. will
+            # have a length of window)
+            rolling_window_data = iris.util.rolling_window(self.data,
+                                                           window=window,
+                                                           axis=dimension)
+
+            # and perform the data transformation, generating weights first
+            # if needed
+            if isinstance(aggregator, iris.analysis.WeightedAggregator) and \
+                    aggregator.uses_weighting(**kwargs):
+                if 'weights' in kwargs:
+                    weights = kwargs['weights']
+                    if weights.ndim > 1 or weights.shape[0] != window:
+                        raise ValueError('Weights for rolling window '
+                                         'aggregation must be a 1d array '
+                                         'with the same length as the '
+                                         'window.')
+                    kwargs = dict(kwargs)
+                    kwargs['weights'] = iris.util.broadcast_to_shape(
+                        weights, rolling_window_data.shape, (dimension + 1,))
+            data_result = aggregator.aggregate(rolling_window_data,
+                                               axis=dimension + 1,
+                                               **kwargs)
         result = aggregator.post_process(new_cube, data_result, [coord],
                                          **kwargs)
         return result
@@ -3808,8 +3929,15 @@ calendar='gregorian')
             this cube will be converted to values on the new grid
             according to the given regridding scheme.
 
+        .. note::
+
+            The regridders for the built-in regridding schemes are kept in
+            :data:`iris.analysis.REGRIDDER_CACHE`, so that regridding many
+            cubes between the same grids only calculates the regridding
+            weights once.
+
         """
-        regridder = scheme.regridder(self, grid)
+        regridder = iris.analysis.REGRIDDER_CACHE.regridder(self, grid, scheme)
         return regridder(self)
 
 
@@ -3900,7 +4028,8 @@ def sorted_axes(axes):
 
 # See Cube.slice() for the definition/context.
 class _SliceIterator(collections.Iterator):
-    def __init__(self, cube, dims_index, requested_dims, ordered):
+    def __init__(self, cube, dims_index, requested_dims, ordered,
+                 view=False):
         self._cube = cube
 
         # Let Numpy do some work in providing all of the permutations of our
@@ -3913,6 +4042,7 @@ class _SliceIterator(collections.Iterator):
         # indexing relating to sliced cube
         self._mod_requested_dims = np.argsort(requested_dims)
         self._ordered = ordered
+        self._view = view
 
     def __next__(self):
         # NB. When self._ndindex runs out it will raise StopIteration for us.
@@ -3927,7 +4057,7 @@ class _SliceIterator(collections.Iterator):
             index_list[d] = slice(None, None)
 
         # Request the slice
-        cube = self._cube[tuple(index_list)]
+        cube = self._cube._getitem(tuple(index_list), view=self._view)
 
         if self._ordered:
             if any(self._mod_requested_dims != list(range(len(cube.shape)))):
@@ -3936,3 +4066,15 @@ class _SliceIterator(collections.Iterator):
         return cube
 
     next = __next__
+
+
+class _CubeView(object):
+    """
+    Provides the indexing of :attr:`Cube.view`.
+
+    """
+    def __init__(self, cube):
+        self._cube = cube
+
+    def __getitem__(self, keys):
+        return self._cube._getitem(keys, view=True)
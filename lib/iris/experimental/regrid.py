@@ -22,15 +22,18 @@ Regridding functions.
 from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 
-from collections import namedtuple
 import copy
+import functools
 import warnings
 
+import biggus
 import cf_units
 import numpy as np
 import numpy.ma as ma
-from scipy.sparse import csc_matrix, diags as sparse_diags
+from scipy.sparse import csc_matrix, csr_matrix, diags as sparse_diags
+from scipy.sparse import kron as sparse_kron
 
+from iris._lazy_data import SlabProxy
 import iris.analysis.cartography
 from iris.analysis._interpolation import get_xy_dim_coords, snapshot_grid
 from iris.analysis._regrid import RectilinearRegridder
@@ -38,11 +41,6 @@ import iris.coord_systems
 import iris.cube
 
 
-_Version = namedtuple('Version', ('major', 'minor', 'micro'))
-_NP_VERSION = _Version(*(int(val) for val in
-                         np.version.version.split('.') if val.isdigit()))
-
-
 def _get_xy_coords(cube):
     """
     Return the x and y coordinates from a cube.
@@ -343,81 +341,54 @@ def _get_bounds_in_units(coord, units, dtype):
     return coord.units.convert(coord.bounds.astype(dtype), units).astype(dtype)
 
 
-def _weighted_mean_with_mdtol(data, weights, axis=None, mdtol=0):
+def _overlap_weights(src_bounds, grid_bounds, grid_decreasing, extent_func):
     """
-    Return the weighted mean of an array over the specified axis
-    using the provided weights (if any) and a permitted fraction of
-    masked data.
+    Return the extent of the overlap of each grid cell with each source
+    cell along a single axis.
 
     Args:
 
-    * data (array-like):
-        Data to be averaged.
-
-    * weights (array-like):
-        An array of the same shape as the data that specifies the contribution
-        of each corresponding data element to the calculated mean.
-
-    Kwargs:
-
-    * axis (int or tuple of ints):
-        Axis along which the mean is computed. The default is to compute
-        the mean of the flattened array.
-
-    * mdtol (float):
-        Tolerance of missing data. The value returned in each element of the
-        returned array will be masked if the fraction of masked data exceeds
-        mdtol. This fraction is weighted by the `weights` array if one is
-        provided. mdtol=0 means no missing data is tolerated
-        while mdtol=1 will mean the resulting element will be masked if and
-        only if all the contributing elements of data are masked.
-        Defaults to 0.
+    * src_bounds:
+        An (n, 2) shaped NumPy array of source bounds.
+    * grid_bounds:
+        An (m, 2) shaped NumPy array of grid bounds.
+    * grid_decreasing:
+        Boolean indicating whether the grid is in descending order.
+    * extent_func:
+        A function that returns a (p,) array of extents given a (p, 2)
+        shaped array of bounds.
 
     Returns:
-        Numpy array (possibly masked) or scalar.
+        An (m, n) shaped :class:`scipy.sparse.csr_matrix`.
 
     """
-    res = ma.average(data, weights=weights, axis=axis)
-    if ma.isMaskedArray(data) and mdtol < 1:
-        weights_total = weights.sum(axis=axis)
-        masked_weights = weights.copy()
-        masked_weights[~ma.getmaskarray(data)] = 0
-        masked_weights_total = masked_weights.sum(axis=axis)
-        frac_masked = np.true_divide(masked_weights_total, weights_total)
-        mask_pt = frac_masked > mdtol
-        if np.any(mask_pt):
-            if np.isscalar(res):
-                res = ma.masked
-            elif ma.isMaskedArray(res):
-                res.mask |= mask_pt
-            else:
-                res = ma.masked_array(res, mask=mask_pt)
-    return res
-
-
-def _regrid_area_weighted_array(src_data, x_dim, y_dim,
-                                src_x_bounds, src_y_bounds,
-                                grid_x_bounds, grid_y_bounds,
-                                grid_x_decreasing, grid_y_decreasing,
-                                area_func, circular=False, mdtol=0):
+    n = src_bounds.shape[0]
+    rows, cols, extents = [], [], []
+    for i, (lower, upper) in enumerate(grid_bounds):
+        # Reverse lower and upper if dest grid is decreasing.
+        if grid_decreasing:
+            lower, upper = upper, lower
+        bounds, indices = _cropped_bounds(src_bounds, lower, upper)
+        if isinstance(indices, slice):
+            indices = range(*indices.indices(n))
+        rows.extend([i] * len(indices))
+        cols.extend(indices)
+        extents.append(extent_func(bounds))
+    extents = np.concatenate(extents)
+    return csr_matrix((extents, (rows, cols)),
+                      shape=(grid_bounds.shape[0], n))
+
+
+def _regrid_area_weighted_weights(src_x_bounds, src_y_bounds,
+                                  grid_x_bounds, grid_y_bounds,
+                                  grid_x_decreasing, grid_y_decreasing,
+                                  area_func, circular=False):
     """
-    Regrid the given data from its source grid to a new grid using
-    an area weighted mean to determine the resulting data values.
-
-    .. note::
-
-        Elements in the returned array that lie either partially
-        or entirely outside of the extent of the source grid will
-        be masked irrespective of the value of mdtol.
+    Calculate the area weights that map the cells of a source grid onto
+    the cells of a new grid.
 
     Args:
 
-    * src_data:
-        An N-dimensional NumPy array.
-    * x_dim:
-        The X dimension within `src_data`.
-    * y_dim:
-        The Y dimension within `src_data`.
     * src_x_bounds:
         A NumPy array of bounds along the X axis defining the source grid.
     * src_y_bounds:
@@ -442,6 +413,79 @@ def _regrid_area_weighted_array(src_data, x_dim, y_dim,
         A boolean indicating whether the `src_x_bounds` are periodic. Default
         is False.
 
+    Returns:
+        A tuple of the sparse matrix of the areas of overlap between each
+        cell of the new grid and each cell of the source grid, a boolean
+        array indicating which cells of the new grid lie within the extent
+        of the source grid, and the shape of the new grid. Both grids are
+        flattened in (Y, X) order.
+
+    """
+    # Determine which grid bounds are within src extent.
+    y_within_bounds = _within_bounds(src_y_bounds, grid_y_bounds,
+                                     grid_y_decreasing)
+    x_within_bounds = _within_bounds(src_x_bounds, grid_x_bounds,
+                                     grid_x_decreasing)
+
+    # If x_0 > x_1 then we want [0]->x_1 and x_0->[0] + mod in the case
+    # of wrapped longitudes. However if the src grid is not global
+    # (i.e. circular) this new cell would include a region outside of
+    # the extent of the src grid and should therefore be masked.
+    x_0, x_1 = grid_x_bounds.T
+    if grid_x_decreasing:
+        x_0, x_1 = x_1, x_0
+    outside_extent = (x_0 > x_1) & (not circular)
+    valid = np.outer(y_within_bounds,
+                     x_within_bounds & ~outside_extent).ravel()
+
+    # Both area functions are separable, so the area of overlap of two
+    # cells is the product of their overlaps along each axis, relative
+    # to the area of a reference cell.
+    ref_bounds = np.array([[0, 1]], dtype=grid_x_bounds.dtype)
+    ref_area = area_func(ref_bounds, ref_bounds)[0, 0]
+    y_weights = _overlap_weights(
+        src_y_bounds, grid_y_bounds, grid_y_decreasing,
+        lambda bounds: area_func(bounds, ref_bounds)[:, 0])
+    x_weights = _overlap_weights(
+        src_x_bounds, grid_x_bounds, grid_x_decreasing,
+        lambda bounds: area_func(ref_bounds, bounds)[0, :] / ref_area)
+    weights = sparse_kron(y_weights, x_weights, format='csr')
+
+    # Discard the weights of any new grid cells which will be masked.
+    weights = (sparse_diags(valid.astype(weights.dtype), 0) *
+               weights).tocsr()
+    weights.eliminate_zeros()
+
+    grid_shape = (grid_y_bounds.shape[0], grid_x_bounds.shape[0])
+    return weights, valid, grid_shape
+
+
+def _regrid_area_weighted_array(src_data, x_dim, y_dim, weights_info,
+                                mdtol=0):
+    """
+    Regrid the given data from its source grid to a new grid using
+    an area weighted mean to determine the resulting data values.
+
+    .. note::
+
+        Elements in the returned array that lie either partially
+        or entirely outside of the extent of the source grid will
+        be masked irrespective of the value of mdtol.
+
+    Args:
+
+    * src_data:
+        An N-dimensional NumPy array.
+    * x_dim:
+        The X dimension within `src_data`.
+    * y_dim:
+        The Y dimension within `src_data`.
+    * weights_info:
+        The area weights of the source grid cells within each cell of the
+        new grid, as returned by :func:`_regrid_area_weighted_weights`.
+
+    Kwargs:
+
     * mdtol:
         Tolerance of missing data. The value returned in each element of the
         returned array will be masked if the fraction of missing data exceeds
@@ -457,159 +501,60 @@ def _regrid_area_weighted_array(src_data, x_dim, y_dim,
         grid.
 
     """
-    # Create empty data array to match the new grid.
-    # Note that dtype is not preserved and that the array is
-    # masked to allow for regions that do not overlap.
-    new_shape = list(src_data.shape)
-    if x_dim is not None:
-        new_shape[x_dim] = grid_x_bounds.shape[0]
-    if y_dim is not None:
-        new_shape[y_dim] = grid_y_bounds.shape[0]
-
-    # Flag to indicate whether the original data was a masked array.
+    weights, valid, grid_shape = weights_info
+
+    # Move the Y and X dimensions to the end, adding length one dimensions
+    # for scalar coordinates, so that every horizontal slice of the data
+    # can be regridded with a single sparse matrix product.
+    data = src_data
+    if y_dim is None:
+        data = data[..., np.newaxis]
+        y_dim = data.ndim - 1
+    if x_dim is None:
+        data = data[..., np.newaxis]
+        x_dim = data.ndim - 1
+    dims = [dim for dim in range(data.ndim) if dim not in (y_dim, x_dim)]
+    dims += [y_dim, x_dim]
+    data = data.transpose(dims)
+    other_shape = data.shape[:-2]
+    data = data.reshape(-1, data.shape[-2] * data.shape[-1]).T
+
+    # Calculate the weighted means, along with the total weight of
+    # masked data contributing to each.
     src_masked = ma.isMaskedArray(src_data)
+    totals = np.asarray(weights.sum(axis=1))
     if src_masked:
-        new_data = ma.zeros(new_shape, fill_value=src_data.fill_value)
+        mask = ma.getmaskarray(data)
+        masked_totals = weights.dot(mask.astype(weights.dtype))
+        valid_totals = weights.dot((~mask).astype(weights.dtype))
+        data = np.where(mask, 0, data.data)
     else:
-        new_data = ma.zeros(new_shape)
-    # Assign to mask to explode it, allowing indexed assignment.
-    new_data.mask = False
-
-    indices = [slice(None)] * new_data.ndim
-
-    # Determine which grid bounds are within src extent.
-    y_within_bounds = _within_bounds(src_y_bounds, grid_y_bounds,
-                                     grid_y_decreasing)
-    x_within_bounds = _within_bounds(src_x_bounds, grid_x_bounds,
-                                     grid_x_decreasing)
-
-    # Cache which src_bounds are within grid bounds
-    cached_x_bounds = []
-    cached_x_indices = []
-    for (x_0, x_1) in grid_x_bounds:
-        if grid_x_decreasing:
-            x_0, x_1 = x_1, x_0
-        x_bounds, x_indices = _cropped_bounds(src_x_bounds, x_0, x_1)
-        cached_x_bounds.append(x_bounds)
-        cached_x_indices.append(x_indices)
-
-    # Simple for loop approach.
-    for j, (y_0, y_1) in enumerate(grid_y_bounds):
-        # Reverse lower and upper if dest grid is decreasing.
-        if grid_y_decreasing:
-            y_0, y_1 = y_1, y_0
-        y_bounds, y_indices = _cropped_bounds(src_y_bounds, y_0, y_1)
-        for i, (x_0, x_1) in enumerate(grid_x_bounds):
-            # Reverse lower and upper if dest grid is decreasing.
-            if grid_x_decreasing:
-                x_0, x_1 = x_1, x_0
-            x_bounds = cached_x_bounds[i]
-            x_indices = cached_x_indices[i]
-
-            # Determine whether to mask element i, j based on overlap with
-            # src.
-            # If x_0 > x_1 then we want [0]->x_1 and x_0->[0] + mod in the case
-            # of wrapped longitudes. However if the src grid is not global
-            # (i.e. circular) this new cell would include a region outside of
-            # the extent of the src grid and should therefore be masked.
-            outside_extent = x_0 > x_1 and not circular
-            if (outside_extent or not y_within_bounds[j] or not
-                    x_within_bounds[i]):
-                # Mask out element(s) in new_data
-                if x_dim is not None:
-                    indices[x_dim] = i
-                if y_dim is not None:
-                    indices[y_dim] = j
-                new_data[tuple(indices)] = ma.masked
-            else:
-                # Calculate weighted mean of data points.
-                # Slice out relevant data (this may or may not be a view()
-                # depending on x_indices being a slice or not).
-                if x_dim is not None:
-                    indices[x_dim] = x_indices
-                if y_dim is not None:
-                    indices[y_dim] = y_indices
-                if isinstance(x_indices, tuple) and \
-                        isinstance(y_indices, tuple):
-                    raise RuntimeError('Cannot handle split bounds '
-                                       'in both x and y.')
-                data = src_data[tuple(indices)]
-
-                # Calculate weights based on areas of cropped bounds.
-                weights = area_func(y_bounds, x_bounds)
-
-                # Numpy 1.7 allows the axis keyword arg to be a tuple.
-                # If the version of NumPy is less than 1.7 manipulate the axes
-                # of the data so the x and y dimensions can be flattened.
-                if _NP_VERSION.minor < 7:
-                    if y_dim is not None and x_dim is not None:
-                        flattened_shape = list(data.shape)
-                        if y_dim > x_dim:
-                            data = np.rollaxis(data, y_dim, data.ndim)
-                            data = np.rollaxis(data, x_dim, data.ndim)
-                            del flattened_shape[y_dim]
-                            del flattened_shape[x_dim]
-                        else:
-                            data = np.rollaxis(data, x_dim, data.ndim)
-                            data = np.rollaxis(data, y_dim, data.ndim)
-                            del flattened_shape[x_dim]
-                            del flattened_shape[y_dim]
-                            weights = weights.T
-                        flattened_shape.append(-1)
-                        data = data.reshape(*flattened_shape)
-                    elif y_dim is not None:
-                        flattened_shape = list(data.shape)
-                        del flattened_shape[y_dim]
-                        flattened_shape.append(-1)
-                        data = data.swapaxes(y_dim, -1).reshape(
-                            *flattened_shape)
-                    elif x_dim is not None:
-                        flattened_shape = list(data.shape)
-                        del flattened_shape[x_dim]
-                        flattened_shape.append(-1)
-                        data = data.swapaxes(x_dim, -1).reshape(
-                            *flattened_shape)
-                    weights = weights.ravel()
-                    axis = -1
-                else:
-                    # Transpose weights to match dim ordering in data.
-                    weights_shape_y = weights.shape[0]
-                    weights_shape_x = weights.shape[1]
-                    if x_dim is not None and y_dim is not None and \
-                            x_dim < y_dim:
-                        weights = weights.T
-                    # Broadcast the weights array to allow numpy's ma.average
-                    # to be called.
-                    weights_padded_shape = [1] * data.ndim
-                    axes = []
-                    if y_dim is not None:
-                        weights_padded_shape[y_dim] = weights_shape_y
-                        axes.append(y_dim)
-                    if x_dim is not None:
-                        weights_padded_shape[x_dim] = weights_shape_x
-                        axes.append(x_dim)
-                    # Assign new shape to raise error on copy.
-                    weights.shape = weights_padded_shape
-                    # Broadcast weights to match shape of data.
-                    _, weights = np.broadcast_arrays(data, weights)
-                    # Axes of data over which the weighted mean is calculated.
-                    axis = tuple(axes)
-
-                # Calculate weighted mean taking into account missing data.
-                new_data_pt = _weighted_mean_with_mdtol(
-                    data, weights=weights, axis=axis, mdtol=mdtol)
-
-                # Insert data (and mask) values into new array.
-                if x_dim is not None:
-                    indices[x_dim] = i
-                if y_dim is not None:
-                    indices[y_dim] = j
-                new_data[tuple(indices)] = new_data_pt
-
-    # Remove new mask if original data was not masked
-    # and no values in the new array are masked.
-    if not src_masked and not new_data.mask.any():
-        new_data = new_data.data
+        valid_totals = totals
+    with np.errstate(divide='ignore', invalid='ignore'):
+        new_data = weights.dot(data) / valid_totals
+        new_mask = np.zeros(new_data.shape, dtype=bool)
+        new_mask |= ~valid[:, np.newaxis] | (valid_totals == 0)
+        if src_masked and mdtol < 1:
+            new_mask |= masked_totals / totals > mdtol
+    new_data[new_mask] = 0
+
+    # Restore the original order of the dimensions.
+    order = np.argsort(dims)
+    new_shape = other_shape + grid_shape
+    new_data = new_data.T.reshape(new_shape).transpose(order)
+    new_mask = new_mask.T.reshape(new_shape).transpose(order)
+    for dim in (x_dim, y_dim):
+        if dim >= src_data.ndim:
+            new_data = new_data[..., 0]
+            new_mask = new_mask[..., 0]
+
+    # Only return a masked array if the original data was masked
+    # or any values in the new array are masked.
+    if src_masked:
+        new_data = ma.masked_array(new_data, mask=new_mask,
+                                   fill_value=src_data.fill_value)
+    elif new_mask.any():
+        new_data = ma.masked_array(new_data, mask=new_mask)
 
     return new_data
 
@@ -656,9 +601,27 @@ def regrid_area_weighted_rectilinear_src_and_grid(src_cube, grid_cube,
     Returns:
         A new :class:`iris.cube.Cube` instance.
 
+    """
+    regrid_info = \
+        _regrid_area_weighted_rectilinear_src_and_grid__prepare(src_cube,
+                                                                grid_cube)
+    result = _regrid_area_weighted_rectilinear_src_and_grid__perform(
+        src_cube, regrid_info, mdtol)
+    return result
+
+
+def _regrid_area_weighted_rectilinear_src_and_grid__prepare(
+        src_grid_cube, grid_cube):
+    """
+    First (setup) part of 'regrid_area_weighted_rectilinear_src_and_grid'.
+
+    Check inputs and calculate the sparse matrix of area weights.
+    The 'regrid info' returned can be re-used for any cube defined on
+    the horizontal grid of the source grid cube.
+
     """
     # Get the 1d monotonic (or scalar) src and grid coordinates.
-    src_x, src_y = _get_xy_coords(src_cube)
+    src_x, src_y = _get_xy_coords(src_grid_cube)
     grid_x, grid_y = _get_xy_coords(grid_cube)
 
     # Condition 1: All x and y coordinates must have contiguous bounds to
@@ -676,22 +639,6 @@ def regrid_area_weighted_rectilinear_src_and_grid(src_cube, grid_cube,
                          "and grid cubes must have the same coordinate "
                          "system.")
 
-    # Condition 3: cannot create vector coords from scalars.
-    src_x_dims = src_cube.coord_dims(src_x)
-    src_x_dim = None
-    if src_x_dims:
-        src_x_dim = src_x_dims[0]
-    src_y_dims = src_cube.coord_dims(src_y)
-    src_y_dim = None
-    if src_y_dims:
-        src_y_dim = src_y_dims[0]
-    if src_x_dim is None and grid_x.shape[0] != 1 or \
-            src_y_dim is None and grid_y.shape[0] != 1:
-        raise ValueError('The horizontal grid coordinates of source cube '
-                         'includes scalar coordinates, but the new grid does '
-                         'not. The new grid must not require additional data '
-                         'dimensions to be created.')
-
     # Determine whether to calculate flat or spherical areas.
     # Don't only rely on coord system as it may be None.
     spherical = (isinstance(src_cs, (iris.coord_systems.GeogCS,
@@ -738,13 +685,60 @@ def regrid_area_weighted_rectilinear_src_and_grid(src_cube, grid_cube,
     else:
         area_func = _cartesian_area
 
+    # Calculate the area weights which define the regrid.
+    weights_info = _regrid_area_weighted_weights(src_x_bounds, src_y_bounds,
+                                                 grid_x_bounds, grid_y_bounds,
+                                                 grid_x_decreasing,
+                                                 grid_y_decreasing,
+                                                 area_func, circular)
+
+    return grid_x, grid_y, weights_info
+
+
+def _regrid_area_weighted_rectilinear_src_and_grid__perform(
+        src_cube, regrid_info, mdtol):
+    """
+    Second (regrid) part of 'regrid_area_weighted_rectilinear_src_and_grid'.
+
+    Perform the prepared regrid calculation on a single cube.
+
+    """
+    grid_x, grid_y, weights_info = regrid_info
+    src_x, src_y = _get_xy_coords(src_cube)
+
+    # Condition 3: cannot create vector coords from scalars.
+    src_x_dims = src_cube.coord_dims(src_x)
+    src_x_dim = None
+    if src_x_dims:
+        src_x_dim = src_x_dims[0]
+    src_y_dims = src_cube.coord_dims(src_y)
+    src_y_dim = None
+    if src_y_dims:
+        src_y_dim = src_y_dims[0]
+    if src_x_dim is None and grid_x.shape[0] != 1 or \
+            src_y_dim is None and grid_y.shape[0] != 1:
+        raise ValueError('The horizontal grid coordinates of source cube '
+                         'includes scalar coordinates, but the new grid does '
+                         'not. The new grid must not require additional data '
+                         'dimensions to be created.')
+
     # Calculate new data array for regridded cube.
-    new_data = _regrid_area_weighted_array(src_cube.data, src_x_dim, src_y_dim,
-                                           src_x_bounds, src_y_bounds,
-                                           grid_x_bounds, grid_y_bounds,
-                                           grid_x_decreasing,
-                                           grid_y_decreasing,
-                                           area_func, circular, mdtol)
+    if src_cube.has_lazy_data():
+        # Regrid the data lazily, one slab of horizontal slices at a time.
+        regrid = functools.partial(_regrid_area_weighted_array,
+                                   x_dim=src_x_dim, y_dim=src_y_dim,
+                                   weights_info=weights_info, mdtol=mdtol)
+        dims = []
+        shape = list(src_cube.shape)
+        for dim, size in zip((src_y_dim, src_x_dim), weights_info[2]):
+            if dim is not None:
+                dims.append(dim)
+                shape[dim] = size
+        new_data = biggus.OrthoArrayAdapter(
+            SlabProxy(src_cube.lazy_data(), dims, shape, regrid))
+    else:
+        new_data = _regrid_area_weighted_array(src_cube.data, src_x_dim,
+                                               src_y_dim, weights_info, mdtol)
 
     # Wrap up the data as a Cube.
     # Create 2d meshgrids as required by _create_cube func.
@@ -95,14 +95,16 @@ FORMAT_AGENT.add_spec(FormatSpecification('NetCDF',
                                           MagicNumber(4),
                                           0x43444601,
                                           netcdf.load_cubes,
-                                          priority=5))
+                                          priority=5,
+                                          constraint_aware_handler=True))
 
 
 FORMAT_AGENT.add_spec(FormatSpecification('NetCDF 64 bit offset format',
                                           MagicNumber(4),
                                           0x43444602,
                                           netcdf.load_cubes,
-                                          priority=5))
+                                          priority=5,
+                                          constraint_aware_handler=True))
 
 
 # This covers both v4 and v4 classic model.
@@ -110,7 +112,8 @@ FORMAT_AGENT.add_spec(FormatSpecification('NetCDF_v4',
                                           MagicNumber(8),
                                           0x894844460D0A1A0A,
                                           netcdf.load_cubes,
-                                          priority=5))
+                                          priority=5,
+                                          constraint_aware_handler=True))
 
 
 _nc_dap = FormatSpecification('NetCDF OPeNDAP',
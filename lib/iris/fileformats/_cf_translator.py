@@ -0,0 +1,356 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Translates a CF-netCDF data variable into a cube by applying the rules of
+the "fc_rules_cf" PyKE rule base directly in Python.
+
+The rules are applied in the order in which they appear in the rule base,
+which is the order in which the PyKE forward-chaining engine runs them, so
+both give the same cube. The building of coordinates and coordinate
+systems is shared with the rule base, through the functions in its
+compiled "fc_extras" section.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import collections
+
+import iris.fileformats._pyke_rules.compiled_krb.fc_rules_cf_fc as _rules
+import iris.fileformats.pp as pp
+
+
+#: The name of the only rule base which the translator applies.
+RULE_BASE = 'fc_rules_cf'
+
+
+def _build_coordinate_system(engine, cf_grid_var):
+    return _rules.build_coordinate_system(cf_grid_var)
+
+
+# Each of the "fc_provides_grid_mapping_*" rules, as the rule name, the
+# CF grid mapping name, any further check of the grid mapping variable,
+# the builder of the coordinate system and the kind of coordinate system
+# that it provides.
+_GRID_MAPPING_RULES = [
+    ('fc_provides_grid_mapping_rotated_latitude_longitude',
+     _rules.CF_GRID_MAPPING_ROTATED_LAT_LON, None,
+     _rules.build_rotated_coordinate_system, 'rotated_latitude_longitude'),
+    ('fc_provides_grid_mapping_latitude_longitude',
+     _rules.CF_GRID_MAPPING_LAT_LON, None,
+     _build_coordinate_system, 'latitude_longitude'),
+    ('fc_provides_grid_mapping_transverse_mercator',
+     _rules.CF_GRID_MAPPING_TRANSVERSE, None,
+     _rules.build_transverse_mercator_coordinate_system,
+     'transverse_mercator'),
+    ('fc_provides_grid_mapping_mercator',
+     _rules.CF_GRID_MAPPING_MERCATOR,
+     _rules.has_supported_mercator_parameters,
+     _rules.build_mercator_coordinate_system, 'mercator'),
+    ('fc_provides_grid_mapping_stereographic',
+     _rules.CF_GRID_MAPPING_STEREO,
+     _rules.has_supported_stereographic_parameters,
+     _rules.build_stereographic_coordinate_system, 'stereographic'),
+    ('fc_provides_grid_mapping_lambert_conformal',
+     _rules.CF_GRID_MAPPING_LAMBERT_CONFORMAL, None,
+     _rules.build_lambert_conformal_coordinate_system, 'lambert_conformal'),
+]
+
+
+# Each of the "fc_provides_coordinate_*" rules, as the rule name, the
+# classification of the coordinate and the kind of coordinate that it
+# provides.
+_COORDINATE_RULES = [
+    ('fc_provides_coordinate_latitude', _rules.is_latitude, 'latitude'),
+    ('fc_provides_coordinate_longitude', _rules.is_longitude, 'longitude'),
+    ('fc_provides_projection_x_coordinate',
+     _rules.is_projection_x_coordinate, 'projection_x_coordinate'),
+    ('fc_provides_projection_y_coordinate',
+     _rules.is_projection_y_coordinate, 'projection_y_coordinate'),
+    ('fc_provides_coordinate_time', _rules.is_time, 'time'),
+    ('fc_provides_coordinate_time_period', _rules.is_time_period,
+     'time_period'),
+]
+
+
+def _is_other(engine, cf_name):
+    return not (_rules.is_time(engine, cf_name) or
+                _rules.is_time_period(engine, cf_name) or
+                _rules.is_latitude(engine, cf_name) or
+                _rules.is_longitude(engine, cf_name))
+
+
+def _all_of(*checks):
+    def check(engine, cf_name):
+        return all(each(engine, cf_name) for each in checks)
+    return check
+
+
+def _not(check):
+    return lambda engine, cf_name: not check(engine, cf_name)
+
+
+# Each of the "fc_build_auxiliary_coordinate*" rules, as the rule name,
+# the classification of the auxiliary coordinate and the name of the
+# coordinate that it builds.
+_AUXILIARY_COORDINATE_RULES = [
+    ('fc_build_auxiliary_coordinate_time', _rules.is_time, None),
+    ('fc_build_auxiliary_coordinate_time_period', _rules.is_time_period,
+     None),
+    ('fc_build_auxiliary_coordinate_latitude',
+     _all_of(_rules.is_latitude, _not(_rules.is_rotated_latitude)),
+     _rules.CF_VALUE_STD_NAME_LAT),
+    ('fc_build_auxiliary_coordinate_latitude_rotated',
+     _all_of(_rules.is_latitude, _rules.is_rotated_latitude),
+     _rules.CF_VALUE_STD_NAME_GRID_LAT),
+    ('fc_build_auxiliary_coordinate_longitude',
+     _all_of(_rules.is_longitude, _not(_rules.is_rotated_longitude)),
+     _rules.CF_VALUE_STD_NAME_LON),
+    ('fc_build_auxiliary_coordinate_longitude_rotated',
+     _all_of(_rules.is_longitude, _rules.is_rotated_longitude),
+     _rules.CF_VALUE_STD_NAME_GRID_LON),
+    ('fc_build_auxiliary_coordinate', _is_other, None),
+]
+
+
+# Stands for the absence of both lat/lon coordinate systems, as required
+# by the "fc_build_coordinate_*_nocs" rules.
+_NO_LAT_LON = object()
+
+# Each of the "fc_build_coordinate_*" rules, as the rule name, the kind of
+# coordinate, the kind of coordinate system that must be provided, any
+# further check of the coordinate, the name of the coordinate that it
+# builds and whether the coordinate is given the coordinate system.
+_COORDINATE_BUILD_RULES = [
+    ('fc_build_coordinate_latitude', 'latitude', 'latitude_longitude',
+     _not(_rules.is_rotated_latitude), _rules.CF_VALUE_STD_NAME_LAT, True),
+    ('fc_build_coordinate_latitude_rotated', 'latitude',
+     'rotated_latitude_longitude', _rules.is_rotated_latitude,
+     _rules.CF_VALUE_STD_NAME_GRID_LAT, True),
+    ('fc_build_coordinate_longitude', 'longitude', 'latitude_longitude',
+     _not(_rules.is_rotated_longitude), _rules.CF_VALUE_STD_NAME_LON, True),
+    ('fc_build_coordinate_longitude_rotated', 'longitude',
+     'rotated_latitude_longitude', _rules.is_rotated_longitude,
+     _rules.CF_VALUE_STD_NAME_GRID_LON, True),
+    ('fc_build_coordinate_latitude_nocs', 'latitude', _NO_LAT_LON, None,
+     _rules.CF_VALUE_STD_NAME_LAT, False),
+    ('fc_build_coordinate_longitude_nocs', 'longitude', _NO_LAT_LON, None,
+     _rules.CF_VALUE_STD_NAME_LON, False),
+    ('fc_build_coordinate_projection_x_transverse_mercator',
+     'projection_x_coordinate', 'transverse_mercator', None,
+     _rules.CF_VALUE_STD_NAME_PROJ_X, True),
+    ('fc_build_coordinate_projection_y_transverse_mercator',
+     'projection_y_coordinate', 'transverse_mercator', None,
+     _rules.CF_VALUE_STD_NAME_PROJ_Y, True),
+    ('fc_build_coordinate_projection_x_lambert_conformal',
+     'projection_x_coordinate', 'lambert_conformal', None,
+     _rules.CF_VALUE_STD_NAME_PROJ_X, True),
+    ('fc_build_coordinate_projection_y_lambert_conformal',
+     'projection_y_coordinate', 'lambert_conformal', None,
+     _rules.CF_VALUE_STD_NAME_PROJ_Y, True),
+    ('fc_build_coordinate_projection_x_mercator',
+     'projection_x_coordinate', 'mercator', None,
+     _rules.CF_VALUE_STD_NAME_PROJ_X, True),
+    ('fc_build_coordinate_projection_y_mercator',
+     'projection_y_coordinate', 'mercator', None,
+     _rules.CF_VALUE_STD_NAME_PROJ_Y, True),
+    ('fc_build_coordinate_projection_x_stereographic',
+     'projection_x_coordinate', 'stereographic', None,
+     _rules.CF_VALUE_STD_NAME_PROJ_X, True),
+    ('fc_build_coordinate_projection_y_stereographic',
+     'projection_y_coordinate', 'stereographic', None,
+     _rules.CF_VALUE_STD_NAME_PROJ_Y, True),
+    ('fc_build_coordinate_time', 'time', None, None, None, False),
+    ('fc_build_coordinate_time_period', 'time_period', None, None, None,
+     False),
+]
+
+
+# Each of the "fc_formula_type_*" rules, as the rule name and the standard
+# name of the formula root variable that it recognises.
+_FORMULA_TYPE_RULES = [
+    ('fc_formula_type_atmosphere_hybrid_height_coordinate',
+     'atmosphere_hybrid_height_coordinate'),
+    ('fc_formula_type_atmosphere_hybrid_sigma_pressure_coordinate',
+     'atmosphere_hybrid_sigma_pressure_coordinate'),
+    ('fc_formula_type_ocean_sigma_z_coordinate', 'ocean_sigma_z_coordinate'),
+    ('fc_formula_type_ocean_sigma_coordinate', 'ocean_sigma_coordinate'),
+    ('fc_formula_type_ocean_s_coordinate', 'ocean_s_coordinate'),
+    ('fc_formula_type_ocean_s_coordinate_g1', 'ocean_s_coordinate_g1'),
+    ('fc_formula_type_ocean_s_coordinate_g2', 'ocean_s_coordinate_g2'),
+]
+
+
+class Engine(object):
+    """
+    A drop-in replacement for the PyKE knowledge engine used by
+    :mod:`iris.fileformats.netcdf`, which applies the "fc_rules_cf" rules
+    directly in Python.
+
+    As with the PyKE engine, the caller resets the engine, sets the
+    ``cf_var``, ``cube``, ``provides``, ``requires``, ``rule_triggered`` and
+    ``filename`` attributes, asserts the case specific facts of the data
+    variable and then activates the rule base.
+
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget the case specific facts of the previous data variable."""
+        self.facts = collections.OrderedDict()
+
+    def add_case_specific_fact(self, kb_name, fact_name, arguments):
+        """
+        Assert a case specific fact, ignoring any repeats as PyKE does.
+
+        The name of the fact base is accepted for compatibility with the
+        PyKE engine, but is not used.
+
+        """
+        facts = self.facts.setdefault(fact_name, [])
+        if arguments not in facts:
+            facts.append(arguments)
+
+    def activate(self, rule_base):
+        """Build the cube from the case specific facts."""
+        if rule_base != RULE_BASE:
+            msg = 'Unknown rule base {!r}: expected {!r}.'
+            raise ValueError(msg.format(rule_base, RULE_BASE))
+        _translate(self)
+
+    def print_stats(self):
+        """Print the number of each kind of case specific fact."""
+        for fact_name, facts in self.facts.items():
+            print('%s: %d facts' % (fact_name, len(facts)))
+
+
+def _translate(engine):
+    """Apply the "fc_rules_cf" rules to the case specific facts."""
+    cf_var = engine.cf_var
+    cf_group = cf_var.cf_group
+    facts = engine.facts
+    rule_triggered = engine.rule_triggered.add
+
+    # Add standard meta-data to the cube.
+    _rules.build_cube_metadata(engine)
+    rule_triggered('fc_default')
+
+    # Build the coordinate system of each supported grid mapping.
+    coord_system_kinds = []
+    for name, mapping_name, check, build, kind in _GRID_MAPPING_RULES:
+        for grid_mapping, in facts.get('grid_mapping', []):
+            if (_rules.is_grid_mapping(engine, grid_mapping, mapping_name) and
+                    (check is None or check(engine, grid_mapping))):
+                cf_grid_var = cf_group.grid_mappings[grid_mapping]
+                coord_system = build(engine, cf_grid_var)
+                engine.provides['coordinate_system'] = coord_system
+                if kind not in coord_system_kinds:
+                    coord_system_kinds.append(kind)
+                rule_triggered(name)
+
+    # Classify the coordinates.
+    coordinate_kinds = []
+    for name, check, kind in _COORDINATE_RULES:
+        for coordinate, in facts.get('coordinate', []):
+            if check(engine, coordinate):
+                if (kind, coordinate) not in coordinate_kinds:
+                    coordinate_kinds.append((kind, coordinate))
+                rule_triggered(name)
+
+    # Add the label coordinates.
+    for coordinate, in facts.get('label', []):
+        cf_coord_var = cf_group.labels[coordinate]
+        _rules.build_auxiliary_coordinate(engine, cf_coord_var)
+        rule_triggered('fc_build_label_coordinate')
+
+    # Add the auxiliary coordinates.
+    for name, check, coord_name in _AUXILIARY_COORDINATE_RULES:
+        for coordinate, in facts.get('auxiliary_coordinate', []):
+            if check(engine, coordinate):
+                cf_coord_var = cf_group.auxiliary_coordinates[coordinate]
+                _rules.build_auxiliary_coordinate(engine, cf_coord_var,
+                                                  coord_name=coord_name)
+                rule_triggered(name)
+
+    # Add the cell measures.
+    for coordinate, in facts.get('cell_measure', []):
+        cf_coord_var = cf_group.cell_measures[coordinate]
+        _rules.build_cell_measures(engine, cf_coord_var)
+        rule_triggered('fc_build_cell_measure')
+
+    # Add the classified coordinates.
+    no_lat_lon = not ('latitude_longitude' in coord_system_kinds or
+                      'rotated_latitude_longitude' in coord_system_kinds)
+    for (name, kind, coord_system_kind, check, coord_name,
+            with_coord_system) in _COORDINATE_BUILD_RULES:
+        for coordinate_kind, coordinate in coordinate_kinds:
+            if coordinate_kind != kind:
+                continue
+            if coord_system_kind is _NO_LAT_LON:
+                if not no_lat_lon:
+                    continue
+            elif (coord_system_kind is not None and
+                    coord_system_kind not in coord_system_kinds):
+                continue
+            if check is not None and not check(engine, coordinate):
+                continue
+            coord_system = None
+            if with_coord_system:
+                coord_system = engine.provides['coordinate_system']
+            cf_coord_var = cf_group.coordinates[coordinate]
+            _rules.build_dimension_coordinate(engine, cf_coord_var,
+                                              coord_name=coord_name,
+                                              coord_system=coord_system)
+            rule_triggered(name)
+
+    # Add the unclassified coordinates.
+    classified = set(coordinate for _, coordinate in coordinate_kinds)
+    for coordinate, in facts.get('coordinate', []):
+        if coordinate not in classified:
+            cf_coord_var = cf_group.coordinates[coordinate]
+            _rules.build_dimension_coordinate(engine, cf_coord_var)
+            rule_triggered('fc_default_coordinate')
+
+    # Add the STASH code and the process flags to the cube attributes.
+    if (hasattr(cf_var, 'ukmo__um_stash_source') or
+            hasattr(cf_var, 'um_stash_source')):
+        attr_value = (getattr(cf_var, 'um_stash_source', None) or
+                      getattr(cf_var, 'ukmo__um_stash_source'))
+        engine.cube.attributes['STASH'] = pp.STASH.from_msi(attr_value)
+        rule_triggered('fc_attribute_ukmo__um_stash_source')
+    if hasattr(cf_var, 'ukmo__process_flags'):
+        attr_value = cf_var.ukmo__process_flags
+        engine.cube.attributes['ukmo__process_flags'] = tuple(
+            [x.replace('_', ' ') for x in attr_value.split(' ')])
+        rule_triggered('fc_attribute_ukmo__process_flags')
+
+    # Identify any dimensionless vertical coordinate, and its terms.
+    formula_roots = facts.get('formula_root', [])
+    for name, formula_type in _FORMULA_TYPE_RULES:
+        for coordinate, in formula_roots:
+            standard_name = getattr(cf_group[coordinate], 'standard_name')
+            if standard_name == formula_type:
+                engine.requires['formula_type'] = formula_type
+                rule_triggered(name)
+    for coordinate, in formula_roots:
+        for var_name, root, term in facts.get('formula_term', []):
+            if root == coordinate:
+                engine.requires.setdefault('formula_terms', {})[term] = \
+                    var_name
+                rule_triggered('fc_formula_terms')
@@ -28,6 +28,7 @@ import warnings
 import numpy as np
 
 from iris.exceptions import NotYetImplementedError
+from iris.fileformats import _header_cache
 from iris.fileformats._ff_cross_references import STASH_TRANS
 from . import pp
 
@@ -460,7 +461,7 @@ class FF2PP(object):
     """
 
     def __init__(self, filename, read_data=False,
-                 word_depth=DEFAULT_FF_WORD_DEPTH):
+                 word_depth=DEFAULT_FF_WORD_DEPTH, _table_filter=None):
         """
         Create a FieldsFile to Post Process instance that returns a generator
         of PPFields contained within the FieldsFile.
@@ -495,6 +496,7 @@ class FF2PP(object):
         self._word_depth = word_depth
         self._filename = filename
         self._read_data = read_data
+        self._table_filter = _table_filter
 
     def _payload(self, field):
         """Calculate the payload data depth (in bytes) and type."""
@@ -690,28 +692,37 @@ class FF2PP(object):
 
             grid = self._ff_header.grid()
 
-            # Process each FF LOOKUP table entry.
-            while table_count:
-                table_count -= 1
-                # Move file pointer to the start of the current FF LOOKUP
-                # table entry.
+            def read_lookup_table():
+                # Read and decode the entire FF LOOKUP table in one go.
                 ff_file_seek(table_offset, os.SEEK_SET)
+                table_dtype = pp._header_table_dtype(
+                    word_depth=self._word_depth, itemsize=table_entry_depth)
+                headers = np.fromfile(ff_file, dtype=table_dtype,
+                                      count=max(table_count, 0))
+                # Discard any entries after the end of the valid FF LOOKUP
+                # table entries.
+                terminated = (headers['longs'][:, 0] ==
+                              _FF_LOOKUP_TABLE_TERMINATE)
+                if np.any(terminated):
+                    headers = headers[:np.argmax(terminated)]
+                return dict(headers=headers)
+
+            kind = 'ff-{}'.format(self._word_depth)
+            headers = _header_cache.cached_scan(
+                self._ff_header.ff_filename, kind,
+                read_lookup_table)['headers']
+
+            table_rows = range(len(headers))
+            # Boundary packed fields are expanded over their levels, so
+            # their LOOKUP table entries cannot be filtered up front.
+            if self._table_filter is not None and not is_boundary_packed:
+                table = headers.view(pp._header_names_dtype(
+                    word_depth=self._word_depth, itemsize=table_entry_depth))
+                table_rows = np.flatnonzero(self._table_filter(table))
 
-                # Read the current PP header entry from the FF LOOKUP table.
-                header_longs = np.fromfile(
-                    ff_file, dtype='>i{0}'.format(self._word_depth),
-                    count=pp.NUM_LONG_HEADERS)
-                # Check whether the current FF LOOKUP table entry is valid.
-                if header_longs[0] == _FF_LOOKUP_TABLE_TERMINATE:
-                    # There are no more FF LOOKUP table entries to read.
-                    break
-                header_floats = np.fromfile(
-                    ff_file, dtype='>f{0}'.format(self._word_depth),
-                    count=pp.NUM_FLOAT_HEADERS)
-                header = tuple(header_longs) + tuple(header_floats)
-
-                # Calculate next FF LOOKUP table entry.
-                table_offset += table_entry_depth
+            # Process each FF LOOKUP table entry.
+            for table_row in table_rows:
+                header = pp._header_from_table(headers, table_row)
 
                 # Construct a PPField object and populate using the header_data
                 # read from the current FF LOOKUP table.
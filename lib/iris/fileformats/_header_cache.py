@@ -0,0 +1,136 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Provides a persistent cache of the header tables scanned from data files.
+
+The cache is only used when :data:`iris.config.HEADER_CACHE_DIR` is set.
+Each entry is keyed by the absolute path of the scanned file, and records
+the modification time and size of that file, so that an entry is never
+used once its file has changed.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import hashlib
+import os
+import tempfile
+import warnings
+import zipfile
+
+import numpy as np
+
+import iris.config
+
+
+# The name of the array which identifies the file of a cache entry.
+_SIGNATURE = '_signature'
+
+
+def _signature(filename):
+    """
+    Return an array which identifies the current state of a file, from its
+    absolute path, modification time and size.
+
+    """
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    return np.array([path, repr(stat.st_mtime), str(stat.st_size)])
+
+
+def _entry_path(cache_dir, signature, kind):
+    """Return the path of the cache entry for a file and kind of scan."""
+    key = '{}\0{}'.format(kind, signature[0]).encode('utf-8')
+    return os.path.join(cache_dir, hashlib.sha1(key).hexdigest() + '.npz')
+
+
+def _read_entry(entry_path, signature):
+    """
+    Return the arrays of a cache entry, or None if there is no valid entry
+    for the file with the given signature.
+
+    """
+    try:
+        entry = np.load(entry_path)
+        try:
+            arrays = dict((name, entry[name]) for name in entry.files)
+        finally:
+            entry.close()
+    except (IOError, OSError, ValueError, zipfile.BadZipfile):
+        return None
+    cached_signature = arrays.pop(_SIGNATURE, None)
+    if cached_signature is None or \
+            not np.array_equal(cached_signature, signature):
+        return None
+    return arrays
+
+
+def _write_entry(entry_path, signature, arrays):
+    """
+    Write a cache entry, replacing any existing entry as a single operation
+    so that concurrent readers never see a partially written entry.
+
+    """
+    cache_dir = os.path.dirname(entry_path)
+    handle, temp_path = tempfile.mkstemp(dir=cache_dir, suffix='.npz')
+    try:
+        with os.fdopen(handle, 'wb') as temp_file:
+            np.savez(temp_file, **dict(arrays, **{_SIGNATURE: signature}))
+        if os.name == 'nt' and os.path.exists(entry_path):
+            os.remove(entry_path)
+        os.rename(temp_path, entry_path)
+    except (IOError, OSError) as error:
+        msg = 'Unable to write header cache entry {!r}: {}'
+        warnings.warn(msg.format(entry_path, error))
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def cached_scan(filename, kind, scan):
+    """
+    Return the arrays produced by scanning the headers of a file, using the
+    header cache where possible.
+
+    Args:
+
+    * filename (string):
+        The name of the scanned file.
+    * kind (string):
+        Identifies the type of scan, so that different scans of the same
+        file have separate cache entries.
+    * scan (callable):
+        A function of no arguments, which scans the file and returns a
+        dictionary of NumPy arrays. It is only called when there is no
+        valid cache entry.
+
+    Returns:
+        A dictionary of NumPy arrays.
+
+    """
+    cache_dir = iris.config.HEADER_CACHE_DIR
+    if cache_dir is None:
+        return scan()
+    # Identify the file before it is scanned, so that any modification
+    # made while scanning invalidates the entry.
+    signature = _signature(filename)
+    entry_path = _entry_path(cache_dir, signature, kind)
+    arrays = _read_entry(entry_path, signature)
+    if arrays is None:
+        arrays = scan()
+        _write_entry(entry_path, signature, arrays)
+    return arrays
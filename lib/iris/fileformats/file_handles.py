@@ -0,0 +1,425 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Provides pools of open file handles, which are shared by the data proxies
+of the file formats so that each read of a file's data does not have to
+open the file again.
+
+The number of idle handles kept open by each pool defaults to the
+``file_handle_pool_size`` option in the ``Resources`` section of the Iris
+``site.cfg``, or 16 if that is not set. It can also be changed at any time,
+e.g.::
+
+    iris.fileformats.file_handles.NETCDF_DATASETS.maxsize = 64
+
+Also provides a cache of the decompressed chunks of chunked netCDF
+variables, which is disabled unless the ``netcdf_chunk_cache_size`` option
+gives it a size in bytes, or it is given one at any time, e.g.::
+
+    iris.fileformats.file_handles.NETCDF_CHUNKS.maxbytes = 2 ** 26
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+import collections
+import contextlib
+import itertools
+import numbers
+import os
+import threading
+
+import netCDF4
+import numpy as np
+import numpy.ma as ma
+
+import iris.config
+
+
+def _open_binary_file(path):
+    return open(path, 'rb')
+
+
+def _open_netcdf_dataset(path):
+    return netCDF4.Dataset(path, mode='r')
+
+
+class FileHandlePool(object):
+    """
+    A bounded, thread-safe pool of open file handles, keyed by path.
+
+    A handle is checked out of the pool for the duration of each use, so it
+    is never shared between threads. When it is returned, the pool keeps it
+    open for reuse, closing the least recently used handles once more than
+    :attr:`maxsize` are idle. A handle is not reused once its file has been
+    modified.
+
+    """
+    def __init__(self, opener, maxsize=None):
+        """
+        Args:
+
+        * opener (callable):
+            A function which opens the file at a given path, and returns a
+            handle with a `close` method.
+
+        Kwargs:
+
+        * maxsize (int):
+            The maximum number of idle handles to keep open. Defaults to
+            :data:`iris.config.FILE_HANDLE_POOL_SIZE`.
+
+        """
+        self._opener = opener
+        self._lock = threading.Lock()
+        # Lists of the idle (signature, handle) pairs for each path, with
+        # the most recently used path last.
+        self._idle = collections.OrderedDict()
+        self._size = 0
+        if maxsize is None:
+            maxsize = iris.config.FILE_HANDLE_POOL_SIZE
+        self._maxsize = maxsize
+        #: The number of checkouts which reused an open handle.
+        self.hits = 0
+        #: The number of checkouts which had to open the file.
+        self.misses = 0
+
+    def __repr__(self):
+        fmt = ('<{self.__class__.__name__} maxsize={self.maxsize} '
+               'idle={self._size} hits={self.hits} misses={self.misses}>')
+        return fmt.format(self=self)
+
+    @property
+    def maxsize(self):
+        """The maximum number of idle handles to keep open."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        with self._lock:
+            self._maxsize = maxsize
+            evicted = self._evict()
+        self._close(evicted)
+
+    @property
+    def size(self):
+        """The number of idle handles currently open."""
+        return self._size
+
+    @contextlib.contextmanager
+    def checkout(self, path):
+        """
+        A context manager which provides an open handle for the file at
+        the given path, returning it to the pool on exit.
+
+        If the context exits with an exception, the handle is closed
+        rather than returned to the pool.
+
+        """
+        path = os.path.abspath(path)
+        try:
+            signature = _signature(path)
+        except OSError:
+            # Let the opener raise the appropriate error.
+            signature = None
+        handle = None
+        stale = []
+        if signature is not None:
+            with self._lock:
+                idle = self._idle.get(path, [])
+                while idle and handle is None:
+                    handle_signature, handle = idle.pop()
+                    self._size -= 1
+                    if handle_signature != signature:
+                        stale.append(handle)
+                        handle = None
+                if not idle:
+                    self._idle.pop(path, None)
+                if handle is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+        self._close(stale)
+
+        if handle is None:
+            handle = self._opener(path)
+        reusable = False
+        try:
+            yield handle
+            reusable = signature is not None
+        finally:
+            if reusable:
+                self._release(path, signature, handle)
+            else:
+                handle.close()
+
+    def discard(self, path):
+        """Close all of the idle handles for the file at the given path."""
+        with self._lock:
+            idle = self._idle.pop(os.path.abspath(path), [])
+            self._size -= len(idle)
+        self._close(handle for _, handle in idle)
+
+    def clear(self):
+        """Close all of the idle handles, and reset the statistics."""
+        with self._lock:
+            idle = list(self._idle.values())
+            self._idle.clear()
+            self._size = 0
+            self.hits = self.misses = 0
+        self._close(handle for handles in idle for _, handle in handles)
+
+    def _release(self, path, signature, handle):
+        with self._lock:
+            # Re-insert the path to mark it as the most recently used.
+            idle = self._idle.pop(path, [])
+            idle.append((signature, handle))
+            self._idle[path] = idle
+            self._size += 1
+            evicted = self._evict()
+        self._close(evicted)
+
+    def _evict(self):
+        # Remove the least recently used idle handles from the pool until
+        # there are at most maxsize. Must be called with the lock held.
+        evicted = []
+        while self._size > max(self._maxsize, 0):
+            path, idle = next(iter(self._idle.items()))
+            _, handle = idle.pop(0)
+            if not idle:
+                del self._idle[path]
+            self._size -= 1
+            evicted.append(handle)
+        return evicted
+
+    @staticmethod
+    def _close(handles):
+        for handle in handles:
+            handle.close()
+
+
+def _signature(path):
+    """Return the modification time and size of a file."""
+    stat = os.stat(path)
+    return stat.st_mtime, stat.st_size
+
+
+class ChunkCache(object):
+    """
+    A bounded, thread-safe cache of the decompressed chunks of chunked
+    netCDF variables, keyed by file, variable and chunk.
+
+    Each read of a chunked variable is made one whole chunk at a time,
+    along the variable's on-disk chunking, and assembled from the chunks.
+    So a chunk which is needed by several reads, e.g. because it straddles
+    the slabs of a streamed aggregation, is only decompressed once while it
+    stays in the cache. The least recently used chunks are dropped once
+    they take more than :attr:`maxbytes`. A chunk is not reused once its
+    file has been modified.
+
+    Reads which would need more chunks than fit in the cache, and reads of
+    contiguous variables, are made directly.
+
+    """
+    def __init__(self, maxbytes=None):
+        """
+        Kwargs:
+
+        * maxbytes (int):
+            The maximum number of bytes of decompressed data to keep.
+            Defaults to :data:`iris.config.NETCDF_CHUNK_CACHE_SIZE`.
+
+        """
+        self._lock = threading.Lock()
+        self._chunks = collections.OrderedDict()
+        self._nbytes = 0
+        if maxbytes is None:
+            maxbytes = iris.config.NETCDF_CHUNK_CACHE_SIZE
+        self._maxbytes = maxbytes
+        #: The number of chunks which were found in the cache.
+        self.hits = 0
+        #: The number of chunks which had to be read.
+        self.misses = 0
+
+    def __repr__(self):
+        fmt = ('<{self.__class__.__name__} maxbytes={self.maxbytes} '
+               'nbytes={self._nbytes} hits={self.hits} '
+               'misses={self.misses}>')
+        return fmt.format(self=self)
+
+    @property
+    def maxbytes(self):
+        """The maximum number of bytes of decompressed data to keep."""
+        return self._maxbytes
+
+    @maxbytes.setter
+    def maxbytes(self, maxbytes):
+        with self._lock:
+            self._maxbytes = maxbytes
+            self._evict()
+
+    @property
+    def nbytes(self):
+        """The number of bytes of decompressed data currently kept."""
+        return self._nbytes
+
+    def read(self, path, variable, keys):
+        """
+        Return the data of the open netCDF variable, from the file at the
+        given path, which is selected by the orthogonal index keys.
+
+        """
+        indices = None
+        chunking = None
+        if self._maxbytes > 0:
+            chunking = variable.chunking()
+        if chunking is not None and chunking != 'contiguous':
+            indices = _orthogonal_indices(keys, variable.shape)
+        if indices is None:
+            return variable[keys]
+
+        indices, dropped = indices
+        chunk_ids = [np.unique(index // size)
+                     for index, size in zip(indices, chunking)]
+        n_chunks = np.prod([len(ids) for ids in chunk_ids])
+        chunk_nbytes = np.prod(chunking) * variable.dtype.itemsize
+        if (all(dropped) or n_chunks == 0 or
+                n_chunks * chunk_nbytes > self._maxbytes):
+            return variable[keys]
+
+        path = os.path.abspath(path)
+        try:
+            signature = _signature(path)
+        except OSError:
+            return variable[keys]
+
+        data = mask = fill_value = None
+        shape = tuple(len(index) for index in indices)
+        for chunk_id in itertools.product(*chunk_ids):
+            key = (path, signature, variable.name, chunk_id)
+            chunk = self._chunk(key, variable, chunking)
+            selected, within = [], []
+            for index, size, i in zip(indices, chunking, chunk_id):
+                in_chunk = index // size == i
+                selected.append(np.flatnonzero(in_chunk))
+                within.append(index[in_chunk] - i * size)
+            if data is None:
+                data = np.empty(shape, dtype=chunk.dtype)
+                mask = np.zeros(shape, dtype=bool)
+            data[np.ix_(*selected)] = ma.getdata(chunk)[np.ix_(*within)]
+            if ma.isMaskedArray(chunk):
+                mask[np.ix_(*selected)] = ma.getmaskarray(chunk)[
+                    np.ix_(*within)]
+                fill_value = chunk.fill_value
+
+        # Remove the dimensions which were indexed by an integer.
+        keep = tuple(0 if drop else slice(None) for drop in dropped)
+        data = data[keep]
+        mask = mask[keep]
+        if mask.any():
+            data = ma.masked_array(data, mask=mask, fill_value=fill_value)
+        return data
+
+    def clear(self):
+        """Drop all of the chunks, and reset the statistics."""
+        with self._lock:
+            self._chunks.clear()
+            self._nbytes = 0
+            self.hits = self.misses = 0
+
+    def _chunk(self, key, variable, chunking):
+        # Return the decompressed chunk, reading it if it isn't cached.
+        with self._lock:
+            chunk = self._chunks.pop(key, None)
+            if chunk is not None:
+                # Re-insert the chunk to mark it as the most recently used.
+                self._chunks[key] = chunk
+                self.hits += 1
+                return chunk
+            self.misses += 1
+        chunk_keys = tuple(slice(i * size, (i + 1) * size)
+                           for i, size in zip(key[-1], chunking))
+        chunk = variable[chunk_keys]
+        with self._lock:
+            if key not in self._chunks:
+                self._chunks[key] = chunk
+                self._nbytes += chunk.nbytes
+                self._evict()
+        return chunk
+
+    def _evict(self):
+        # Drop the least recently used chunks until they take at most
+        # maxbytes. Must be called with the lock held.
+        while self._chunks and self._nbytes > max(self._maxbytes, 0):
+            _, chunk = self._chunks.popitem(last=False)
+            self._nbytes -= chunk.nbytes
+
+
+def _orthogonal_indices(keys, shape):
+    """
+    Return the integer indices which the orthogonal index keys select
+    along each dimension of an array of the given shape, with whether each
+    dimension is removed by an integer key, or None if the keys can't be
+    interpreted.
+
+    """
+    if not isinstance(keys, tuple):
+        keys = (keys,)
+    n_ellipsis = sum(key is Ellipsis for key in keys)
+    if n_ellipsis > 1 or len(keys) - n_ellipsis > len(shape):
+        return None
+    if n_ellipsis:
+        i = [key is Ellipsis for key in keys].index(True)
+        fill = (slice(None),) * (len(shape) - len(keys) + 1)
+        keys = keys[:i] + fill + keys[i + 1:]
+    keys = keys + (slice(None),) * (len(shape) - len(keys))
+
+    indices = []
+    dropped = []
+    for key, size in zip(keys, shape):
+        drop = False
+        if isinstance(key, slice):
+            index = np.arange(size)[key]
+        elif (isinstance(key, (numbers.Integral, np.integer)) and
+                not isinstance(key, (bool, np.bool_))):
+            index = np.array([key])
+            drop = True
+        else:
+            index = np.asarray(key)
+            if index.dtype == bool and index.shape == (size,):
+                index = np.flatnonzero(index)
+            elif index.dtype.kind not in 'iu' or index.ndim != 1:
+                return None
+        index = np.where(index < 0, index + size, index)
+        if np.any((index < 0) | (index >= size)):
+            return None
+        indices.append(index)
+        dropped.append(drop)
+    return indices, dropped
+
+
+#: The pool of binary files, as used by the PP, FieldsFile and GRIB loaders.
+BINARY_FILES = FileHandlePool(_open_binary_file)
+
+#: The pool of :class:`netCDF4.Dataset` instances, as used by the netCDF
+#: loader.
+NETCDF_DATASETS = FileHandlePool(_open_netcdf_dataset)
+
+#: The cache of the decompressed chunks of chunked netCDF variables, as used
+#: by the netCDF loader.
+NETCDF_CHUNKS = ChunkCache()
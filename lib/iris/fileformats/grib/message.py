@@ -31,6 +31,7 @@ import gribapi
 import numpy as np
 
 from iris.exceptions import TranslationError
+from iris.fileformats import file_handles
 
 
 class _OpenFileRef(object):
@@ -279,7 +280,7 @@ class _RawGribMessage(object):
 
     @staticmethod
     def from_file_offset(filename, offset):
-        with open(filename, 'rb') as f:
+        with file_handles.BINARY_FILES.checkout(filename) as f:
             f.seek(offset)
             message_id = gribapi.grib_new_from_file(f)
             if message_id is None:
@@ -29,6 +29,7 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
 import collections
+import operator
 import os
 import os.path
 import re
@@ -46,13 +47,18 @@ import iris.analysis
 from iris.aux_factory import HybridHeightFactory, HybridPressureFactory, \
     OceanSigmaZFactory, OceanSigmaFactory, OceanSFactory, OceanSg1Factory, \
     OceanSg2Factory
+import iris._constraints
+import iris.config
 import iris.coord_systems
 import iris.coords
 import iris.cube
 import iris.exceptions
 import iris.fileformats.cf
+from iris.fileformats import file_handles
 import iris.fileformats._pyke_rules
+import iris.fileformats.pp
 import iris.io
+import iris.std_names
 import iris.util
 
 
@@ -368,6 +374,24 @@ def _pyke_kb_engine():
     return engine
 
 
+def _translator_engine():
+    """
+    Return the engine for CF->cube conversion chosen by
+    :data:`iris.config.NETCDF_TRANSLATOR`.
+
+    """
+    translator = iris.config.NETCDF_TRANSLATOR
+    if translator == 'pyke':
+        engine = _pyke_kb_engine()
+    elif translator == 'python':
+        import iris.fileformats._cf_translator
+        engine = iris.fileformats._cf_translator.Engine()
+    else:
+        msg = 'Unknown netCDF translator {!r}: expected {!r} or {!r}.'
+        raise ValueError(msg.format(translator, 'pyke', 'python'))
+    return engine
+
+
 class NetCDFDataProxy(object):
     """A reference to the data payload of a single NetCDF file variable."""
 
@@ -385,13 +409,11 @@ class NetCDFDataProxy(object):
         return len(self.shape)
 
     def __getitem__(self, keys):
-        dataset = netCDF4.Dataset(self.path)
-        try:
+        with file_handles.NETCDF_DATASETS.checkout(self.path) as dataset:
             variable = dataset.variables[self.variable_name]
-            # Get the NetCDF variable data and slice.
-            data = variable[keys]
-        finally:
-            dataset.close()
+            # Get the NetCDF variable data and slice, reading whole chunks
+            # through the chunk cache where it is enabled.
+            data = file_handles.NETCDF_CHUNKS.read(self.path, variable, keys)
         return data
 
     def __repr__(self):
@@ -468,11 +490,16 @@ def _pyke_stats(engine, cf_name):
             print('\t%s' % rule)
 
         print('Case Specific Facts:')
-        kb_facts = engine.get_kb(_PYKE_FACT_BASE)
+        if hasattr(engine, 'get_kb'):
+            kb_facts = engine.get_kb(_PYKE_FACT_BASE)
 
-        for key in six.iterkeys(kb_facts.entity_lists):
-            for arg in kb_facts.entity_lists[key].case_specific_facts:
-                print('\t%s%s' % (key, arg))
+            for key in six.iterkeys(kb_facts.entity_lists):
+                for arg in kb_facts.entity_lists[key].case_specific_facts:
+                    print('\t%s%s' % (key, arg))
+        else:
+            for key, args in six.iteritems(engine.facts):
+                for arg in args:
+                    print('\t%s%s' % (key, arg))
 
 
 def _set_attributes(attributes, key, value):
@@ -662,7 +689,108 @@ def _load_aux_factory(engine, cube):
         cube.add_aux_factory(factory)
 
 
-def load_cubes(filenames, callback=None):
+# Stand for the value of a cube attribute which can't be determined from
+# the CF-netCDF data variable, and for an attribute which the cube won't
+# have.
+_UNKNOWN = object()
+_ABSENT = object()
+
+
+def _cube_name(attributes, cf_name):
+    # The name of the cube which the rules build from a CF-netCDF data
+    # variable with the given netCDF attributes, as in
+    # "build_cube_metadata".
+    standard_name = attributes.get('standard_name')
+    long_name = attributes.get('long_name')
+    if (standard_name is not None and
+            standard_name not in iris.std_names.STD_NAMES):
+        if long_name is None:
+            long_name = standard_name
+        standard_name = None
+    return standard_name or long_name or cf_name or 'unknown'
+
+
+def _cube_attribute(attributes, global_attributes, name):
+    # The value of the named attribute of the cube built from a CF-netCDF
+    # data variable with the given netCDF attributes.
+    if name in attributes:
+        # The rules may consume the attribute, else it is copied.
+        result = _UNKNOWN
+    elif name == 'STASH' and ('um_stash_source' in attributes or
+                              'ukmo__um_stash_source' in attributes):
+        msi = (attributes.get('um_stash_source') or
+               attributes.get('ukmo__um_stash_source'))
+        try:
+            result = iris.fileformats.pp.STASH.from_msi(msi)
+        except (TypeError, ValueError):
+            result = _UNKNOWN
+    elif name in ('invalid_standard_name', 'invalid_units'):
+        result = _UNKNOWN
+    elif name in global_attributes:
+        result = global_attributes[name]
+    else:
+        result = _ABSENT
+    return result
+
+
+def _may_match(constraint, cf_var, attributes):
+    # Whether the cube built from the CF-netCDF data variable may match the
+    # constraint, judging only by its name and attributes.
+    result = True
+    if isinstance(constraint, iris._constraints.ConstraintCombination):
+        if constraint.operator is operator.__and__:
+            result = (_may_match(constraint.lhs, cf_var, attributes) and
+                      _may_match(constraint.rhs, cf_var, attributes))
+    elif isinstance(constraint, iris._constraints.AttributeConstraint):
+        global_attributes = cf_var.cf_group.global_attributes
+        for name, value in six.iteritems(constraint._attributes):
+            cube_value = _cube_attribute(attributes, global_attributes, name)
+            if cube_value is _ABSENT:
+                result = False
+            elif cube_value is not _UNKNOWN:
+                try:
+                    if callable(value):
+                        result = bool(value(cube_value))
+                    else:
+                        result = not (cube_value != value)
+                except (TypeError, ValueError):
+                    pass
+            if not result:
+                break
+    elif type(constraint) is iris._constraints.Constraint:
+        if constraint._name:
+            result = constraint._name == _cube_name(attributes,
+                                                    cf_var.cf_name)
+    return result
+
+
+def _convert_constraints(constraints):
+    """
+    Convert the constraints into a filter of the CF-netCDF data variables
+    which may give a matching cube, or return None if none can be excluded.
+
+    The name and attribute constraints are tested against the attributes of
+    each variable, without affecting which attributes the rules will treat
+    as used. Any other constraint is assumed to match.
+
+    """
+    constraints = iris._constraints.list_of_constraints(constraints)
+
+    def variable_filter(cf_var):
+        attributes = dict(cf_var.cf_attrs())
+        return any(_may_match(constraint, cf_var, attributes)
+                   for constraint in constraints)
+
+    result = None
+    if any(isinstance(constraint, (iris._constraints.ConstraintCombination,
+                                   iris._constraints.AttributeConstraint)) or
+           (type(constraint) is iris._constraints.Constraint and
+            constraint._name) for constraint in constraints):
+        result = variable_filter
+    return result
+
+
+def load_cubes(filenames, callback=None, constraints=None):
     """
     Loads cubes from a list of NetCDF filenames/URLs.
 
@@ -676,12 +804,22 @@ def load_cubes(filenames, callback=None):
     * callback (callable function):
         Function which can be passed on to :func:`iris.io.run_callback`.
 
+    * constraints (constraint or list of constraints):
+        Any data variable which can't give a cube that matches one of the
+        constraints is skipped, unless there is a callback, which might
+        alter the cube. The cubes that are loaded must still be filtered
+        by the constraints.
+
     Returns:
         Generator of loaded NetCDF :class:`iris.cubes.Cube`.
 
     """
-    # Initialise the pyke inference engine.
-    engine = _pyke_kb_engine()
+    # Initialise the CF->cube translator.
+    engine = _translator_engine()
+
+    variable_filter = None
+    if constraints is not None and callback is None:
+        variable_filter = _convert_constraints(constraints)
 
     if isinstance(filenames, six.string_types):
         filenames = [filenames]
@@ -690,10 +828,17 @@ def load_cubes(filenames, callback=None):
         # Ingest the netCDF file.
         cf = iris.fileformats.cf.CFReader(filename)
 
+        # Coordinates are built once per file, and shared by copy between
+        # the data variables that reference them.
+        engine.coord_cache = {}
+
         # Process each CF data variable.
         data_variables = (list(cf.cf_group.data_variables.values()) +
                           list(cf.cf_group.promoted.values()))
         for cf_var in data_variables:
+            if variable_filter is not None and not variable_filter(cf_var):
+                continue
+
             cube = _load_cube(engine, cf, cf_var, filename)
 
             # Process any associated formula terms and attach
@@ -757,6 +902,9 @@ class Saver(object):
         self._existing_dim = {}
         #: A dictionary, mapping formula terms to owner cf variable name
         self._formula_terms_cache = {}
+        # Close any dataset which is held open for reading the file, as it
+        # cannot also be opened for writing.
+        file_handles.NETCDF_DATASETS.discard(filename)
         #: NetCDF dataset
         try:
             self._dataset = netCDF4.Dataset(filename, mode='w',
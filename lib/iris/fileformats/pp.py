@@ -26,7 +26,9 @@ import six
 import abc
 import collections
 from copy import deepcopy
+import functools
 import itertools
+import mmap
 import operator
 import os
 import re
@@ -41,6 +43,8 @@ import netcdftime
 
 from iris._deprecation import warn_deprecated
 import iris.config
+from iris.fileformats import _header_cache
+from iris.fileformats import file_handles
 import iris.fileformats.rules
 import iris.fileformats.pp_rules
 import iris.coord_systems
@@ -56,7 +60,7 @@ except ImportError:
     pp_packing = None
 
 
-__all__ = ['load', 'save', 'load_cubes', 'PPField',
+__all__ = ['load', 'load_table', 'save', 'load_cubes', 'PPField',
            'reset_load_rules', 'add_save_rules',
            'as_fields', 'load_pairs_from_fields', 'as_pairs',
            'save_pairs_from_cube', 'reset_save_rules',
@@ -827,6 +831,37 @@ class _LBProc(six.with_metaclass(_FlagMetaclass, BitwiseInt)):
                      if self._value & 2 ** i)
 
 
+#: The largest gap, in bytes, between two data payloads which are fetched by
+#: a single read when realising the data of many PP fields.
+_COALESCE_MAX_GAP = 64 * 1024
+
+#: The largest read, in bytes, which joins the data payloads of PP fields.
+_COALESCE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _coalesce_extents(extents):
+    """
+    Group byte extents, given as (offset, length) pairs sorted by offset,
+    into runs which can each be fetched by a single read.
+
+    Returns a list of (start, stop, members) tuples, where members lists
+    the indices of the extents within the run.
+
+    """
+    runs = []
+    for index, (offset, length) in enumerate(extents):
+        end = offset + length
+        if runs:
+            run = runs[-1]
+            if (offset - run[1] <= _COALESCE_MAX_GAP and
+                    max(run[1], end) - run[0] <= _COALESCE_MAX_BYTES):
+                run[1] = max(run[1], end)
+                run[2].append(index)
+                continue
+        runs.append([offset, end, [index]])
+    return [tuple(run) for run in runs]
+
+
 class PPDataProxy(object):
     """A reference to the data payload of a single PP field."""
 
@@ -871,16 +906,53 @@ class PPDataProxy(object):
         return len(self.shape)
 
     def __getitem__(self, keys):
-        with open(self.path, 'rb') as pp_file:
+        with file_handles.BINARY_FILES.checkout(self.path) as pp_file:
             pp_file.seek(self.offset, os.SEEK_SET)
             data_bytes = pp_file.read(self.data_len)
-            data = _data_bytes_to_shaped_array(data_bytes,
-                                               self.lbpack,
-                                               self.boundary_packing,
-                                               self.shape, self.src_dtype,
-                                               self.mdi, self.mask)
+        data = self._shaped_array(data_bytes)
         return data.__getitem__(keys)
 
+    def _shaped_array(self, data_bytes):
+        return _data_bytes_to_shaped_array(data_bytes, self.lbpack,
+                                           self.boundary_packing,
+                                           self.shape, self.src_dtype,
+                                           self.mdi, self.mask)
+
+    @classmethod
+    def _read_batch(cls, proxies):
+        """
+        Generate the index of each of the given proxies, together with a
+        function which decodes its data.
+
+        The proxies are read in file and offset order, with the payloads
+        which are close together in a file fetched by a single read. Only
+        the decoding, e.g. the unpacking of WGDOS packed fields, is left to
+        the returned functions, which may be called concurrently. This is
+        used by :class:`iris._lazy_data.BatchedArrayStack`.
+
+        """
+        order = sorted(range(len(proxies)),
+                       key=lambda i: (proxies[i].path, proxies[i].offset))
+        for path, indices in itertools.groupby(order,
+                                               key=lambda i: proxies[i].path):
+            indices = list(indices)
+            extents = [(proxies[i].offset, proxies[i].data_len)
+                       for i in indices]
+            for start, stop, members in _coalesce_extents(extents):
+                read_buffer = bytearray(stop - start)
+                with file_handles.BINARY_FILES.checkout(path) as pp_file:
+                    pp_file.seek(start, os.SEEK_SET)
+                    n_bytes = pp_file.readinto(read_buffer)
+                read_view = memoryview(read_buffer)[:n_bytes]
+                for member in members:
+                    offset, data_len = extents[member]
+                    data_bytes = read_view[offset - start:
+                                           offset - start + data_len]
+                    proxy = proxies[indices[member]]
+                    load = functools.partial(proxy._shaped_array,
+                                             data_bytes.tobytes())
+                    yield indices[member], load
+
     def __repr__(self):
         fmt = '<{self.__class__.__name__} shape={self.shape}' \
               ' src_dtype={self.dtype!r} path={self.path!r}' \
@@ -1787,7 +1859,7 @@ def make_pp_field(header):
 LoadedArrayBytes = collections.namedtuple('LoadedArrayBytes', 'bytes, dtype')
 
 
-def load(filename, read_data=False, little_ended=False):
+def load(filename, read_data=False, little_ended=False, _table_filter=None):
     """
     Return an iterator of PPFields given a filename.
 
@@ -1813,7 +1885,63 @@ def load(filename, read_data=False, little_ended=False):
     """
     return _interpret_fields(_field_gen(filename,
                                         read_data_bytes=read_data,
-                                        little_ended=little_ended))
+                                        little_ended=little_ended,
+                                        table_filter=_table_filter))
+
+
+def load_table(filename, little_ended=False):
+    """
+    Return a table of the headers of all the fields in a PP file.
+
+    The table is a NumPy structured array, with one element per field. Each
+    header word is available as a named column, using the header release 3
+    names, e.g. ``table['lbft']``. Multi-word headers, such as ``lbuser``,
+    are two-dimensional columns. In addition, the ``data_offset`` and
+    ``data_len`` columns give the position and length in bytes of each
+    field's data record, which includes any extra data.
+
+    No :class:`PPField` instances are created, so the table provides an
+    efficient way to select fields by their header values. For example::
+
+        table = iris.fileformats.pp.load_table(filename)
+        # Count the fields of STASH m01s16i203 at 850 hPa.
+        matching = ((table['lbuser'][:, 3] == 16203) &
+                    (table['lbvc'] == 8) & (table['blev'] == 850))
+        print(np.count_nonzero(matching))
+
+    Args:
+
+    * filename - string of the filename to load.
+
+    Kwargs:
+
+    * little_ended - boolean
+        If True, file contains all little-ended words (header and data).
+
+    Returns:
+        A NumPy structured array, in native byte order.
+
+    """
+    dtype_endian_char = '<' if little_ended else '>'
+    with open(filename, 'rb') as pp_file:
+        headers, data_offsets, data_lens, truncated = _cached_scan_headers(
+            pp_file, little_ended=little_ended)
+    if truncated:
+        raise EOFError('The final field header of {!r} is '
+                       'incomplete.'.format(filename))
+
+    header_table = headers.view(_header_names_dtype(dtype_endian_char))
+    names = list(header_table.dtype.names)
+    formats = [header_table.dtype.fields[name][0].newbyteorder('=')
+               for name in names]
+    table = np.empty(len(header_table),
+                     dtype={'names': names + ['data_offset', 'data_len'],
+                            'formats': formats + [np.int64, np.int64]})
+    for name in names:
+        table[name] = header_table[name]
+    table['data_offset'] = data_offsets
+    table['data_len'] = data_lens
+    return table
 
 
 def _interpret_fields(fields):
@@ -1890,7 +2018,156 @@ def _create_field_data(field, data_shape, land_mask):
         field._data = biggus.NumpyArrayAdapter(proxy)
 
 
-def _field_gen(filename, read_data_bytes, little_ended=False):
+def _header_table_dtype(dtype_endian_char='>', word_depth=PP_WORD_DEPTH,
+                        itemsize=None):
+    """
+    Return the structured dtype of a table of PP headers.
+
+    Each element of the table holds a single PP header, as a 'longs'
+    field of the integer header words and a 'floats' field of the real
+    header words.
+
+    Kwargs:
+
+    * dtype_endian_char:
+        The byte order of the header words. Default is big-endian.
+    * word_depth:
+        The number of bytes in each header word. Default is
+        :data:`PP_WORD_DEPTH`.
+    * itemsize:
+        The number of bytes between successive headers in the table.
+        Default is the size of a single header.
+
+    """
+    long_size = NUM_LONG_HEADERS * word_depth
+    header_size = long_size + NUM_FLOAT_HEADERS * word_depth
+    if itemsize is None or itemsize < header_size:
+        itemsize = header_size
+    longs = '{}i{}'.format(dtype_endian_char, word_depth)
+    floats = '{}f{}'.format(dtype_endian_char, word_depth)
+    return np.dtype({'names': ['longs', 'floats'],
+                     'formats': [(longs, (NUM_LONG_HEADERS,)),
+                                 (floats, (NUM_FLOAT_HEADERS,))],
+                     'offsets': [0, long_size],
+                     'itemsize': itemsize})
+
+
+def _header_from_table(headers, index):
+    """Return the header tuple of the given row of a table of PP headers."""
+    return (tuple(headers['longs'][index]) +
+            tuple(headers['floats'][index]))
+
+
+def _header_names_dtype(dtype_endian_char='>', word_depth=PP_WORD_DEPTH,
+                        itemsize=None):
+    """
+    Return a structured dtype which names each of the words of a table of
+    PP headers.
+
+    The dtype has the same layout as :func:`_header_table_dtype`, so may be
+    used to view a table of PP headers without copying. The names are those
+    of header release 3.
+
+    """
+    header_dtype = _header_table_dtype(dtype_endian_char, word_depth,
+                                       itemsize)
+    names, formats, offsets = [], [], []
+    for name, positions in _header_defn(3):
+        position = positions[0]
+        if position < NUM_LONG_HEADERS:
+            kind = 'i'
+        else:
+            kind = 'f'
+        word_format = '{}{}{}'.format(dtype_endian_char, kind, word_depth)
+        if len(positions) > 1:
+            word_format = (word_format, (len(positions),))
+        names.append(name)
+        formats.append(word_format)
+        offsets.append(position * word_depth)
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets,
+                     'itemsize': header_dtype.itemsize})
+
+
+def _scan_headers(pp_file, little_ended=False):
+    """
+    Locate and decode all of the field headers in an open PP file.
+
+    The file is memory-mapped and the record structure walked in a single
+    pass, collecting the bytes of each field header. All of the headers are
+    then decoded together.
+
+    Returns:
+        A tuple of (headers, data_offsets, data_lens, truncated), where
+        `headers` is a table of PP headers (see
+        :func:`_header_table_dtype`), `data_offsets` and `data_lens` are
+        arrays of the byte offset and byte length of each field's data
+        plus extra data, and `truncated` indicates whether the file ends
+        part way through a field header.
+        The data length of a final field with no length record is -1.
+
+    """
+    dtype_endian_char = '<' if little_ended else '>'
+    header_dtype = _header_table_dtype(dtype_endian_char)
+    length_struct = struct.Struct('{}L'.format(dtype_endian_char))
+
+    header_chunks = []
+    data_offsets = []
+    data_lens = []
+    truncated = False
+
+    file_size = os.fstat(pp_file.fileno()).st_size
+    if file_size:
+        pp_mmap = mmap.mmap(pp_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            position = 0
+            while position < file_size:
+                # Each field comprises a header record and a data record,
+                # both of which are bracketed by 4-byte length words.
+                header_start = position + PP_WORD_DEPTH
+                header_end = header_start + PP_HEADER_DEPTH
+                if header_end > file_size:
+                    truncated = True
+                    break
+                header_chunks.append(pp_mmap[header_start:header_end])
+                length_start = header_end + PP_WORD_DEPTH
+                data_start = length_start + PP_WORD_DEPTH
+                if data_start > file_size:
+                    data_offsets.append(data_start)
+                    data_lens.append(-1)
+                    break
+                data_len = length_struct.unpack_from(pp_mmap,
+                                                     length_start)[0]
+                data_offsets.append(data_start)
+                data_lens.append(data_len)
+                position = data_start + data_len + PP_WORD_DEPTH
+        finally:
+            pp_mmap.close()
+
+    headers = np.frombuffer(b''.join(header_chunks), dtype=header_dtype)
+    return (headers, np.array(data_offsets, dtype=np.int64),
+            np.array(data_lens, dtype=np.int64), truncated)
+
+
+def _cached_scan_headers(pp_file, little_ended=False):
+    """
+    Locate and decode all of the headers in an open PP file, as
+    :func:`_scan_headers`, using the header cache where it is configured.
+
+    """
+    def scan():
+        headers, data_offsets, data_lens, truncated = _scan_headers(
+            pp_file, little_ended=little_ended)
+        return dict(headers=headers, data_offsets=data_offsets,
+                    data_lens=data_lens, truncated=np.array(truncated))
+
+    kind = 'pp-little-ended' if little_ended else 'pp'
+    arrays = _header_cache.cached_scan(pp_file.name, kind, scan)
+    return (arrays['headers'], arrays['data_offsets'], arrays['data_lens'],
+            bool(arrays['truncated']))
+
+
+def _field_gen(filename, read_data_bytes, little_ended=False,
+               table_filter=None):
     """
     Returns a generator of "half-formed" PPField instances derived from
     the given filename.
@@ -1903,32 +2180,29 @@ def _field_gen(filename, read_data_bytes, little_ended=False):
     sufficient information within the field to determine the final
     two-dimensional shape of the data.
 
+    If a `table_filter` is given, it is called with the table of all the
+    headers in the file, and only the fields selected by the boolean array
+    which it returns are generated.
+
     """
     dtype_endian_char = '<' if little_ended else '>'
     with open(filename, 'rb') as pp_file:
-        # Get a reference to the seek method on the file
-        # (this is accessed 3* #number of headers so can provide a small
-        # performance boost)
-        pp_file_seek = pp_file.seek
-        pp_file_read = pp_file.read
-
-        field_count = 0
-        # Keep reading until we reach the end of file
-        while True:
-            # Move past the leading header length word
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-            # Get the LONG header entries
-            dtype = '%ci%d' % (dtype_endian_char, PP_WORD_DEPTH)
-            header_longs = np.fromfile(pp_file, dtype=dtype,
-                                       count=NUM_LONG_HEADERS)
-            # Nothing returned => EOF
-            if len(header_longs) == 0:
-                break
-            # Get the FLOAT header entries
-            dtype = '%cf%d' % (dtype_endian_char, PP_WORD_DEPTH)
-            header_floats = np.fromfile(pp_file, dtype=dtype,
-                                        count=NUM_FLOAT_HEADERS)
-            header = tuple(header_longs) + tuple(header_floats)
+        # Locate and decode all the headers in the file up front, so that
+        # each field is then simply constructed from its row of the table.
+        headers, data_offsets, data_lens, truncated = _cached_scan_headers(
+            pp_file, little_ended=little_ended)
+
+        field_counts = range(len(headers))
+        if table_filter is not None:
+            table = headers.view(_header_names_dtype(dtype_endian_char))
+            keep = np.asarray(table_filter(table), dtype=bool)
+            # Always visit any field with an unsupported header release
+            # number, as it terminates the reading of the file.
+            keep |= ~np.in1d(table['lbrel'], list(PP_CLASSES))
+            field_counts = np.flatnonzero(keep)
+
+        for field_count in field_counts:
+            header = _header_from_table(headers, field_count)
 
             # Make a PPField of the appropriate sub-class (depends on header
             # release number)
@@ -1939,16 +2213,13 @@ def _field_gen(filename, read_data_bytes, little_ended=False):
                       'the remainder of the file.'.format(field_count,
                                                           str(e))
                 warnings.warn(msg)
-                break
-
-            # Skip the trailing 4-byte word containing the header length
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
+                return
 
-            # Read the word telling me how long the data + extra data is
-            # This value is # of bytes
-            len_of_data_plus_extra = struct.unpack_from(
-                '%cL' % dtype_endian_char,
-                pp_file_read(PP_WORD_DEPTH))[0]
+            # The length of the data + extra data, in bytes.
+            len_of_data_plus_extra = int(data_lens[field_count])
+            if len_of_data_plus_extra < 0:
+                raise EOFError('Field {} of {!r} has no data '
+                               'record.'.format(field_count, filename))
             if len_of_data_plus_extra != pp_field.lblrec * PP_WORD_DEPTH:
                 raise ValueError('LBLREC has a different value to the integer '
                                  'recorded after the header in the file (%s '
@@ -1959,6 +2230,7 @@ def _field_gen(filename, read_data_bytes, little_ended=False):
             extra_len = pp_field.lbext * PP_WORD_DEPTH
 
             # Derive size and datatype of payload
+            data_offset = int(data_offsets[field_count])
             data_len = len_of_data_plus_extra - extra_len
             dtype = LBUSER_DTYPE_LOOKUP.get(pp_field.lbuser[0],
                                             LBUSER_DTYPE_LOOKUP['default'])
@@ -1975,25 +2247,25 @@ def _field_gen(filename, read_data_bytes, little_ended=False):
             if read_data_bytes:
                 # Read the actual bytes. This can then be converted to a numpy
                 # array at a higher level.
+                pp_file.seek(data_offset, os.SEEK_SET)
                 pp_field._data = LoadedArrayBytes(pp_file.read(data_len),
                                                   dtype)
             else:
                 # Provide enough context to read the data bytes later on.
-                pp_field._data = (filename, pp_file.tell(), data_len, dtype)
-                # Seek over the actual data payload.
-                pp_file_seek(data_len, os.SEEK_CUR)
+                pp_field._data = (filename, data_offset, data_len, dtype)
 
             # Do we have any extra data to deal with?
             if extra_len:
-                pp_field._read_extra_data(pp_file, pp_file_read, extra_len,
+                pp_file.seek(data_offset + data_len, os.SEEK_SET)
+                pp_field._read_extra_data(pp_file, pp_file.read, extra_len,
                                           little_ended=little_ended)
 
-            # Skip that last 4 byte record telling me the length of the field I
-            # have already read
-            pp_file_seek(PP_WORD_DEPTH, os.SEEK_CUR)
-            field_count += 1
             yield pp_field
 
+        if truncated:
+            raise EOFError('The final field header of {!r} is '
+                           'incomplete.'.format(filename))
+
 
 def reset_load_rules():
     """
@@ -2137,6 +2409,155 @@ def _convert_constraints(constraints):
     return result
 
 
+#: STASH codes of the fields which are always loaded by a table filter,
+#: including the land mask used to decompress land-packed fields.
+_TABLE_STASH_ALLOW = _STASH_ALLOW + [STASH(1, 0, 30)]
+
+
+def _table_stashes(table):
+    """
+    Return the unique STASH codes of a table of PP headers, together with
+    the index of each field's STASH code within them.
+
+    """
+    lbuser = table['lbuser']
+    codes = np.empty(len(table), dtype=[('model', np.int64),
+                                        ('code', np.int64)])
+    codes['model'] = lbuser[:, 6]
+    codes['code'] = lbuser[:, 3]
+    unique_codes, inverse = np.unique(codes, return_inverse=True)
+    stashes = [STASH(int(model), int(code) // 1000, int(code) % 1000)
+               for model, code in unique_codes]
+    return stashes, inverse
+
+
+def _stash_table_mask(stashobj):
+    """
+    Return a function which masks a table of PP headers by the given STASH
+    attribute constraint value, or None if the value is not understood.
+
+    """
+    if callable(stashobj):
+        call_func = stashobj
+    elif isinstance(stashobj, (six.string_types, STASH)):
+        def call_func(stash):
+            return stash == stashobj
+    else:
+        return None
+
+    def mask(table):
+        stashes, inverse = _table_stashes(table)
+        matches = np.array([bool(call_func(str(stash)))
+                            for stash in stashes], dtype=bool)
+        return matches[inverse]
+    return mask
+
+
+def _coord_table_values(coord_name, table):
+    """
+    Return the values of the named coordinate for each field of a table of
+    PP headers, and a boolean array of the fields which are known to have
+    the coordinate, as given by the rules in :mod:`iris.fileformats.pp_rules`.
+
+    """
+    lbcode = table['lbcode']
+    lbvc = table['lbvc']
+    cross_section = (lbcode >= 10000) & (lbcode < 100000)
+    if coord_name == 'model_level_number':
+        # See Word no. 33 (LBLEV) in section 4 of UM Model Docs (F3).
+        values = np.where(table['lblev'] == 9999, 0, table['lblev'])
+        present = ((lbvc == 9) | (lbvc == 65) |
+                   ((lbvc == 2) & ~cross_section))
+    else:
+        values = table['blev']
+        present = (lbvc == 8) & ~cross_section
+    return values, present
+
+
+def _coord_table_mask(coord_name, coord_thing):
+    """
+    Return a function which masks a table of PP headers by the given
+    coordinate constraint, or None if the constraint is not understood.
+
+    Only fields which are known to have an unbounded coordinate of the given
+    name, whose value does not satisfy the constraint, are masked out.
+
+    """
+    if coord_name not in ('model_level_number', 'pressure'):
+        return None
+    if callable(coord_thing):
+        call_func = coord_thing
+    elif isinstance(coord_thing, (list, tuple)):
+        def call_func(cell):
+            return cell.point in coord_thing
+    elif isinstance(coord_thing, (six.integer_types, float, np.number)):
+        def call_func(cell):
+            return cell == coord_thing
+    else:
+        return None
+
+    def mask(table):
+        values, present = _coord_table_values(coord_name, table)
+        unique_values, inverse = np.unique(values, return_inverse=True)
+        matches = np.array([bool(call_func(iris.coords.Cell(value)))
+                            for value in unique_values], dtype=bool)
+        return ~present | matches[inverse]
+    return mask
+
+
+def _convert_table_constraints(constraints, coords=True):
+    """
+    Converts known constraints from Iris semantics into a filter on a table
+    of PP headers, ignoring all unknown constraints.
+
+    The filter accepts a table of PP headers, as returned by
+    :func:`load_table`, and returns a boolean array of the fields which may
+    satisfy at least one of the constraints. Returns None when no fields can
+    be excluded.
+
+    Kwargs:
+
+    * coords - boolean
+        Whether to convert coordinate constraints, which is only valid if
+        the coordinates of the loaded cubes are not subsequently modified.
+        Default True.
+
+    """
+    constraints = iris._constraints.list_of_constraints(constraints)
+    constraint_masks = []
+    for con in constraints:
+        masks = []
+        if isinstance(con, iris.AttributeConstraint):
+            if 'STASH' in con._attributes:
+                masks.append(_stash_table_mask(con._attributes['STASH']))
+        elif type(con) is iris.Constraint and coords:
+            for coord_con in con._coord_constraints:
+                masks.append(_coord_table_mask(coord_con.coord_name,
+                                               coord_con._coord_thing))
+        masks = [mask for mask in masks if mask is not None]
+        if not masks:
+            # Any field may satisfy this constraint.
+            return None
+        constraint_masks.append(masks)
+
+    if not constraint_masks:
+        return None
+
+    def table_filter(table):
+        stashes, inverse = _table_stashes(table)
+        allowed = np.array([stash in _TABLE_STASH_ALLOW
+                            for stash in stashes], dtype=bool)
+        result = allowed[inverse]
+        for masks in constraint_masks:
+            con_result = np.ones(len(table), dtype=bool)
+            for mask in masks:
+                con_result &= mask(table)
+            result |= con_result
+        return result
+
+    return table_filter
+
+
 def load_cubes(filenames, callback=None, constraints=None):
     """
     Loads cubes from a list of pp filenames.
@@ -2242,10 +2663,17 @@ def _load_cubes_variable_loader(filenames, callback, loading_function,
                                 loading_function_kwargs=None,
                                 constraints=None):
     pp_filter = None
+    loading_function_kwargs = dict(loading_function_kwargs or {})
     if constraints is not None:
         pp_filter = _convert_constraints(constraints)
+        # Coordinate constraints can only be applied to the headers when
+        # there is no callback which may modify the cube coordinates.
+        table_filter = _convert_table_constraints(constraints,
+                                                  coords=callback is None)
+        if table_filter is not None:
+            loading_function_kwargs['_table_filter'] = table_filter
     pp_loader = iris.fileformats.rules.Loader(
-        loading_function, loading_function_kwargs or {},
+        loading_function, loading_function_kwargs,
         iris.fileformats.pp_rules.convert)
     return iris.fileformats.rules.load_cubes(filenames, callback, pp_loader,
                                              pp_filter)
@@ -28,6 +28,7 @@ from iris.fileformats.um._optimal_array_structuring import \
     optimal_array_structure
 
 from biggus import ArrayStack
+from iris._lazy_data import BatchedArrayStack
 from iris.fileformats.pp import PPField3
 
 
@@ -82,9 +83,12 @@ class FieldCollation(object):
             self._calculate_structure()
         if self._data_cache is None:
             data_arrays = [f._data for f in self.fields]
-            self._data_cache = \
-                ArrayStack.multidim_array_stack(data_arrays,
-                                                self.vector_dims_shape)
+            data = ArrayStack.multidim_array_stack(data_arrays,
+                                                   self.vector_dims_shape)
+            if isinstance(data, ArrayStack):
+                # Realise the data of all the fields in batches.
+                data = BatchedArrayStack(data._stack)
+            self._data_cache = data
         return self._data_cache
 
     @property
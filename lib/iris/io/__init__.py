@@ -24,11 +24,14 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
 import glob
+from multiprocessing.pool import ThreadPool
 import os.path
+import sys
 import types
 import re
 import collections
 
+import iris
 import iris.fileformats
 import iris.cube
 import iris.exceptions
@@ -169,12 +172,83 @@ def expand_filespecs(file_specs):
     return sum(value_lists, [])
 
 
-def load_files(filenames, callback, constraints=None):
+def _format_spec(filename):
+    # Identify the format specification which handles the given file.
+    with open(filename, 'rb') as fh:
+        return iris.fileformats.FORMAT_AGENT.get_spec(
+            os.path.basename(filename), fh)
+
+
+def _handle_files(handling_format_spec, fnames, callback, constraints):
+    # Call an iris format handler with the appropriate filenames.
+    if handling_format_spec.constraint_aware_handler:
+        cubes = handling_format_spec.handler(fnames, callback, constraints)
+    else:
+        cubes = handling_format_spec.handler(fnames, callback)
+    return cubes
+
+
+def _load_files_parallel(all_file_paths, callback, constraints, workers):
+    # Load the given files on a pool of worker threads.
+    # Each file is identified and converted by a separate task, and the
+    # per-file results are yielded in exactly the same order as the serial
+    # implementation of :func:`load_files`.
+    #
+    # Note that the "iris.FUTURE" settings, and the options of the GRIB
+    # conversion, are specific to each thread, so the settings of the
+    # calling thread are explicitly propagated to the workers. The GRIB
+    # options are only propagated if the GRIB conversion has been imported,
+    # so as not to require the GRIB API.
+    thread_locals = [iris.FUTURE]
+    load_convert = sys.modules.get('iris.fileformats.grib._load_convert')
+    if load_convert is not None:
+        thread_locals.append(load_convert.options)
+    states = [(local, local.__dict__.copy()) for local in thread_locals]
+
+    def in_context(func):
+        def wrapper(args):
+            for local, state in states:
+                local.__dict__.update(state)
+            return func(*args)
+        return wrapper
+
+    def load_file(handling_format_spec, fname):
+        return list(_handle_files(handling_format_spec, [fname],
+                                  callback, constraints))
+
+    pool = ThreadPool(workers)
+    try:
+        specs = pool.map(in_context(_format_spec),
+                         [(fn,) for fn in all_file_paths])
+
+        handler_map = collections.defaultdict(list)
+        for fn, handling_format_spec in zip(all_file_paths, specs):
+            handler_map[handling_format_spec].append(fn)
+
+        tasks = [(handling_format_spec, fname)
+                 for handling_format_spec in sorted(handler_map)
+                 for fname in handler_map[handling_format_spec]]
+        for cubes in pool.imap(in_context(load_file), tasks):
+            for cube in cubes:
+                yield cube
+    finally:
+        pool.terminate()
+
+
+def load_files(filenames, callback, constraints=None, workers=None):
     """
     Takes a list of filenames which may also be globs, and optionally a
     constraint set and a callback function, and returns a
     generator of Cubes from the given files.
 
+    Kwargs:
+
+    * workers (int):
+        The number of worker threads with which to identify and load
+        the files. Defaults to None, which loads the files one after
+        another in the calling thread. The cubes are always returned in
+        the same order, regardless of the number of workers.
+
     .. note::
 
         Typically, this function should not be called directly; instead, the
@@ -183,23 +257,23 @@ def load_files(filenames, callback, constraints=None):
     """
     all_file_paths = expand_filespecs(filenames)
 
+    if workers is not None and workers > 1:
+        for cube in _load_files_parallel(all_file_paths, callback,
+                                         constraints, workers):
+            yield cube
+        return
+
     # Create default dict mapping iris format handler to its associated filenames
     handler_map = collections.defaultdict(list)
     for fn in all_file_paths:
-        with open(fn, 'rb') as fh:
-            handling_format_spec = iris.fileformats.FORMAT_AGENT.get_spec(os.path.basename(fn), fh)
-            handler_map[handling_format_spec].append(fn)
+        handler_map[_format_spec(fn)].append(fn)
 
     # Call each iris format handler with the approriate filenames
     for handling_format_spec in sorted(handler_map):
         fnames = handler_map[handling_format_spec]
-        if handling_format_spec.constraint_aware_handler:
-            for cube in handling_format_spec.handler(fnames, callback,
-                                                     constraints):
-                yield cube
-        else:
-            for cube in handling_format_spec.handler(fnames, callback):
-                yield cube
+        for cube in _handle_files(handling_format_spec, fnames, callback,
+                                  constraints):
+            yield cube
 
 
 def load_http(urls, callback):
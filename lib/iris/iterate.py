@@ -60,6 +60,10 @@ def izip(*cubes, **kwargs):
         subcubes will match the order of the coordinates in the coords
         keyword argument. If False, the order of the coordinates will
         be preserved and will match that of the input cubes.
+    * view (Boolean):
+        If True, the resulting subcubes share the data and coordinate values
+        of the input cubes where possible, as for
+        :attr:`iris.cube.Cube.view`. Defaults to False.
 
     Returns:
         An iterator over a collection of tuples that contain the resulting
@@ -82,6 +86,10 @@ def izip(*cubes, **kwargs):
     if not isinstance(ordered, bool):
         raise TypeError('Expected bool ordered parameter, got %r' % ordered)
 
+    view = kwargs.get('view', False)
+    if not isinstance(view, bool):
+        raise TypeError('Expected bool view parameter, got %r' % view)
+
     # Convert any coordinate names to coordinates (and ensure each cube has
     # requested slice coords).
     coords_to_slice = kwargs.get('coords')
@@ -164,7 +172,7 @@ def izip(*cubes, **kwargs):
                               "differ." % coord_a.name())
 
     return _ZipSlicesIterator(cubes, requested_dims_by_cube, ordered,
-                              coords_by_cube)
+                              coords_by_cube, view)
 
 
 class _ZipSlicesIterator(collections.Iterator):
@@ -173,11 +181,13 @@ class _ZipSlicesIterator(collections.Iterator):
     collection of cubes in step.
 
     """
-    def __init__(self, cubes, requested_dims_by_cube, ordered, coords_by_cube):
+    def __init__(self, cubes, requested_dims_by_cube, ordered, coords_by_cube,
+                 view=False):
         self._cubes = cubes
         self._requested_dims_by_cube = requested_dims_by_cube
         self._ordered = ordered
         self._coords_by_cube = coords_by_cube
+        self._view = view
 
         # Check that the requested_dims_by_cube and coords_by_cube lists are
         # the same length as cubes so it is feasible that there is a 1-1
@@ -258,7 +268,7 @@ class _ZipSlicesIterator(collections.Iterator):
             for dim in requested_dims:
                 index_list[dim] = slice(None, None)
             # Extract slices from the cube
-            subcube = cube[tuple(index_list)]
+            subcube = cube._getitem(tuple(index_list), view=self._view)
             # Call transpose if necessary (taken from _SlicesIterator in
             # cube.py).
             if self._ordered is True:
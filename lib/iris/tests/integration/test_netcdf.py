@@ -301,5 +301,101 @@ class TestCellMethod_unknown(tests.IrisTest):
             shutil.rmtree(temp_dirpath)
 
 
+class TestConstrainedLoad(tests.IrisTest):
+    def setUp(self):
+        self.cubes = CubeList()
+        for i, name in enumerate(['air_temperature', 'air_pressure']):
+            cube = stock.realistic_4d()[0, :2, :3, :4]
+            cube.rename(name)
+            cube.attributes['STASH'] = iris.fileformats.pp.STASH(1, 0, i)
+            self.cubes.append(cube)
+        self.filename = iris.util.create_temp_filename(suffix='.nc')
+        iris.save(self.cubes, self.filename)
+        self.addCleanup(os.remove, self.filename)
+
+    def _load(self, *args, **kwargs):
+        with mock.patch('iris.fileformats.netcdf._load_cube',
+                        wraps=iris.fileformats.netcdf._load_cube) as patch:
+            cubes = iris.load(self.filename, *args, **kwargs)
+        return cubes, patch.call_count
+
+    def test_name(self):
+        cubes, call_count = self._load('air_pressure')
+        self.assertEqual(call_count, 1)
+        self.assertEqual([cube.name() for cube in cubes], ['air_pressure'])
+
+    def test_stash(self):
+        constraint = iris.AttributeConstraint(STASH='m01s00i000')
+        cubes, call_count = self._load(constraint)
+        self.assertEqual(call_count, 1)
+        self.assertEqual([cube.name() for cube in cubes],
+                         ['air_temperature'])
+
+    def test_callback(self):
+        def callback(cube, field, filename):
+            cube.rename('air_pressure')
+        cubes, call_count = self._load('air_pressure', callback)
+        self.assertEqual(call_count, 2)
+        self.assertEqual(len(cubes), 2)
+
+    def test_coordinate(self):
+        cubes, call_count = self._load(iris.Constraint(
+            grid_latitude=self.cubes[0].coord('grid_latitude').points[0]))
+        self.assertEqual(call_count, 2)
+        self.assertEqual([cube.shape for cube in cubes], [(2, 4), (2, 4)])
+
+
+def _load_translated(filename, translator):
+    # Load the cubes from a netCDF file with the given CF->cube translator,
+    # and return their CML, or the type of the exception which stops the
+    # load, along with the warnings that were issued.
+    with mock.patch('iris.config.NETCDF_TRANSLATOR', translator), \
+            warnings.catch_warnings(record=True) as warning_records:
+        warnings.simplefilter('always')
+        try:
+            cubes = list(iris.fileformats.netcdf.load_cubes(filename))
+        except Exception as error:
+            result = type(error)
+        else:
+            result = [cube.xml() for cube in cubes]
+    messages = [str(record.message) for record in warning_records]
+    return result, messages
+
+
+class TestTranslators(tests.IrisTest):
+    def _check_translators(self, filename):
+        expected = _load_translated(filename, 'pyke')
+        result = _load_translated(filename, 'python')
+        self.assertEqual(result, expected, filename)
+
+    @tests.skip_data
+    def test_test_data(self):
+        for dirpath, _, filenames in os.walk(tests.get_data_path('NetCDF')):
+            for filename in sorted(filenames):
+                if filename.endswith('.nc'):
+                    self._check_translators(os.path.join(dirpath, filename))
+
+    def test_many_variables(self):
+        cube = stock.realistic_4d()[:, :2, :5, :5]
+        cubes = CubeList()
+        for i in range(50):
+            variable = cube.copy()
+            variable.var_name = 'variable_{}'.format(i)
+            variable.add_cell_method(CellMethod('mean', 'time'))
+            cubes.append(variable)
+        with self.temp_filename(suffix='.nc') as filename:
+            iris.save(cubes, filename)
+            self._check_translators(filename)
+
+    def test_unknown(self):
+        cube = Cube([1, 2], long_name='odd_phenomenon')
+        with self.temp_filename(suffix='.nc') as filename:
+            iris.save(cube, filename)
+            with mock.patch('iris.config.NETCDF_TRANSLATOR', 'other'), \
+                    self.assertRaisesRegexp(ValueError,
+                                            'Unknown netCDF translator'):
+                list(iris.fileformats.netcdf.load_cubes(filename))
+
+
 if __name__ == "__main__":
     tests.main()
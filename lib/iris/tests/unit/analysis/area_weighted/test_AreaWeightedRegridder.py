@@ -26,12 +26,15 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import biggus
 import numpy as np
 
 from iris.analysis._area_weighted import AreaWeightedRegridder
 from iris.coord_systems import GeogCS
 from iris.coords import DimCoord
 from iris.cube import Cube
+from iris.experimental.regrid import \
+    regrid_area_weighted_rectilinear_src_and_grid
 from iris.tests import mock
 
 
@@ -43,6 +46,8 @@ class Test(tests.IrisTest):
         lon = DimCoord(x, 'longitude', units='degrees')
         cube.add_dim_coord(lat, 0)
         cube.add_dim_coord(lon, 1)
+        lat.guess_bounds()
+        lon.guess_bounds()
         return cube
 
     def grids(self):
@@ -55,12 +60,22 @@ class Test(tests.IrisTest):
 
     def check_mdtol(self, mdtol=None):
         src_grid, target_grid = self.grids()
-        if mdtol is None:
-            regridder = AreaWeightedRegridder(src_grid, target_grid)
-            mdtol = 1
-        else:
-            regridder = AreaWeightedRegridder(src_grid, target_grid,
-                                              mdtol=mdtol)
+        with mock.patch('iris.experimental.regrid.'
+                        '_regrid_area_weighted_rectilinear_src_and_grid'
+                        '__prepare',
+                        return_value=mock.sentinel.regrid_info) as prepare:
+            if mdtol is None:
+                regridder = AreaWeightedRegridder(src_grid, target_grid)
+                mdtol = 1
+            else:
+                regridder = AreaWeightedRegridder(src_grid, target_grid,
+                                                  mdtol=mdtol)
+
+        self.assertEqual(prepare.call_count, 1)
+        _, args, _ = prepare.mock_calls[0]
+        self.assertEqual(args[0], src_grid)
+        self.assertEqual(self.extract_grid(args[1]),
+                         self.extract_grid(target_grid))
 
         # Make a new cube to regrid with different data so we can
         # distinguish between regridding the original src grid
@@ -69,16 +84,16 @@ class Test(tests.IrisTest):
         src.data += 10
 
         with mock.patch('iris.experimental.regrid.'
-                        'regrid_area_weighted_rectilinear_src_and_grid',
-                        return_value=mock.sentinel.result) as regrid:
+                        '_regrid_area_weighted_rectilinear_src_and_grid'
+                        '__perform',
+                        return_value=mock.sentinel.result) as perform:
             result = regridder(src)
 
-        self.assertEqual(regrid.call_count, 1)
-        _, args, kwargs = regrid.mock_calls[0]
+        self.assertEqual(perform.call_count, 1)
+        _, args, kwargs = perform.mock_calls[0]
 
         self.assertEqual(args[0], src)
-        self.assertEqual(self.extract_grid(args[1]),
-                         self.extract_grid(target_grid))
+        self.assertIs(args[1], mock.sentinel.regrid_info)
         self.assertEqual(kwargs, {'mdtol': mdtol})
         self.assertIs(result, mock.sentinel.result)
 
@@ -88,6 +103,32 @@ class Test(tests.IrisTest):
     def test_specified_mdtol(self):
         self.check_mdtol(0.5)
 
+    def test_matches_function(self):
+        src, _ = self.grids()
+        src.data = np.ma.masked_less(src.data.astype(float), 2)
+        target = self.cube(np.linspace(19, 29, 6), np.linspace(11, 22, 9))
+        regridder = AreaWeightedRegridder(src, target, mdtol=0.5)
+        expected = regrid_area_weighted_rectilinear_src_and_grid(src, target,
+                                                                 mdtol=0.5)
+        # The regridder re-uses its weights for every cube.
+        for _ in range(2):
+            result = regridder(src)
+            self.assertEqual(result.metadata, expected.metadata)
+            self.assertMaskedArrayEqual(result.data, expected.data)
+
+    def test_lazy(self):
+        src, target = self.grids()
+        src.data = np.ma.masked_less(src.data.astype(float), 2)
+        lazy = src.copy()
+        lazy.lazy_data(biggus.NumpyArrayAdapter(src.data))
+        regridder = AreaWeightedRegridder(src, target, mdtol=0.5)
+        expected = regridder(src)
+        result = regridder(lazy)
+        self.assertTrue(result.has_lazy_data())
+        self.assertTrue(lazy.has_lazy_data())
+        self.assertEqual(result.metadata, expected.metadata)
+        self.assertMaskedArrayEqual(result.data, expected.data)
+
     def test_invalid_high_mdtol(self):
         src, target = self.grids()
         msg = 'mdtol must be in range 0 - 1'
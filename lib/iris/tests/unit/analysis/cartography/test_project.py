@@ -23,7 +23,9 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import biggus
 import cartopy.crs as ccrs
+import cartopy.img_transform
 import numpy as np
 
 import iris.coord_systems
@@ -133,6 +135,31 @@ class TestAll(tests.IrisTest):
         new_cube, _ = project(cube, ROBINSON)
         self.assertCMLApproxData(new_cube)
 
+    def test_single_regrid(self):
+        cube = low_res_4d()
+        with iris.tests.mock.patch('cartopy.img_transform.regrid',
+                                   wraps=cartopy.img_transform.regrid) as rg:
+            project(cube, ROBINSON)
+        self.assertEqual(rg.call_count, 1)
+
+    def test_lazy(self):
+        cube = low_res_4d()
+        expected, _ = project(cube, ROBINSON)
+        lazy = cube.copy()
+        lazy.lazy_data(biggus.NumpyArrayAdapter(cube.data))
+        new_cube, _ = project(lazy, ROBINSON)
+        self.assertTrue(new_cube.has_lazy_data())
+        self.assertTrue(lazy.has_lazy_data())
+        self.assertEqual(new_cube, expected)
+
+    def test_masked(self):
+        cube = low_res_4d()
+        unmasked_cube, _ = project(cube, ROBINSON, nx=8, ny=6)
+        cube.data = np.ma.masked_greater(cube.data, 300)
+        new_cube, _ = project(cube, ROBINSON, nx=8, ny=6)
+        expected = np.ma.masked_greater(unmasked_cube.data, 300)
+        self.assertMaskedArrayEqual(new_cube.data, expected)
+
     def test_no_coord_system(self):
         cube = low_res_4d()
         cube.coord('grid_longitude').coord_system = None
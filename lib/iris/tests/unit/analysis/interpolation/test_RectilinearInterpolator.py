@@ -479,22 +479,37 @@ class Test___call___2D_non_contiguous(ThreeDimCube):
 
 
 class Test___call___lazy_data(ThreeDimCube):
-    def test_src_cube_data_loaded(self):
-        # RectilinearInterpolator operates using a snapshot of the source cube.
-        # If the source cube has lazy data when the interpolator is
-        # instantiated we want to make sure the source cube's data is
-        # loaded as a consequence of interpolation to avoid the risk
-        # of loading it again and again.
-
-        # Modify self.cube to have lazy data.
-        self.cube.lazy_data(biggus.NumpyArrayAdapter(self.data))
-        self.assertTrue(self.cube.has_lazy_data())
-
-        # Perform interpolation and check the data has been loaded.
-        interpolator = RectilinearInterpolator(self.cube, ['latitude'], LINEAR,
-                                               EXTRAPOLATE)
-        interpolator([[1.5]])
-        self.assertFalse(self.cube.has_lazy_data())
+    def setUp(self):
+        super(Test___call___lazy_data, self).setUp()
+        self.lazy = self.cube.copy()
+        self.lazy.lazy_data(biggus.NumpyArrayAdapter(self.data))
+
+    def test_lazy(self):
+        # The interpolation of lazy data is itself lazy, and leaves the
+        # source cube's data unloaded.
+        for method in (LINEAR, NEAREST):
+            interpolator = RectilinearInterpolator(self.lazy, ['latitude'],
+                                                   method, EXTRAPOLATE)
+            result = interpolator([[1.5, 0.25]])
+            self.assertTrue(result.has_lazy_data())
+            self.assertTrue(self.lazy.has_lazy_data())
+            interpolator = RectilinearInterpolator(self.cube, ['latitude'],
+                                                   method, EXTRAPOLATE)
+            self.assertEqual(result, interpolator([[1.5, 0.25]]))
+
+    def test_scalar(self):
+        interpolator = RectilinearInterpolator(self.lazy, ['latitude'],
+                                               LINEAR, EXTRAPOLATE)
+        result = interpolator([1.5])
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayEqual(result.data, self.data[:, 1, :] + 2)
+
+    def test_nanmask(self):
+        # The nanmask extrapolation mode loads the source data.
+        interpolator = RectilinearInterpolator(self.lazy, ['latitude'],
+                                               LINEAR, 'nanmask')
+        result = interpolator([[1.5]])
+        self.assertFalse(result.has_lazy_data())
 
 
 class Test___call___time(tests.IrisTest):
@@ -23,6 +23,7 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import biggus
 import numpy as np
 
 from iris.analysis._regrid import RectilinearRegridder as Regridder
@@ -109,6 +110,22 @@ class Test__regrid__linear(tests.IrisTest):
                         self.target_x, self.target_y)
         self.assertArrayEqual(result, self.expected)
 
+    def test_weights_cache(self):
+        weights_cache = {}
+        regrid(self.data, self.x_dim, self.y_dim, self.x, self.y,
+               self.target_x, self.target_y, weights_cache=weights_cache)
+        self.assertEqual(list(weights_cache.keys()), ['weights'])
+        # The cached weights are re-used for different data.
+        data = self.data * 2
+        with mock.patch('iris.analysis._scipy_interpolate.'
+                        '_RegularGridInterpolator.compute_interp_weights') \
+                as compute_weights:
+            result = regrid(data, self.x_dim, self.y_dim, self.x, self.y,
+                            self.target_x, self.target_y,
+                            weights_cache=weights_cache)
+        self.assertEqual(compute_weights.call_count, 0)
+        self.assertArrayEqual(result, self.expected * 2)
+
     def test_simple_masked(self):
         data = np.ma.MaskedArray(self.data, mask=True)
         data.mask[:, 1:30, 1:30] = False
@@ -160,6 +177,45 @@ class Test__regrid__linear(tests.IrisTest):
                                              ndmin=self.data.ndim))
 
 
+class Test__regrid__batches(tests.IrisTest):
+    def setUp(self):
+        self.x = DimCoord(np.linspace(0, 9, 4))
+        self.y = DimCoord(np.linspace(0, 10, 5))
+        data = np.arange(2 * 5 * 3 * 4, dtype=np.float32).reshape(2, 5, 3, 4)
+        mask = np.zeros(data.shape, dtype=bool)
+        mask[0, 1, 2, 3] = mask[1, 3, 0, 0] = True
+        self.data = np.ma.MaskedArray(data, mask=mask)
+        self.x_dim = 3
+        self.y_dim = 1
+        target_x = np.linspace(-1, 8, 5)
+        target_y = np.linspace(1, 11, 3)
+        self.target_x, self.target_y = np.meshgrid(target_x, target_y)
+
+    def _check(self, batch_size, method, mode):
+        # Regrid each 2d slice on its own, for comparison.
+        expected = np.ma.empty((2, 3, 3, 5), dtype=self.data.dtype)
+        expected.mask = False
+        for i, j in np.ndindex(2, 3):
+            expected[i, :, j] = regrid(self.data[i, :, j], 1, 0,
+                                       self.x, self.y,
+                                       self.target_x, self.target_y,
+                                       method, mode)
+        with mock.patch('iris.analysis._regrid._REGRID_BATCH_SIZE',
+                        batch_size):
+            result = regrid(self.data, self.x_dim, self.y_dim,
+                            self.x, self.y, self.target_x, self.target_y,
+                            method, mode)
+        self.assertMaskedArrayEqual(result, expected)
+
+    def test_batches(self):
+        # Batches of single slices, of some of the slices, and of all the
+        # slices.
+        for batch_size in [1, 60, 2 ** 16]:
+            for method in ['linear', 'nearest']:
+                for mode in ['extrapolate', 'mask', 'nanmask']:
+                    self._check(batch_size, method, mode)
+
+
 # Check what happens to NaN values, extrapolated values, and
 # masked values.
 class Test__regrid__extrapolation_modes(tests.IrisTest):
@@ -1203,6 +1259,42 @@ class Test___call____NOP(tests.IrisTest):
         self.assertEqual(result, self.src)
 
 
+class Test___call____lazy(tests.IrisTest):
+    def setUp(self):
+        self.src = realistic_4d()[:3, :2, ::20, ::15]
+        self.src.data = np.ma.masked_greater(self.src.data, 300)
+        self.lazy = self.src.copy()
+        self.lazy.lazy_data(biggus.NumpyArrayAdapter(self.src.data))
+        # A grid which extends beyond the source grid.
+        self.grid = realistic_4d()[0, 0, 10::20, 5::10]
+
+    def test_lazy(self):
+        for method in ('linear', 'nearest'):
+            for mode in ('extrapolate', 'nan', 'mask'):
+                regridder = Regridder(self.src, self.grid, method, mode)
+                expected = regridder(self.src)
+                result = regridder(self.lazy)
+                self.assertTrue(result.has_lazy_data())
+                self.assertTrue(self.lazy.has_lazy_data())
+                self.assertEqual(result, expected)
+                self.assertArrayEqual(np.ma.getmaskarray(result.data),
+                                      np.ma.getmaskarray(expected.data))
+
+    def test_nanmask(self):
+        # The nanmask extrapolation mode realises the source data.
+        regridder = Regridder(self.src, self.grid, 'linear', 'nanmask')
+        result = regridder(self.lazy)
+        self.assertFalse(result.has_lazy_data())
+        self.assertFalse(self.lazy.has_lazy_data())
+
+    def test_error(self):
+        # Extrapolation errors are raised before the data is realised.
+        regridder = Regridder(self.src, self.grid, 'linear', 'error')
+        with self.assertRaises(ValueError):
+            regridder(self.lazy)
+        self.assertTrue(self.lazy.has_lazy_data())
+
+
 @tests.skip_data
 class Test___call____circular(tests.IrisTest):
     def setUp(self):
@@ -0,0 +1,153 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for :class:`iris.analysis._regrid_cache.RegridderCache`.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.analysis._regrid_cache import RegridderCache
+from iris.coords import DimCoord
+from iris.cube import Cube
+
+
+class FakeScheme(object):
+    def __init__(self, option=None):
+        self.option = option
+        self.created = 0
+
+    def __repr__(self):
+        return 'FakeScheme({!r})'.format(self.option)
+
+    def regridder(self, src, target):
+        self.created += 1
+        return (self.option, src, target)
+
+
+class OtherScheme(FakeScheme):
+    pass
+
+
+def _cube(nx, ny, offset=0):
+    cube = Cube(np.zeros((ny, nx)))
+    cube.add_dim_coord(DimCoord(np.arange(ny) + offset, 'latitude',
+                                units='degrees'), 0)
+    cube.add_dim_coord(DimCoord(np.arange(nx), 'longitude',
+                                units='degrees'), 1)
+    return cube
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cache = RegridderCache((FakeScheme,), maxsize=2)
+        self.scheme = FakeScheme()
+
+    def test_hit(self):
+        src, target = _cube(3, 4), _cube(5, 6)
+        regridder = self.cache.regridder(src, target, self.scheme)
+        self.assertEqual(regridder, (None, src, target))
+        # Equal grids on different cubes re-use the regridder.
+        result = self.cache.regridder(src.copy(), target.copy(), self.scheme)
+        self.assertIs(result, regridder)
+        self.assertEqual(self.scheme.created, 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.size, 1)
+
+    def test_different_grids(self):
+        src, target = _cube(3, 4), _cube(5, 6)
+        self.cache.regridder(src, target, self.scheme)
+        self.cache.regridder(src, _cube(5, 6, offset=1), self.scheme)
+        self.cache.regridder(_cube(3, 4, offset=1), target, self.scheme)
+        self.assertEqual(self.scheme.created, 3)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 3))
+
+    def test_modified_grid(self):
+        src, target = _cube(3, 4), _cube(5, 6)
+        self.cache.regridder(src, target, self.scheme)
+        # The cached grids are not changed by changes to the original cubes.
+        src.coord('latitude').points = np.arange(4) + 10
+        self.cache.regridder(src, target, self.scheme)
+        self.cache.regridder(_cube(3, 4), target, self.scheme)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_different_schemes(self):
+        src, target = _cube(3, 4), _cube(5, 6)
+        self.cache.regridder(src, target, self.scheme)
+        regridder = self.cache.regridder(src, target, FakeScheme('other'))
+        self.assertEqual(regridder[0], 'other')
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+
+    def test_uncached_scheme(self):
+        src, target = _cube(3, 4), _cube(5, 6)
+        scheme = OtherScheme()
+        self.cache.regridder(src, target, scheme)
+        self.cache.regridder(src, target, scheme)
+        self.assertEqual(scheme.created, 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+        self.assertEqual(self.cache.size, 0)
+
+    def test_invalid_grid(self):
+        # Cubes without a grid are left to the scheme to deal with.
+        src, target = Cube(0), _cube(5, 6)
+        regridder = self.cache.regridder(src, target, self.scheme)
+        self.assertEqual(regridder, (None, src, target))
+        self.assertEqual(self.cache.size, 0)
+
+    def test_evict_least_recently_used(self):
+        src = _cube(3, 4)
+        targets = [_cube(5, 6, offset=i) for i in range(3)]
+        for target in targets[:2]:
+            self.cache.regridder(src, target, self.scheme)
+        self.cache.regridder(src, targets[0], self.scheme)
+        self.cache.regridder(src, targets[2], self.scheme)
+        self.assertEqual(self.cache.size, 2)
+        self.cache.regridder(src, targets[0], self.scheme)
+        self.cache.regridder(src, targets[1], self.scheme)
+        self.assertEqual(self.scheme.created, 4)
+
+    def test_maxsize(self):
+        src = _cube(3, 4)
+        for i in range(2):
+            self.cache.regridder(src, _cube(5, 6, offset=i), self.scheme)
+        self.cache.maxsize = 1
+        self.assertEqual(self.cache.size, 1)
+        self.cache.maxsize = 0
+        self.assertEqual(self.cache.size, 0)
+        self.cache.regridder(src, _cube(5, 6), self.scheme)
+        self.assertEqual(self.cache.size, 0)
+
+    def test_clear(self):
+        src, target = _cube(3, 4), _cube(5, 6)
+        self.cache.regridder(src, target, self.scheme)
+        self.cache.regridder(src, target, self.scheme)
+        self.cache.clear()
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+        self.assertEqual(self.cache.size, 0)
+        self.cache.regridder(src, target, self.scheme)
+        self.assertEqual(self.scheme.created, 2)
+
+
+if __name__ == '__main__':
+    tests.main()
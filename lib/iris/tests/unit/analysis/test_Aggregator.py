@@ -26,9 +26,10 @@ import iris.tests as tests
 import numpy as np
 import numpy.ma as ma
 
-from iris.analysis import Aggregator
+from iris.analysis import Aggregator, COUNT, MAX, MEAN, MEDIAN, MIN, SUM
 from iris.exceptions import LazyAggregatorError
 from iris.tests import mock
+from iris.util import rolling_window
 
 
 class Test_aggregate(tests.IrisTest):
@@ -316,5 +317,113 @@ class Test_lazy_aggregate(tests.IrisTest):
         lazy_func.assert_called_once_with(data, axis, **expected_kwargs)
 
 
+class Test__aggregate_groups(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(24.0).reshape(2, 6, 2) % 7
+        self.groups = [(0, 5), slice(1, 3), (3, 4)]
+
+    def check(self, aggregator, data, **kwargs):
+        # Compare with the aggregation of each group in turn.
+        result = aggregator._aggregate_groups(data, 1, self.groups, **kwargs)
+        expected = []
+        for group in self.groups:
+            if isinstance(group, tuple):
+                group = list(group)
+            expected.append(aggregator.aggregate(data[:, group], 1,
+                                                 **kwargs))
+        if ma.isMaskedArray(data):
+            self.assertMaskedArrayAlmostEqual(result,
+                                              ma.stack(expected, axis=1))
+        else:
+            self.assertNotIsInstance(result, ma.MaskedArray)
+            self.assertArrayAlmostEqual(result, np.stack(expected, axis=1))
+        self.assertEqual(result.dtype, expected[0].dtype)
+
+    def test_unmasked(self):
+        for aggregator in [MEAN, SUM, MAX, MIN]:
+            self.check(aggregator, self.data)
+        self.check(COUNT, self.data, function=lambda values: values > 3)
+
+    def test_integer(self):
+        data = self.data.astype(np.int16)
+        for aggregator in [MEAN, SUM, MAX, MIN]:
+            self.check(aggregator, data)
+
+    def test_masked(self):
+        data = ma.masked_greater(self.data, 4)
+        for aggregator in [MEAN, SUM, MAX, MIN]:
+            self.check(aggregator, data)
+        self.check(COUNT, data, function=lambda values: values > 1)
+
+    def test_masked_mdtol(self):
+        data = ma.masked_greater(self.data, 4)
+        self.check(MEAN, data, mdtol=0.5)
+
+    def test_masked_non_finite(self):
+        # As with ma.average, the non-finite means of masked data are
+        # masked.
+        data = ma.masked_greater(self.data, 4)
+        data[0, 0, 0] = -np.inf
+        data[1, 1, 1] = np.nan
+        self.check(MEAN, data)
+
+    def test_no_segment_func(self):
+        self.assertIsNone(MEDIAN._aggregate_groups(self.data, 1,
+                                                   self.groups))
+
+    def test_unsupported_kwargs(self):
+        self.assertIsNone(MEAN._aggregate_groups(self.data, 1, self.groups,
+                                                 weights=None))
+
+
+class Test__aggregate_windows(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(60.0).reshape(3, 10, 2) % 7
+
+    def check(self, aggregator, data, **kwargs):
+        # Compare with the aggregation of a view of the windows.
+        result = aggregator._aggregate_windows(data, 1, 3, **kwargs)
+        expected = aggregator.aggregate(rolling_window(data, 3, axis=1), 2,
+                                        **kwargs)
+        self.assertMaskedArrayAlmostEqual(result, expected)
+        self.assertEqual(result.dtype, expected.dtype)
+
+    def test_unmasked(self):
+        for aggregator in [MEAN, SUM, MAX, MIN]:
+            self.check(aggregator, self.data)
+        self.check(COUNT, self.data, function=lambda values: values > 3)
+
+    def test_integer(self):
+        data = self.data.astype(np.int16)
+        for aggregator in [MEAN, SUM, MAX, MIN]:
+            self.check(aggregator, data)
+
+    def test_masked(self):
+        data = ma.masked_greater(self.data, 4)
+        for aggregator in [MEAN, SUM, MAX, MIN]:
+            self.check(aggregator, data)
+        self.check(COUNT, data, function=lambda values: values > 1)
+
+    def test_masked_mdtol(self):
+        data = ma.masked_greater(self.data, 4)
+        self.check(MEAN, data, mdtol=0.5)
+
+    def test_non_finite(self):
+        # A non-finite value only affects the windows which contain it.
+        self.data[0, 2, 0] = np.nan
+        self.data[1, 5, 1] = np.inf
+        self.data[2, 4, 0] = np.inf
+        self.data[2, 5, 0] = -np.inf
+        for aggregator in [SUM, MAX, MIN]:
+            self.check(aggregator, self.data)
+
+    def test_no_window_func(self):
+        self.assertIsNone(MEDIAN._aggregate_windows(self.data, 1, 3))
+
+    def test_unsupported_kwargs(self):
+        self.assertIsNone(MEAN._aggregate_windows(self.data, 1, 3,
+                                                  weights=None))
+
+
 if __name__ == "__main__":
     tests.main()
@@ -0,0 +1,100 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for :func:`iris.analysis.trajectory.interpolate`.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import biggus
+import numpy as np
+
+from iris.analysis import Linear
+from iris.analysis.trajectory import interpolate
+from iris.coords import AuxCoord
+import iris.tests.stock as stock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        cube = stock.simple_3d()
+        foo = AuxCoord(np.arange(12.).reshape(3, 4) * 10, long_name='foo')
+        cube.add_aux_coord(foo, (1, 2))
+        self.cube = cube
+        self.lats = [80, 45, -10, -90, 30]
+        self.lons = [-170, 100, 170, 0, -45]
+
+    def sample_points(self):
+        return [('latitude', self.lats), ('longitude', self.lons)]
+
+    def test_metadata(self):
+        result = interpolate(self.cube, self.sample_points())
+        self.assertEqual(result.metadata, self.cube.metadata)
+        self.assertEqual(result.shape, (2, 5))
+        self.assertEqual(result.coord('wibble'), self.cube.coord('wibble'))
+        self.assertEqual(result.coord_dims('wibble'), (0,))
+        for name in ('latitude', 'longitude', 'foo'):
+            coord = result.coord(name)
+            self.assertIsInstance(coord, AuxCoord)
+            self.assertEqual(result.coord_dims(coord), (1,))
+            self.assertEqual(coord.dtype, self.cube.coord(name).dtype)
+        self.assertArrayEqual(result.coord('latitude').points, self.lats)
+        self.assertArrayEqual(result.coord('longitude').points, self.lons)
+
+    def test_linear(self):
+        # The points must match those interpolated one at a time.
+        result = interpolate(self.cube, self.sample_points())
+        for i, (lat, lon) in enumerate(zip(self.lats, self.lons)):
+            column = self.cube.interpolate([('latitude', lat),
+                                            ('longitude', lon)], Linear())
+            self.assertArrayAllClose(result.data[:, i], column.data)
+            self.assertArrayAllClose(result.coord('foo').points[i],
+                                     column.coord('foo').points)
+
+    def test_nearest(self):
+        self.lats = [88, 1, -80, 46]
+        self.lons = [-178, 85, 2, -100]
+        result = interpolate(self.cube, self.sample_points(),
+                             method='nearest')
+        lat_indices = [0, 1, 2, 0]
+        lon_indices = [0, 3, 2, 1]
+        self.assertArrayEqual(result.data,
+                              self.cube.data[:, lat_indices, lon_indices])
+        self.assertArrayEqual(
+            result.coord('foo').points,
+            self.cube.coord('foo').points[lat_indices, lon_indices])
+        self.assertArrayEqual(result.coord('latitude').points,
+                              [90, 0, -90, 90])
+        self.assertArrayEqual(result.coord('longitude').points,
+                              [-180, 90, 0, -90])
+
+    def test_nearest_lazy(self):
+        self.cube.lazy_data(biggus.NumpyArrayAdapter(self.cube.data))
+        result = interpolate(self.cube, self.sample_points(),
+                             method='nearest')
+        self.assertTrue(self.cube.has_lazy_data())
+        self.assertEqual(result.shape, (2, 5))
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -27,10 +27,12 @@ import biggus
 import cf_units
 import numpy as np
 
+import iris._concatenate
 import iris.coords
 from iris._concatenate import concatenate
 import iris.cube
 from iris.exceptions import ConcatenateError
+from iris.tests import mock
 
 
 class TestEpoch(tests.IrisTest):
@@ -282,6 +284,50 @@ class TestOrder(tests.IrisTest):
         self.assertEqual(result1, result2)
 
 
+class TestManyCubes(tests.IrisTest):
+    def _make_cube(self, day, name='air_temperature'):
+        cube = iris.cube.Cube(np.arange(8, dtype=np.float32).reshape(2, 4),
+                              standard_name=name, units='K')
+        time = iris.coords.DimCoord([day * 24, day * 24 + 12],
+                                    standard_name='time',
+                                    bounds=[[day * 24, day * 24 + 12],
+                                            [day * 24 + 12, day * 24 + 24]],
+                                    units='hours since 1970-01-01')
+        cube.add_dim_coord(time, 0)
+        cube.add_dim_coord(iris.coords.DimCoord(np.arange(4), 'longitude'), 1)
+        return cube
+
+    def test_shuffled(self):
+        days = np.random.RandomState(0).permutation(100)
+        cubes = [self._make_cube(day) for day in days]
+        cubes += [self._make_cube(day, 'precipitation_flux')
+                  for day in days[:10]]
+        result = concatenate(cubes)
+        self.assertEqual([cube.shape for cube in result], [(200, 4), (20, 4)])
+        self.assertArrayEqual(result[0].coord('time').points,
+                              np.arange(200) * 12)
+
+    def test_overlap(self):
+        cubes = [self._make_cube(day) for day in [0, 1, 2, 1]]
+        result = concatenate(cubes)
+        self.assertEqual([cube.shape for cube in result], [(6, 4), (2, 4)])
+
+    def test_signature_matches(self):
+        # Each cube is only compared with the proto-cube it is joined to.
+        match = iris._concatenate._CubeSignature.match
+        cubes = []
+        for model in ['a', 'b']:
+            for day in range(50):
+                cube = self._make_cube(day)
+                cube.attributes['model'] = model
+                cubes.append(cube)
+        with mock.patch('iris._concatenate._CubeSignature.match',
+                        autospec=True, side_effect=match) as patched:
+            result = concatenate(cubes)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(patched.call_count, 98)
+
+
 class TestConcatenateBiggus(tests.IrisTest):
     def build_lazy_cube(self, points, bounds=None, nx=4):
         data = np.arange(len(points) * nx).reshape(len(points), nx)
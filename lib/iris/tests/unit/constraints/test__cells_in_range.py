@@ -0,0 +1,108 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris._constraints._cells_in_range` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import itertools
+
+import cf_units
+import numpy as np
+
+from iris import FUTURE
+from iris._constraints import CellRange, _cells_in_range
+from iris.coords import AuxCoord, DimCoord
+from iris.time import PartialDateTime
+
+
+class Test(tests.IrisTest):
+    def check(self, coord, minimum, maximum):
+        # Compare with the comparison of each cell in turn, for each of the
+        # inclusive and exclusive ranges.
+        for inclusive in itertools.product([True, False], repeat=2):
+            cell_range = CellRange(minimum, maximum, *inclusive)
+            result = _cells_in_range(coord, cell_range)
+            expected = [cell_range(cell) for cell in coord.cells()]
+            self.assertArrayEqual(result, expected)
+
+    def test_numbers(self):
+        coord = AuxCoord([3, 1, 4, 1, 5, 9, 2, 6], long_name='x')
+        self.check(coord, 2, 5)
+        self.check(coord, 4.5, None)
+        self.check(coord, None, np.int16(4))
+
+    def test_no_limits(self):
+        coord = AuxCoord([3, 1, 4], long_name='x')
+        self.check(coord, None, None)
+
+    def test_bounded(self):
+        coord = DimCoord([0.5, 1.5, 2.5, 3.5], long_name='x',
+                         bounds=[[0, 1], [1, 2], [3, 2], [3, 4]])
+        self.check(coord, 1, 3)
+        self.check(coord, 0.5, 3.5)
+        self.check(coord, 2, None)
+        self.check(coord, None, 2)
+
+    def test_partial_date_times(self):
+        values = [None, PartialDateTime(2000, 2), PartialDateTime(2000, 3, 1),
+                  PartialDateTime(month=2, day=15),
+                  PartialDateTime(day=10, hour=6)]
+        for calendar in ['gregorian', '360_day', '365_day']:
+            units = cf_units.Unit('hours since 2000-01-01',
+                                  calendar=calendar)
+            coord = DimCoord(np.arange(0, 24 * 90, 7), 'time', units=units)
+            with FUTURE.context(cell_datetime_objects=True):
+                for minimum, maximum in itertools.product(values, repeat=2):
+                    self.check(coord, minimum, maximum)
+
+    def test_partial_date_times_numeric_cells(self):
+        coord = DimCoord(np.arange(10), 'time', units='days since 2000-01-01')
+        cell_range = CellRange(PartialDateTime(2000, 1, 3))
+        with FUTURE.context(cell_datetime_objects=False):
+            self.assertIsNone(_cells_in_range(coord, cell_range))
+
+    def test_partial_date_times_bounded(self):
+        coord = DimCoord(np.arange(10), 'time', units='days since 2000-01-01')
+        coord.guess_bounds()
+        cell_range = CellRange(PartialDateTime(2000, 1, 3))
+        with FUTURE.context(cell_datetime_objects=True):
+            self.assertIsNone(_cells_in_range(coord, cell_range))
+
+    def test_microseconds(self):
+        coord = DimCoord(np.arange(10), 'time', units='days since 2000-01-01')
+        cell_range = CellRange(PartialDateTime(2000, 1, 3, microsecond=1))
+        with FUTURE.context(cell_datetime_objects=True):
+            self.assertIsNone(_cells_in_range(coord, cell_range))
+
+    def test_numbers_datetime_cells(self):
+        coord = DimCoord(np.arange(10), 'time', units='days since 2000-01-01')
+        with FUTURE.context(cell_datetime_objects=True):
+            self.assertIsNone(_cells_in_range(coord, CellRange(1, 3)))
+
+    def test_mixed(self):
+        coord = AuxCoord([3, 1, 4], long_name='x')
+        cell_range = CellRange(1, PartialDateTime(2000))
+        self.assertIsNone(_cells_in_range(coord, cell_range))
+
+
+if __name__ == "__main__":
+    tests.main()
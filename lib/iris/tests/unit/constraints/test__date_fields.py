@@ -0,0 +1,77 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris._constraints._date_fields` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import cf_units
+import numpy as np
+
+from iris._constraints import _calendar_date_fields, _date_fields
+
+
+class Test(tests.IrisTest):
+    def check(self, units, points):
+        # Compare with the fields of the datetime of each point.
+        result = _date_fields(units, points)
+        dates = units.num2date(points)
+        for name in ['year', 'month', 'day', 'hour', 'minute', 'second']:
+            expected = [getattr(date, name) for date in dates]
+            self.assertArrayEqual(result[name], expected)
+
+    def test_calendars(self):
+        points = np.arange(-1000, 200000, 37)
+        for calendar in cf_units.CALENDARS:
+            units = cf_units.Unit('hours since 1970-01-01 00:00:00',
+                                  calendar=calendar)
+            self.check(units, points)
+
+    def test_units(self):
+        points = np.arange(-1000.0, 100000.0, 12.25)
+        for name in ['days since 1850-03-01 06:00:00',
+                     'minutes since 2001-02-28 23:59:00',
+                     'seconds since 2000-01-01 00:00:00']:
+            for calendar in ['gregorian', '360_day', '366_day']:
+                units = cf_units.Unit(name, calendar=calendar)
+                self.check(units, points)
+
+    def test_arithmetic(self):
+        units = cf_units.Unit('hours since 2000-01-01', calendar='360_day')
+        fields = _calendar_date_fields(units, np.array([0, 30 * 24 + 7]))
+        self.assertArrayEqual(fields['month'], [1, 2])
+        self.assertArrayEqual(fields['hour'], [0, 7])
+
+    def test_julian(self):
+        # Dates of the Julian calendar are found from datetimes.
+        units = cf_units.Unit('days since 2000-01-01', calendar='julian')
+        self.assertIsNone(_calendar_date_fields(units, np.arange(3)))
+        self.check(units, np.arange(0, 1000, 7))
+
+    def test_before_gregorian(self):
+        # The standard calendar is Julian before 1582-10-15.
+        units = cf_units.Unit('days since 1582-10-15', calendar='standard')
+        self.assertIsNone(_calendar_date_fields(units, np.arange(-3, 3)))
+        self.check(units, np.arange(-30, 30))
+
+
+if __name__ == "__main__":
+    tests.main()
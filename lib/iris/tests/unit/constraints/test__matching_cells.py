@@ -0,0 +1,95 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris._constraints._matching_cells` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import cf_units
+import numpy as np
+
+from iris import FUTURE
+from iris._constraints import _matching_cells
+from iris.coords import AuxCoord, DimCoord
+from iris.time import PartialDateTime
+
+
+class Test(tests.IrisTest):
+    def check(self, coord, values):
+        # Compare with the comparison of each cell in turn.
+        result = _matching_cells(coord, values)
+        expected = [any(cell == value for value in values)
+                    for cell in coord.cells()]
+        self.assertArrayEqual(result, expected)
+
+    def test_numbers(self):
+        coord = AuxCoord([3, 1, 4, 1, 5, 9, 2, 6], long_name='x')
+        self.check(coord, [1, 9.0, 7])
+        self.check(coord, [np.int16(4)])
+
+    def test_no_values(self):
+        coord = AuxCoord([3, 1, 4], long_name='x')
+        self.check(coord, [])
+
+    def test_bounded(self):
+        coord = DimCoord([0.5, 1.5, 2.5, 3.5], long_name='x',
+                         bounds=[[0, 1], [1, 2], [3, 2], [3, 4]])
+        # A value on a shared bound matches both of the cells.
+        self.check(coord, [2])
+        self.check(coord, [0.25, 3.75, 10])
+
+    def test_strings(self):
+        coord = AuxCoord(['djf', 'mam', 'jja', 'son', 'djf'],
+                         long_name='season')
+        self.check(coord, ['djf', 'son'])
+
+    def test_partial_date_times(self):
+        units = cf_units.Unit('hours since 2000-01-01',
+                              calendar='360_day')
+        coord = DimCoord(np.arange(0, 24 * 90, 7), 'time', units=units)
+        values = [PartialDateTime(month=2, hour=6),
+                  PartialDateTime(day=17, hour=0)]
+        with FUTURE.context(cell_datetime_objects=True):
+            self.check(coord, values)
+
+    def test_partial_date_times_numeric_cells(self):
+        coord = DimCoord(np.arange(10), 'time', units='days since 2000-01-01')
+        with FUTURE.context(cell_datetime_objects=False):
+            self.assertIsNone(_matching_cells(coord, [PartialDateTime(1)]))
+
+    def test_partial_date_times_bounded(self):
+        coord = DimCoord(np.arange(10), 'time', units='days since 2000-01-01')
+        coord.guess_bounds()
+        with FUTURE.context(cell_datetime_objects=True):
+            self.assertIsNone(_matching_cells(coord, [PartialDateTime(1)]))
+
+    def test_numbers_datetime_cells(self):
+        coord = DimCoord(np.arange(10), 'time', units='days since 2000-01-01')
+        with FUTURE.context(cell_datetime_objects=True):
+            self.assertIsNone(_matching_cells(coord, [1]))
+
+    def test_mixed(self):
+        coord = AuxCoord([3, 1, 4], long_name='x')
+        self.assertIsNone(_matching_cells(coord, [1, 'one']))
+
+
+if __name__ == "__main__":
+    tests.main()
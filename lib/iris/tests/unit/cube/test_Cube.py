@@ -32,7 +32,7 @@ import iris.coords
 import iris.exceptions
 from iris import FUTURE
 from iris.analysis import WeightedAggregator, Aggregator
-from iris.analysis import MEAN
+from iris.analysis import MEAN, STD_DEV
 from iris.cube import Cube
 from iris.coords import AuxCoord, DimCoord, CellMeasure
 from iris.exceptions import CoordinateNotFoundError, CellMeasureNotFoundError
@@ -368,6 +368,56 @@ class Test_aggregated_by(tests.IrisTest):
                          AuxCoord(['a|a', 'a'], long_name='bar'))
 
 
+class Test_aggregated_by__lazy(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(15.0).reshape((3, 5))
+        cube = Cube(biggus.NumpyArrayAdapter(self.data))
+        cube.add_dim_coord(DimCoord(np.arange(3), long_name='y'), 0)
+        cube.add_dim_coord(DimCoord(np.arange(5), long_name='x'), 1)
+        cube.add_aux_coord(AuxCoord([0, 1, 0], long_name='ygroup'), 0)
+        cube.add_aux_coord(AuxCoord([0, 0, 1, 1, 0], long_name='xgroup'), 1)
+        self.cube = cube
+
+    def test_dim0_lazy(self):
+        result = self.cube.aggregated_by('ygroup', MEAN)
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayAlmostEqual(result.data, [[5.0, 6.0, 7.0, 8.0, 9.0],
+                                                  [5.0, 6.0, 7.0, 8.0, 9.0]])
+        self.assertFalse(result.has_lazy_data())
+
+    def test_dim1_lazy(self):
+        result = self.cube.aggregated_by('xgroup', MEAN)
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayAlmostEqual(result.data, [[1.0, 2.5],
+                                                  [6.0, 7.5],
+                                                  [11.0, 12.5]])
+        self.assertEqual(result.coord('xgroup'),
+                         AuxCoord([0, 1], long_name='xgroup'))
+
+    def test_matches_non_lazy(self):
+        expected = self.cube.copy(self.data).aggregated_by('xgroup', STD_DEV)
+        result = self.cube.aggregated_by('xgroup', STD_DEV)
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayAlmostEqual(result.data, expected.data)
+
+    def test_masked(self):
+        data = ma.masked_array(self.data, mask=self.data % 4 == 0)
+        cube = self.cube.copy(biggus.NumpyArrayAdapter(data))
+        expected = self.cube.copy(data).aggregated_by('ygroup', MEAN)
+        result = cube.aggregated_by('ygroup', MEAN)
+        self.assertTrue(result.has_lazy_data())
+        self.assertMaskedArrayAlmostEqual(result.data, expected.data)
+
+    def test_non_lazy_aggregator(self):
+        # An aggregator which doesn't have a lazy function should still work.
+        dummy_agg = Aggregator('custom_op',
+                               lambda x, axis=None: np.mean(x, axis=axis))
+        result = self.cube.aggregated_by('ygroup', dummy_agg)
+        self.assertFalse(result.has_lazy_data())
+        self.assertArrayAlmostEqual(result.data, [[5.0, 6.0, 7.0, 8.0, 9.0],
+                                                  [5.0, 6.0, 7.0, 8.0, 9.0]])
+
+
 class Test_rolling_window(tests.IrisTest):
     def setUp(self):
         self.cube = Cube(np.arange(6))
@@ -411,6 +461,33 @@ class Test_rolling_window(tests.IrisTest):
         self.assertMaskedArrayEqual(expected_result, res_cube.data)
 
 
+class Test_rolling_window__lazy(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(12.0).reshape((2, 6)) ** 2
+        cube = Cube(biggus.NumpyArrayAdapter(self.data))
+        cube.add_dim_coord(DimCoord(np.arange(2), long_name='y'), 0)
+        cube.add_dim_coord(DimCoord(np.arange(6), long_name='x'), 1)
+        self.cube = cube
+
+    def test_lazy(self):
+        result = self.cube.rolling_window('x', MEAN, 3)
+        self.assertTrue(result.has_lazy_data())
+        expected = self.cube.copy(self.data).rolling_window('x', MEAN, 3)
+        self.assertArrayAlmostEqual(result.data, expected.data)
+        self.assertEqual(result.coord('x'), expected.coord('x'))
+
+    def test_non_lazy_aggregator(self):
+        result = self.cube.rolling_window('x', STD_DEV, 3)
+        self.assertFalse(result.has_lazy_data())
+
+    def test_weights(self):
+        weights = np.array([0.5, 0.5])
+        result = self.cube.rolling_window('y', MEAN, 2, weights=weights)
+        self.assertFalse(result.has_lazy_data())
+        self.assertArrayAlmostEqual(result.data,
+                                    (self.data[0] + self.data[1]) / 2)
+
+
 class Test_slices_over(tests.IrisTest):
     def setUp(self):
         self.cube = stock.realistic_4d()
@@ -540,6 +617,13 @@ class Test_slices_over(tests.IrisTest):
         res = self.cube.slices_over([])
         self.assertEqual(next(res), self.cube)
 
+    def test_view(self):
+        res = self.cube.slices_over('model_level_number', view=True)
+        for i, res_cube in zip(self.exp_iter_1d, res):
+            expected = self.cube[:, i]
+            self.assertEqual(res_cube, expected)
+            self.assertTrue(np.may_share_memory(res_cube.data, self.cube.data))
+
 
 def create_cube(lon_min, lon_max, bounds=False):
     n_lons = max(lon_min, lon_max) - min(lon_max, lon_min)
@@ -1179,6 +1263,17 @@ class Test_regrid(tests.IrisTest):
         result = cube.regrid(mock.sentinel.TARGET, scheme)
         self.assertEqual(result, (scheme, cube, mock.sentinel.TARGET, cube))
 
+    def test_regridder_cache(self):
+        # Test that Cube.regrid() gets its regridder from the cache.
+        cube = Cube(0)
+        with mock.patch('iris.analysis.REGRIDDER_CACHE') as cache:
+            regridder = cache.regridder.return_value
+            result = cube.regrid(mock.sentinel.TARGET, mock.sentinel.SCHEME)
+        cache.regridder.assert_called_once_with(cube, mock.sentinel.TARGET,
+                                                mock.sentinel.SCHEME)
+        regridder.assert_called_once_with(cube)
+        self.assertIs(result, regridder.return_value)
+
 
 class Test_copy(tests.IrisTest):
     def _check_copy(self, cube, cube_copy):
@@ -1360,6 +1455,86 @@ class Test__getitem_CellMeasure(tests.IrisTest):
                          result.cell_measures()[0].data.shape)
 
 
+class Test_view(tests.IrisTest):
+    def setUp(self):
+        cube = Cube(np.arange(24.).reshape(2, 3, 4), long_name='wibble',
+                    attributes={'source': 'test'})
+        x_coord = DimCoord(np.arange(4.), long_name='x',
+                           bounds=np.arange(8.).reshape(4, 2))
+        cube.add_dim_coord(x_coord, 2)
+        y_coord = DimCoord(np.arange(3.), long_name='y')
+        cube.add_dim_coord(y_coord, 1)
+        z_coord = AuxCoord(np.arange(6).reshape(2, 3), long_name='z')
+        cube.add_aux_coord(z_coord, [0, 1])
+        self.cube = cube
+
+    def _check(self, keys):
+        result = self.cube.view[keys]
+        self.assertEqual(result, self.cube[keys])
+        self.assertTrue(np.may_share_memory(result.data, self.cube.data))
+        return result
+
+    def test_slice(self):
+        self._check((slice(None), slice(1, 3)))
+
+    def test_reversed_slice(self):
+        result = self._check((Ellipsis, slice(None, None, -1)))
+        self.assertEqual(result.coord('x').points[0], 3)
+
+    def test_int(self):
+        result = self._check(1)
+        self.assertEqual(result.shape, (3, 4))
+        self.assertEqual(result.coord('z').shape, (3,))
+
+    def test_scalar_coord(self):
+        result = self._check((0, 1))
+        self.assertEqual(result.coord('y').shape, (1,))
+        self.assertEqual(result.coord('z').shape, (1,))
+        self.assertEqual(result.coord('x').bounds.shape, (4, 2))
+
+    def test_all(self):
+        self._check(Ellipsis)
+
+    def test_shared_data(self):
+        result = self.cube.view[0]
+        result.data[0, 0] = -1
+        self.assertEqual(self.cube.data[0, 0, 0], -1)
+
+    def test_shared_coords(self):
+        result = self.cube.view[:, 1:]
+        for name in ['x', 'y', 'z']:
+            coord = result.coord(name)
+            self.assertTrue(np.may_share_memory(
+                coord.points, self.cube.coord(name).points))
+            self.assertFalse(coord.points.flags.writeable)
+        self.assertTrue(np.may_share_memory(result.coord('x').bounds,
+                                            self.cube.coord('x').bounds))
+
+    def test_copied_metadata(self):
+        result = self.cube.view[0]
+        result.attributes['source'] = 'changed'
+        result.coord('x').long_name = 'changed'
+        self.assertEqual(self.cube.attributes['source'], 'test')
+        self.assertEqual(self.cube.coord('x').long_name, 'x')
+
+    def test_fancy_index(self):
+        # Indexing with a sequence cannot give a view, so copies instead.
+        result = self.cube.view[:, [0, 2]]
+        self.assertEqual(result, self.cube[:, [0, 2]])
+        self.assertFalse(np.may_share_memory(result.data, self.cube.data))
+
+    def test_masked(self):
+        self.cube.data = ma.masked_array(self.cube.data)
+        result = self._check(0)
+        self.assertNotIsInstance(result.data, ma.MaskedArray)
+
+    def test_lazy(self):
+        self.cube.lazy_data(biggus.NumpyArrayAdapter(self.cube.data))
+        result = self.cube.view[0]
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayEqual(result.data, self.cube.data[0])
+
+
 class TestCellMeasures(tests.IrisTest):
     def setUp(self):
         cube = Cube(np.arange(6).reshape(2, 3))
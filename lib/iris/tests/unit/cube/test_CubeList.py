@@ -28,8 +28,11 @@ import numpy as np
 
 from iris.cube import Cube, CubeList
 from iris.coords import AuxCoord, DimCoord
+import iris._merge
 import iris.coord_systems
 import iris.exceptions
+from iris.fileformats.pp import STASH
+from iris.tests import mock
 
 
 class Test_concatenate_cube(tests.IrisTest):
@@ -146,6 +149,36 @@ class Test_merge_cube(tests.IrisTest):
             CubeList([self.cube1, self.cube1]).merge_cube()
 
 
+class Test_merge__keys(tests.IrisTest):
+    def _cubes(self, n_names, n_levels):
+        cubes = CubeList()
+        for i in range(n_names):
+            for level in range(n_levels):
+                cube = Cube([1, 2, 3], long_name='foo',
+                            attributes={'STASH': STASH(1, 0, i)})
+                cube.add_aux_coord(AuxCoord(level, long_name='level'))
+                cubes.append(cube)
+        return cubes
+
+    def test_merge(self):
+        result = self._cubes(5, 4).merge()
+        self.assertEqual(len(result), 5)
+        for i, cube in enumerate(result):
+            self.assertEqual(cube.shape, (4, 3))
+            self.assertEqual(cube.attributes['STASH'], STASH(1, 0, i))
+
+    def test_signature_matches(self):
+        # Each cube is only compared with the ProtoCube it merges into, so
+        # the merge time grows linearly with the number of cubes.
+        match = iris._merge._CubeSignature.match
+        for n_names, n_levels in [(5, 4), (50, 4)]:
+            cubes = self._cubes(n_names, n_levels)
+            with mock.patch('iris._merge._CubeSignature.match',
+                            autospec=True, side_effect=match) as patched:
+                cubes.merge()
+            self.assertEqual(patched.call_count, n_names * (n_levels - 1))
+
+
 class Test_merge__time_triple(tests.IrisTest):
     @staticmethod
     def _make_cube(fp, rt, t, realization=None):
@@ -238,6 +271,37 @@ class Test_merge__time_triple(tests.IrisTest):
         self.assertCML(cube, checksum=False)
 
 
+class Test_merge__engines(tests.IrisTest):
+    # The vectorised and legacy merge engines must give the same cubes.
+    def check(self, triples, realizations):
+        cubes = CubeList(
+            Test_merge__time_triple._make_cube(*triple,
+                                               realization=realization)
+            for triple in triples for realization in realizations)
+        results = []
+        for engine in ['vectorised', 'legacy']:
+            with mock.patch('iris.config.MERGE_ENGINE', engine):
+                results.append(cubes.merge())
+        self.assertEqual(results[0], results[1])
+
+    def test_orthogonal(self):
+        triples = [(fp, rt, fp + rt) for fp in range(3) for rt in range(2)]
+        self.check(triples, [1, 2])
+
+    def test_combination(self):
+        triples = ((0, 10, 1), (0, 11, 3), (1, 10, 1), (1, 11, 2))
+        self.check(triples, [1, 2])
+
+    def test_scalar(self):
+        self.check([(0, 10, 10), (1, 10, 11)], [3])
+
+    def test_unknown(self):
+        cubes = CubeList([Test_merge__time_triple._make_cube(0, 10, 10)])
+        with mock.patch('iris.config.MERGE_ENGINE', 'fast'):
+            with self.assertRaisesRegexp(ValueError, 'Unknown merge engine'):
+                cubes.merge()
+
+
 class Test_xml(tests.IrisTest):
     def setUp(self):
         self.cubes = CubeList([Cube(np.arange(3)),
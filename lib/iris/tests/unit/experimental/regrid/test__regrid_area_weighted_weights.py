@@ -0,0 +1,80 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for
+:func:`iris.experimental.regrid._regrid_area_weighted_weights`.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.experimental.regrid import (_cartesian_area,
+                                      _regrid_area_weighted_weights)
+
+
+def _bounds(edges):
+    edges = np.array(edges, dtype=float)
+    return np.column_stack([edges[:-1], edges[1:]])
+
+
+class Test(tests.IrisTest):
+    def test_overlaps(self):
+        src_x = _bounds([0, 1, 2, 3])
+        src_y = _bounds([0, 2, 4])
+        grid_x = _bounds([0.5, 2.5])
+        grid_y = _bounds([1, 4])
+        weights, valid, grid_shape = _regrid_area_weighted_weights(
+            src_x, src_y, grid_x, grid_y, False, False, _cartesian_area)
+        self.assertEqual(grid_shape, (1, 1))
+        self.assertArrayEqual(valid, [True])
+        # Source cells are flattened in (y, x) order.
+        expected = [[0.5, 1, 0.5, 1, 2, 1]]
+        self.assertArrayAlmostEqual(weights.toarray(), expected)
+
+    def test_decreasing_grid(self):
+        src_x = _bounds([0, 1, 2])
+        src_y = _bounds([0, 1])
+        grid_x = _bounds([2, 1, 0])
+        grid_y = _bounds([0, 1])
+        weights, valid, grid_shape = _regrid_area_weighted_weights(
+            src_x, src_y, grid_x, grid_y, True, False, _cartesian_area)
+        self.assertEqual(grid_shape, (1, 2))
+        self.assertArrayAlmostEqual(weights.toarray(), [[0, 1], [1, 0]])
+
+    def test_outside_extent(self):
+        src_x = _bounds([0, 1, 2])
+        src_y = _bounds([0, 1, 2])
+        grid_x = _bounds([-1, 1, 2])
+        grid_y = _bounds([0, 2])
+        weights, valid, grid_shape = _regrid_area_weighted_weights(
+            src_x, src_y, grid_x, grid_y, False, False, _cartesian_area)
+        self.assertEqual(grid_shape, (1, 2))
+        self.assertArrayEqual(valid, [False, True])
+        # Cells outside the source extent are given no weights at all.
+        self.assertArrayAlmostEqual(weights.toarray(),
+                                    [[0, 0, 0, 0], [0, 1, 0, 1]])
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,181 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :class:`iris.fileformats._cf_translator.Engine`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from iris.fileformats._cf_translator import Engine
+from iris.tests import mock
+
+
+RULES = 'iris.fileformats._pyke_rules.compiled_krb.fc_rules_cf_fc'
+
+
+class _Group(dict):
+    # A CF group, which is a mapping of all its variables by name.
+    def __init__(self, coordinates=None, auxiliary_coordinates=None,
+                 grid_mappings=None, other=None):
+        self.coordinates = coordinates or {}
+        self.auxiliary_coordinates = auxiliary_coordinates or {}
+        self.grid_mappings = grid_mappings or {}
+        self.labels = {}
+        self.cell_measures = {}
+        for variables in (self.coordinates, self.auxiliary_coordinates,
+                          self.grid_mappings, other or {}):
+            self.update(variables)
+
+
+def _cf_variable(**attributes):
+    # A CF variable, which only has the given netCDF attributes.
+    return mock.Mock(spec=list(attributes), **attributes)
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.lat = _cf_variable(units='degrees_north')
+        self.lon = _cf_variable(units='degrees_east')
+        self.height = _cf_variable(units='m')
+        self.cube = mock.Mock(attributes={})
+        self.coord_system = mock.sentinel.coord_system
+        patches = [
+            mock.patch(RULES + '.build_cube_metadata'),
+            mock.patch(RULES + '.build_coordinate_system',
+                       return_value=self.coord_system),
+            mock.patch(RULES + '.build_dimension_coordinate'),
+            mock.patch(RULES + '.build_auxiliary_coordinate')]
+        mocks = [patch.start() for patch in patches]
+        for patch in patches:
+            self.addCleanup(patch.stop)
+        (self.build_cube_metadata, _, self.build_dimension_coordinate,
+         self.build_auxiliary_coordinate) = mocks
+
+    def _activate(self, group, facts, **attributes):
+        engine = Engine()
+        engine.cf_var = _cf_variable(cf_group=group, **attributes)
+        engine.cube = self.cube
+        engine.provides = dict(coordinates=[])
+        engine.requires = {}
+        engine.rule_triggered = set()
+        for fact in facts:
+            engine.add_case_specific_fact('facts_cf', fact[0], fact[1:])
+        engine.activate('fc_rules_cf')
+        return engine
+
+    def _dimension_coordinates(self):
+        return [(args[1], kwargs['coord_name'], kwargs['coord_system'])
+                for args, kwargs in
+                self.build_dimension_coordinate.call_args_list]
+
+    def test_unknown_rule_base(self):
+        with self.assertRaisesRegexp(ValueError, 'Unknown rule base'):
+            Engine().activate('fc_rules_other')
+
+    def test_repeated_fact(self):
+        engine = Engine()
+        engine.add_case_specific_fact('facts_cf', 'coordinate', ('lat',))
+        engine.add_case_specific_fact('facts_cf', 'coordinate', ('lat',))
+        self.assertEqual(engine.facts, {'coordinate': [('lat',)]})
+
+    def test_reset(self):
+        engine = Engine()
+        engine.add_case_specific_fact('facts_cf', 'coordinate', ('lat',))
+        engine.reset()
+        self.assertEqual(engine.facts, {})
+
+    def test_metadata(self):
+        engine = self._activate(_Group(), [])
+        self.build_cube_metadata.assert_called_once_with(engine)
+        self.assertEqual(engine.rule_triggered, set(['fc_default']))
+
+    def test_latitude_longitude(self):
+        grid = _cf_variable(grid_mapping_name='latitude_longitude')
+        group = _Group(coordinates=dict(lat=self.lat, lon=self.lon),
+                       grid_mappings=dict(grid=grid))
+        engine = self._activate(group, [('coordinate', 'lat'),
+                                        ('coordinate', 'lon'),
+                                        ('grid_mapping', 'grid')])
+        expected = [(self.lat, 'latitude', self.coord_system),
+                    (self.lon, 'longitude', self.coord_system)]
+        self.assertEqual(self._dimension_coordinates(), expected)
+        self.assertEqual(engine.provides['coordinate_system'],
+                         self.coord_system)
+        self.assertIn('fc_build_coordinate_latitude', engine.rule_triggered)
+
+    def test_no_coordinate_system(self):
+        group = _Group(coordinates=dict(lat=self.lat, lon=self.lon))
+        self._activate(group, [('coordinate', 'lat'), ('coordinate', 'lon')])
+        expected = [(self.lat, 'latitude', None),
+                    (self.lon, 'longitude', None)]
+        self.assertEqual(self._dimension_coordinates(), expected)
+
+    def test_unsupported_coordinate_system(self):
+        grid = _cf_variable(grid_mapping_name='orthographic')
+        group = _Group(coordinates=dict(lat=self.lat),
+                       grid_mappings=dict(grid=grid))
+        engine = self._activate(group, [('coordinate', 'lat'),
+                                        ('grid_mapping', 'grid')])
+        expected = [(self.lat, 'latitude', None)]
+        self.assertEqual(self._dimension_coordinates(), expected)
+        self.assertNotIn('coordinate_system', engine.provides)
+
+    def test_miscellaneous_coordinate(self):
+        group = _Group(coordinates=dict(height=self.height))
+        engine = self._activate(group, [('coordinate', 'height')])
+        self.build_dimension_coordinate.assert_called_once_with(
+            engine, self.height)
+        self.assertIn('fc_default_coordinate', engine.rule_triggered)
+
+    def test_auxiliary_coordinates(self):
+        group = _Group(auxiliary_coordinates=dict(height=self.height,
+                                                  lat=self.lat))
+        engine = self._activate(group, [('auxiliary_coordinate', 'height'),
+                                        ('auxiliary_coordinate', 'lat')])
+        expected = [mock.call(engine, self.lat, coord_name='latitude'),
+                    mock.call(engine, self.height, coord_name=None)]
+        self.assertEqual(self.build_auxiliary_coordinate.call_args_list,
+                         expected)
+
+    def test_formula_terms(self):
+        root = _cf_variable(
+            standard_name='atmosphere_hybrid_height_coordinate')
+        group = _Group(other=dict(root=root))
+        engine = self._activate(group, [('formula_root', 'root'),
+                                        ('formula_term', 'a', 'root', 'a'),
+                                        ('formula_term', 'b', 'root', 'b'),
+                                        ('formula_term', 'c', 'other', 'c')])
+        expected = dict(formula_type='atmosphere_hybrid_height_coordinate',
+                        formula_terms=dict(a='a', b='b'))
+        self.assertEqual(engine.requires, expected)
+
+    def test_stash(self):
+        self._activate(_Group(), [], um_stash_source='m01s16i203')
+        self.assertEqual(self.cube.attributes['STASH'], 'm01s16i203')
+
+    def test_process_flags(self):
+        self._activate(_Group(), [],
+                       ukmo__process_flags='one_flag two_flags')
+        self.assertEqual(self.cube.attributes['ukmo__process_flags'],
+                         ('one flag', 'two flags'))
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -76,6 +76,56 @@ class Test____iter__(tests.IrisTest):
         extract.assert_called_once_with(FF2PP_instance)
 
 
+class Test__extract_field(tests.IrisTest):
+    def extract_fields(self, table, word_depth=8, table_filter=None):
+        field = mock.Mock(lbuser=[1, None, None, 16, None, None, 1],
+                          bzx=1, bzy=1, lbegin=0)
+        with self.temp_filename() as temp_path:
+            with open(temp_path, 'wb') as fh:
+                # Offset the table by a single word.
+                np.zeros(1, dtype='>i8').tofile(fh)
+                table.tofile(fh)
+            with mock.patch('iris.fileformats._ff.FFHeader'):
+                ff2pp = ff.FF2PP(temp_path, word_depth=word_depth,
+                                 _table_filter=table_filter)
+            ff2pp._ff_header.ff_filename = temp_path
+            ff2pp._ff_header.lookup_table = [2, 64, len(table)]
+            ff2pp._ff_header.dataset_type = 3
+            grid = mock.Mock()
+            grid.vectors = mock.Mock(return_value=(None, None))
+            ff2pp._ff_header.grid = mock.Mock(return_value=grid)
+            with mock.patch('iris.fileformats.pp.make_pp_field',
+                            return_value=field) as make_pp_field, \
+                    mock.patch('iris.fileformats._ff.FF2PP._payload',
+                               return_value=(0, 0)):
+                result = list(ff2pp._extract_field())
+        self.assertEqual(result, [field] * make_pp_field.call_count)
+        return [call[0][0] for call in make_pp_field.call_args_list]
+
+    def test_lookup_table(self):
+        # Check that the LOOKUP table is decoded up to the first
+        # terminating entry.
+        table_dtype = pp._header_table_dtype(word_depth=8)
+        table = np.zeros(3, dtype=table_dtype)
+        table['longs'][:, 0] = [2016, ff._FF_LOOKUP_TABLE_TERMINATE, 2016]
+        table['longs'][:, 1] = [1, 2, 3]
+        table['floats'][:, 0] = [1.5, 2.5, 3.5]
+        header, = self.extract_fields(table)
+        self.assertEqual(header[:2], (2016, 1))
+        self.assertEqual(header[pp.NUM_LONG_HEADERS], 1.5)
+        self.assertEqual(len(header), 64)
+
+    def test_table_filter(self):
+        table_dtype = pp._header_table_dtype(word_depth=8)
+        table = np.zeros(3, dtype=table_dtype)
+        table['longs'][:, 0] = [2014, 2015, 2016]
+        table_filter = mock.Mock(return_value=[False, True, True])
+        headers = self.extract_fields(table, table_filter=table_filter)
+        self.assertEqual([header[0] for header in headers], [2015, 2016])
+        names_table, = table_filter.call_args[0]
+        self.assertArrayEqual(names_table['lbyr'], [2014, 2015, 2016])
+
+
 class Test__extract_field__LBC_format(tests.IrisTest):
     @contextlib.contextmanager
     def mock_for_extract_field(self, fields, x=None, y=None):
@@ -98,9 +148,10 @@ class Test__extract_field__LBC_format(tests.IrisTest):
             open_func = 'builtins.open'
         else:
             open_func = '__builtin__.open'
-        with mock.patch('numpy.fromfile', return_value=[0]), \
+        headers = np.zeros(len(fields), dtype=pp._header_table_dtype(
+            word_depth=ff2pp._word_depth))
+        with mock.patch('numpy.fromfile', return_value=headers), \
                 mock.patch(open_func), \
-                mock.patch('struct.unpack_from', return_value=[4]), \
                 mock.patch('iris.fileformats.pp.make_pp_field',
                            side_effect=fields), \
                 mock.patch('iris.fileformats._ff.FF2PP._payload',
@@ -0,0 +1,161 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the `iris.fileformats.file_handles.ChunkCache` class.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+
+import numpy as np
+import numpy.ma as ma
+
+from iris.fileformats.file_handles import ChunkCache
+from iris.util import create_temp_filename
+
+
+class _Variable(object):
+    # A stand-in for a chunked netCDF4.Variable, which records its reads.
+    def __init__(self, data, chunking, name='var'):
+        self.data = data
+        self._chunking = chunking
+        self.name = name
+        self.reads = []
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+    def chunking(self):
+        return self._chunking
+
+    def __getitem__(self, keys):
+        self.reads.append(keys)
+        return self.data[keys]
+
+
+class Test_read(tests.IrisTest):
+    def setUp(self):
+        self.path = create_temp_filename(suffix='.nc')
+        with open(self.path, 'wb') as fh:
+            fh.write(b'data')
+        self.addCleanup(os.remove, self.path)
+        self.data = np.arange(6 * 7 * 5, dtype='f4').reshape(6, 7, 5)
+        self.variable = _Variable(self.data, [4, 3, 5])
+        self.cache = ChunkCache(maxbytes=10 ** 6)
+
+    def check(self, keys, expected):
+        result = self.cache.read(self.path, self.variable, keys)
+        self.assertArrayEqual(result, expected)
+        return result
+
+    def test_slices(self):
+        self.check((slice(1, 5), slice(2, 6)), self.data[1:5, 2:6])
+
+    def test_steps(self):
+        self.check((slice(None, None, -2), Ellipsis, slice(0, 4, 3)),
+                   self.data[::-2, ..., 0:4:3])
+
+    def test_integer(self):
+        result = self.check((4, slice(None), -1), self.data[4, :, -1])
+        self.assertEqual(result.shape, (7,))
+
+    def test_orthogonal_arrays(self):
+        rows = np.array([5, 0, 3])
+        mask = np.array([True, False, False, True, False, True, True])
+        self.check((rows, mask), self.data[np.ix_(rows, np.flatnonzero(mask))])
+
+    def test_reads_whole_chunks(self):
+        self.check((slice(0, 2), slice(0, 2)), self.data[0:2, 0:2])
+        self.assertEqual(self.variable.reads,
+                         [(slice(0, 4), slice(0, 3), slice(0, 5))])
+
+    def test_reuse(self):
+        self.check((slice(0, 2), slice(0, 2)), self.data[0:2, 0:2])
+        self.check((slice(2, 4), slice(1, 3)), self.data[2:4, 1:3])
+        self.assertEqual(len(self.variable.reads), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_variables_distinct(self):
+        other = _Variable(self.data + 1, [4, 3, 5], name='other')
+        self.check(0, self.data[0])
+        result = self.cache.read(self.path, other, 0)
+        self.assertArrayEqual(result, self.data[0] + 1)
+
+    def test_masked(self):
+        masked = ma.masked_greater(self.data, 100)
+        masked.fill_value = -1
+        self.variable = _Variable(masked, [4, 3, 5])
+        result = self.check((slice(None), 3), masked[:, 3])
+        self.assertArrayEqual(ma.getmaskarray(result),
+                              ma.getmaskarray(masked[:, 3]))
+        self.assertEqual(result.fill_value, -1)
+
+    def test_evict_least_recently_used(self):
+        # Room for two chunks.
+        self.cache.maxbytes = 2 * 4 * 3 * 5 * 4
+        for i in [0, 3, 0, 6]:
+            self.check((0, i), self.data[0, i])
+        self.assertLessEqual(self.cache.nbytes, self.cache.maxbytes)
+        self.check((0, 0), self.data[0, 0])
+        self.assertEqual(self.cache.hits, 2)
+        self.check((0, 3), self.data[0, 3])
+        self.assertEqual(self.cache.misses, 4)
+
+    def test_too_large(self):
+        self.cache.maxbytes = 4 * 3 * 5 * 4
+        keys = (slice(None), slice(0, 4))
+        self.check(keys, self.data[keys])
+        self.assertEqual(self.variable.reads, [keys])
+        self.assertEqual(self.cache.nbytes, 0)
+
+    def test_disabled(self):
+        self.cache.maxbytes = 0
+        self.check(1, self.data[1])
+        self.assertEqual(self.variable.reads, [1])
+
+    def test_contiguous(self):
+        self.variable = _Variable(self.data, 'contiguous')
+        self.check(1, self.data[1])
+        self.assertEqual(self.variable.reads, [1])
+
+    def test_unsupported_keys(self):
+        keys = (np.newaxis, 1)
+        self.check(keys, self.data[keys])
+        self.assertEqual(self.variable.reads, [keys])
+
+    def test_modified_file(self):
+        self.check(0, self.data[0])
+        with open(self.path, 'ab') as fh:
+            fh.write(b'more')
+        self.check(0, self.data[0])
+        self.assertEqual(self.cache.misses, 6)
+
+
+if __name__ == "__main__":
+    tests.main()
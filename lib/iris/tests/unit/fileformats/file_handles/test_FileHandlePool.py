@@ -0,0 +1,135 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the `iris.fileformats.file_handles.FileHandlePool` class.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+from iris.fileformats.file_handles import FileHandlePool
+from iris.tests import mock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for name in ['a', 'b', 'c']:
+            path = os.path.join(self.temp_dir, name)
+            with open(path, 'wb') as fh:
+                fh.write(name.encode('ascii'))
+            self.paths.append(path)
+        self.opener = mock.Mock(side_effect=lambda path: open(path, 'rb'))
+        self.pool = FileHandlePool(self.opener, maxsize=2)
+        self.addCleanup(self.pool.clear)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def read(self, path):
+        with self.pool.checkout(path) as fh:
+            fh.seek(0)
+            return fh.read()
+
+    def test_reuse(self):
+        self.assertEqual(self.read(self.paths[0]), b'a')
+        self.assertEqual(self.read(self.paths[0]), b'a')
+        self.assertEqual(self.opener.call_count, 1)
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 1))
+        self.assertEqual(self.pool.size, 1)
+
+    def test_nested_checkouts(self):
+        # A handle which is in use is never shared.
+        with self.pool.checkout(self.paths[0]) as first:
+            with self.pool.checkout(self.paths[0]) as second:
+                self.assertIsNot(first, second)
+        self.assertEqual(self.opener.call_count, 2)
+        self.assertEqual(self.pool.size, 2)
+
+    def test_evict_least_recently_used(self):
+        for path in [self.paths[0], self.paths[1], self.paths[0],
+                     self.paths[2]]:
+            self.read(path)
+        self.assertEqual(self.pool.size, 2)
+        self.read(self.paths[0])
+        self.assertEqual(self.pool.hits, 2)
+        self.read(self.paths[1])
+        self.assertEqual(self.opener.call_count, 4)
+
+    def test_evicted_handle_closed(self):
+        with self.pool.checkout(self.paths[0]) as handle:
+            pass
+        self.read(self.paths[1])
+        self.read(self.paths[2])
+        self.assertTrue(handle.closed)
+
+    def test_modified_file(self):
+        with self.pool.checkout(self.paths[0]) as handle:
+            pass
+        with open(self.paths[0], 'wb') as fh:
+            fh.write(b'modified')
+        self.assertEqual(self.read(self.paths[0]), b'modified')
+        self.assertTrue(handle.closed)
+        self.assertEqual(self.pool.hits, 0)
+
+    def test_exception_closes_handle(self):
+        with self.assertRaises(ValueError):
+            with self.pool.checkout(self.paths[0]) as handle:
+                raise ValueError()
+        self.assertTrue(handle.closed)
+        self.assertEqual(self.pool.size, 0)
+
+    def test_missing_file(self):
+        with self.assertRaises(IOError):
+            self.read(os.path.join(self.temp_dir, 'missing'))
+        self.assertEqual(self.pool.size, 0)
+
+    def test_maxsize(self):
+        self.read(self.paths[0])
+        self.read(self.paths[1])
+        self.pool.maxsize = 0
+        self.assertEqual(self.pool.size, 0)
+        self.read(self.paths[0])
+        self.assertEqual(self.pool.size, 0)
+
+    def test_discard(self):
+        with self.pool.checkout(self.paths[0]) as handle:
+            pass
+        self.read(self.paths[1])
+        self.pool.discard(self.paths[0])
+        self.assertTrue(handle.closed)
+        self.assertEqual(self.pool.size, 1)
+
+    def test_clear(self):
+        self.read(self.paths[0])
+        self.pool.clear()
+        self.assertEqual(self.pool.size, 0)
+        self.assertEqual((self.pool.hits, self.pool.misses), (0, 0))
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,107 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the `iris.fileformats._header_cache.cached_scan` function.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from iris.fileformats._header_cache import cached_scan
+from iris.tests import mock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        patcher = mock.patch('iris.config.HEADER_CACHE_DIR', self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        handle, self.filename = tempfile.mkstemp()
+        os.close(handle)
+        self.write_file(b'content')
+        self.scan = mock.Mock(side_effect=lambda: {
+            'headers': np.arange(3), 'truncated': np.array(False)})
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+        os.remove(self.filename)
+
+    def write_file(self, content):
+        with open(self.filename, 'wb') as fh:
+            fh.write(content)
+
+    def check_arrays(self, arrays):
+        self.assertEqual(sorted(arrays), ['headers', 'truncated'])
+        self.assertArrayEqual(arrays['headers'], np.arange(3))
+        self.assertFalse(arrays['truncated'])
+
+    def test_disabled(self):
+        with mock.patch('iris.config.HEADER_CACHE_DIR', None):
+            cached_scan(self.filename, 'pp', self.scan)
+            cached_scan(self.filename, 'pp', self.scan)
+        self.assertEqual(self.scan.call_count, 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_cached(self):
+        self.check_arrays(cached_scan(self.filename, 'pp', self.scan))
+        self.check_arrays(cached_scan(self.filename, 'pp', self.scan))
+        self.assertEqual(self.scan.call_count, 1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_kinds(self):
+        cached_scan(self.filename, 'pp', self.scan)
+        cached_scan(self.filename, 'ff-8', self.scan)
+        self.assertEqual(self.scan.call_count, 2)
+
+    def test_file_changed(self):
+        cached_scan(self.filename, 'pp', self.scan)
+        self.write_file(b'new content')
+        self.check_arrays(cached_scan(self.filename, 'pp', self.scan))
+        self.assertEqual(self.scan.call_count, 2)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+    def test_corrupt_entry(self):
+        cached_scan(self.filename, 'pp', self.scan)
+        entry, = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, entry), 'wb') as fh:
+            fh.write(b'corrupt')
+        self.check_arrays(cached_scan(self.filename, 'pp', self.scan))
+        self.assertEqual(self.scan.call_count, 2)
+
+    def test_unwritable(self):
+        with mock.patch('numpy.savez', side_effect=IOError('Disk full')), \
+                mock.patch('warnings.warn') as warn:
+            self.check_arrays(cached_scan(self.filename, 'pp', self.scan))
+        self.assertEqual(warn.call_count, 1)
+        self.assertIn('Disk full', warn.call_args[0][0])
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,113 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for `iris.fileformats.netcdf._convert_constraints`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import iris
+from iris.fileformats.netcdf import _convert_constraints
+from iris.tests import mock
+
+
+def _cf_variable(cf_name='air', global_attributes=None, **attributes):
+    cf_group = mock.Mock(global_attributes=global_attributes or {})
+    return mock.Mock(cf_name=cf_name, cf_group=cf_group,
+                     cf_attrs=lambda: tuple(sorted(attributes.items())))
+
+
+class Test(tests.IrisTest):
+    def check(self, constraints, cf_var, expected):
+        variable_filter = _convert_constraints(constraints)
+        self.assertEqual(variable_filter(cf_var), expected)
+
+    def test_no_constraint(self):
+        self.assertIsNone(_convert_constraints(None))
+
+    def test_coordinate_constraint(self):
+        self.assertIsNone(_convert_constraints(iris.Constraint(height=1)))
+
+    def test_cube_func(self):
+        constraint = iris.Constraint(cube_func=lambda cube: False)
+        self.assertIsNone(_convert_constraints(constraint))
+
+    def test_standard_name(self):
+        cf_var = _cf_variable(standard_name='air_temperature',
+                              long_name='Temperature')
+        self.check('air_temperature', cf_var, True)
+        self.check('Temperature', cf_var, False)
+
+    def test_invalid_standard_name(self):
+        cf_var = _cf_variable(standard_name='not_a_standard_name',
+                              long_name='Temperature')
+        self.check('Temperature', cf_var, True)
+        self.check('not_a_standard_name', cf_var, False)
+
+    def test_invalid_standard_name_only(self):
+        cf_var = _cf_variable(standard_name='not_a_standard_name')
+        self.check('not_a_standard_name', cf_var, True)
+
+    def test_var_name(self):
+        cf_var = _cf_variable(cf_name='tas')
+        self.check('tas', cf_var, True)
+        self.check('air_temperature', cf_var, False)
+
+    def test_any_constraint(self):
+        cf_var = _cf_variable(cf_name='tas')
+        self.check(['air_temperature', 'tas'], cf_var, True)
+        self.check(['air_temperature', iris.Constraint(height=1)], cf_var,
+                   True)
+
+    def test_combination(self):
+        cf_var = _cf_variable(cf_name='tas')
+        self.check(iris.Constraint('tas') & iris.Constraint(height=1),
+                   cf_var, True)
+        self.check(iris.Constraint('air') & iris.Constraint(height=1),
+                   cf_var, False)
+
+    def test_stash(self):
+        cf_var = _cf_variable(um_stash_source='m01s00i024')
+        self.check(iris.AttributeConstraint(STASH='m01s00i024'), cf_var, True)
+        self.check(iris.AttributeConstraint(STASH='m01s00i025'), cf_var,
+                   False)
+        constraint = iris.AttributeConstraint(
+            STASH=lambda stash: stash.item == 24)
+        self.check(constraint, cf_var, True)
+
+    def test_absent_attribute(self):
+        cf_var = _cf_variable()
+        self.check(iris.AttributeConstraint(STASH='m01s00i024'), cf_var,
+                   False)
+
+    def test_global_attribute(self):
+        cf_var = _cf_variable(global_attributes=dict(source='model'))
+        self.check(iris.AttributeConstraint(source='model'), cf_var, True)
+        self.check(iris.AttributeConstraint(source='other'), cf_var, False)
+
+    def test_variable_attribute(self):
+        # A variable attribute may be consumed by the rules, so any value is
+        # possible.
+        cf_var = _cf_variable(source='model')
+        self.check(iris.AttributeConstraint(source='other'), cf_var, True)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -23,6 +23,9 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import numpy as np
+
+from iris.fileformats.file_handles import FileHandlePool
 from iris.fileformats.pp import PPDataProxy, SplittableInt
 from iris.tests import mock
 
@@ -48,5 +51,48 @@ class Test_lbpack(tests.IrisTest):
         self.assertEqual(proxy.lbpack.n4, lbpack // 1000 % 10)
 
 
+class Test__read_batch(tests.IrisTest):
+    def setUp(self):
+        opener = mock.Mock(side_effect=lambda path: open(path, 'rb'))
+        self.pool = FileHandlePool(opener)
+        self.addCleanup(self.pool.clear)
+        patcher = mock.patch('iris.fileformats.file_handles.BINARY_FILES',
+                             self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read_batch(self, offsets):
+        # Write a field of data at each offset, and read them all back
+        # through proxies given in the reverse order.
+        dtype = np.dtype('>f4')
+        arrays = [np.arange(6, dtype=dtype).reshape(2, 3) + i
+                  for i in range(len(offsets))]
+        with self.temp_filename() as temp_path:
+            with open(temp_path, 'wb') as fh:
+                for offset, array in zip(offsets, arrays):
+                    fh.seek(offset)
+                    fh.write(array.tostring())
+            proxies = [PPDataProxy((2, 3), dtype, temp_path, offset, 24,
+                                   0, None, -1e30, None)
+                       for offset in offsets][::-1]
+            result = list(PPDataProxy._read_batch(proxies))
+        self.assertEqual(sorted(index for index, _ in result),
+                         list(range(len(offsets))))
+        for index, load in result:
+            self.assertArrayEqual(load(), arrays[::-1][index])
+        # Return the number of reads.
+        return self.pool.hits + self.pool.misses
+
+    def test_adjacent(self):
+        self.assertEqual(self.read_batch([0, 24, 48]), 1)
+
+    def test_gap(self):
+        self.assertEqual(self.read_batch([0, 100, 1000]), 1)
+
+    def test_distant(self):
+        with mock.patch('iris.fileformats.pp._COALESCE_MAX_GAP', 100):
+            self.assertEqual(self.read_batch([0, 100, 1000]), 2)
+
+
 if __name__ == '__main__':
     tests.main()
@@ -0,0 +1,58 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.fileformats.pp._coalesce_extents` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from iris.fileformats.pp import _coalesce_extents
+from iris.tests import mock
+
+
+@mock.patch('iris.fileformats.pp._COALESCE_MAX_GAP', 10)
+@mock.patch('iris.fileformats.pp._COALESCE_MAX_BYTES', 100)
+class Test(tests.IrisTest):
+    def test_empty(self):
+        self.assertEqual(_coalesce_extents([]), [])
+
+    def test_adjacent(self):
+        self.assertEqual(_coalesce_extents([(0, 20), (20, 20), (40, 20)]),
+                         [(0, 60, [0, 1, 2])])
+
+    def test_gaps(self):
+        self.assertEqual(_coalesce_extents([(0, 20), (30, 20), (61, 20)]),
+                         [(0, 50, [0, 1]), (61, 81, [2])])
+
+    def test_max_bytes(self):
+        self.assertEqual(_coalesce_extents([(0, 60), (60, 60), (120, 10)]),
+                         [(0, 60, [0]), (60, 130, [1, 2])])
+
+    def test_large_extent(self):
+        self.assertEqual(_coalesce_extents([(0, 200), (200, 10)]),
+                         [(0, 200, [0]), (200, 210, [1])])
+
+    def test_overlapping(self):
+        self.assertEqual(_coalesce_extents([(0, 50), (10, 20), (50, 10)]),
+                         [(0, 60, [0, 1, 2])])
+
+
+if __name__ == "__main__":
+    tests.main()
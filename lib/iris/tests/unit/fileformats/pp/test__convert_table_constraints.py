@@ -0,0 +1,119 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the `iris.fileformats.pp._convert_table_constraints`
+function.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+import iris
+from iris.fileformats.pp import _convert_table_constraints
+from iris.fileformats.pp import _header_names_dtype
+from iris.fileformats.pp import STASH
+
+
+def _table(*fields):
+    # Make a table of PP headers from (STASH, lbvc, lblev, blev) values.
+    table = np.zeros(len(fields), dtype=_header_names_dtype())
+    for row, (msi, lbvc, lblev, blev) in zip(table, fields):
+        stash = STASH.from_msi(msi)
+        row['lbuser'][3] = stash.section * 1000 + stash.item
+        row['lbuser'][6] = stash.model
+        row['lbvc'] = lbvc
+        row['lblev'] = lblev
+        row['blev'] = blev
+    return table
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.table = _table(('m01s16i203', 8, 0, 850),
+                            ('m01s16i203', 8, 0, 500),
+                            ('m01s03i236', 129, 0, 0),
+                            ('m01s00i004', 9, 5, 10),
+                            ('m01s00i004', 9, 9999, 0),
+                            ('m01s00i033', 129, 0, 0),
+                            ('m01s00i030', 129, 0, 0))
+
+    def check(self, constraints, expected, **kwargs):
+        table_filter = _convert_table_constraints(constraints, **kwargs)
+        self.assertArrayEqual(table_filter(self.table), expected)
+
+    def test_stash(self):
+        self.check(iris.AttributeConstraint(STASH='m01s16i203'),
+                   [1, 1, 0, 0, 0, 1, 1])
+
+    def test_stash_object(self):
+        self.check(iris.AttributeConstraint(
+            STASH=STASH.from_msi('m01s03i236')),
+            [0, 0, 1, 0, 0, 1, 1])
+
+    def test_stash_callable(self):
+        self.check(iris.AttributeConstraint(
+            STASH=lambda stash: stash.startswith('m01s00')),
+            [0, 0, 0, 1, 1, 1, 1])
+
+    def test_pressure(self):
+        self.check(iris.Constraint(pressure=500), [0, 1, 1, 1, 1, 1, 1])
+
+    def test_pressure_list(self):
+        self.check(iris.Constraint(pressure=[500, 850]),
+                   [1, 1, 1, 1, 1, 1, 1])
+
+    def test_model_level_number_callable(self):
+        self.check(iris.Constraint(model_level_number=lambda cell: cell < 3),
+                   [1, 1, 1, 0, 1, 1, 1])
+
+    def test_stash_and_pressure(self):
+        constraint = (iris.AttributeConstraint(STASH='m01s16i203') &
+                      iris.Constraint(pressure=500))
+        self.assertIsNone(_convert_table_constraints(constraint))
+
+    def test_multiple_constraints(self):
+        constraints = [iris.Constraint(pressure=850),
+                       iris.AttributeConstraint(STASH='m01s00i004')]
+        self.check(constraints, [1, 0, 1, 1, 1, 1, 1])
+
+    def test_coords_disabled(self):
+        self.assertIsNone(_convert_table_constraints(
+            iris.Constraint(pressure=500), coords=False))
+
+    def test_unknown_coord(self):
+        self.assertIsNone(_convert_table_constraints(
+            iris.Constraint(forecast_period=6)))
+
+    def test_name(self):
+        self.assertIsNone(_convert_table_constraints(
+            iris.Constraint('air_temperature')))
+
+    def test_unknown_constraint(self):
+        constraints = [iris.AttributeConstraint(STASH='m01s16i203'),
+                       iris.Constraint(cube_func=lambda cube: True)]
+        self.assertIsNone(_convert_table_constraints(constraints))
+
+
+if __name__ == "__main__":
+    tests.main()
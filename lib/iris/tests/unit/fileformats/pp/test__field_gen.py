@@ -18,14 +18,14 @@
 
 from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
-import six
 
 # Import iris.tests first so that some things can be initialised before
 # importing anything else.
 import iris.tests as tests
 
-import contextlib
-import io
+import shutil
+import struct
+import tempfile
 
 import numpy as np
 
@@ -33,78 +33,129 @@ import iris.fileformats.pp as pp
 from iris.tests import mock
 
 
+def _write_field(fh, header, data_bytes, little_ended=False):
+    # Write a single PP field, with its header and data records.
+    endian = '<' if little_ended else '>'
+    length = struct.Struct('{}L'.format(endian))
+    header_bytes = np.array([header],
+                            dtype=pp._header_table_dtype(endian)).tostring()
+    for record in (header_bytes, data_bytes):
+        fh.write(length.pack(len(record)))
+        fh.write(record)
+        fh.write(length.pack(len(record)))
+
+
+def _header(lbrel=3, lblrec=1, lbext=0, lbuser1=1, bdx=0.5):
+    header = np.zeros(1, dtype=pp._header_table_dtype())[0]
+    header['longs'][14] = lblrec
+    header['longs'][19] = lbext
+    header['longs'][21] = lbrel
+    header['longs'][38] = lbuser1
+    header['floats'][16] = bdx
+    return header
+
+
 class Test(tests.IrisTest):
-    @contextlib.contextmanager
-    def mock_for_field_gen(self, fields):
-        side_effect_fields = list(fields)[:]
-
-        def make_pp_field_override(*args):
-            # Iterates over the fields passed to this context manager,
-            # until there are no more, upon which the np.fromfile
-            # returns an empty list and the while loop in load() is
-            # broken.
-            result = side_effect_fields.pop(0)
-            if not side_effect_fields:
-                np.fromfile.return_value = []
-            return result
-
-        if six.PY3:
-            open_func = 'builtins.open'
-        else:
-            open_func = '__builtin__.open'
-        with mock.patch('numpy.fromfile', return_value=[0]), \
-                mock.patch(open_func), \
-                mock.patch('struct.unpack_from', return_value=[4]), \
-                mock.patch('iris.fileformats.pp.make_pp_field',
-                           side_effect=make_pp_field_override):
-            yield
-
-    def gen_fields(self, fields):
-        with self.mock_for_field_gen(fields):
-            return list(pp._field_gen('mocked', 'mocked'))
+    def gen_fields(self, headers, data=b'\x00\x00\x00\x00',
+                   read_data_bytes=False, little_ended=False,
+                   table_filter=None):
+        with self.temp_filename() as temp_path:
+            with open(temp_path, 'wb') as fh:
+                for header in headers:
+                    _write_field(fh, header, data, little_ended)
+            return list(pp._field_gen(temp_path, read_data_bytes,
+                                      little_ended=little_ended,
+                                      table_filter=table_filter))
 
     def test_lblrec_invalid(self):
-        pp_field = mock.Mock(lblrec=2,
-                             lbext=0)
         with self.assertRaises(ValueError) as err:
-            self.gen_fields([pp_field])
+            self.gen_fields([_header(lblrec=2)])
         self.assertEqual(str(err.exception),
                          ('LBLREC has a different value to the integer '
                           'recorded after the header in the file (8 '
                           'and 4).'))
 
-    def test_read_headers_call(self):
-        # Checks that the two calls to np.fromfile are called in the
-        # expected way.
-        pp_field = mock.Mock(lblrec=1,
-                             lbext=0,
-                             lbuser=[0])
-        with self.mock_for_field_gen([pp_field]):
-            open_fh = mock.MagicMock(spec=io.RawIOBase)
-            open.return_value = open_fh
-            next(pp._field_gen('mocked', read_data_bytes=False))
-            with open_fh as open_fh_ctx:
-                calls = [mock.call(open_fh_ctx, count=45, dtype='>i4'),
-                         mock.call(open_fh_ctx, count=19, dtype='>f4')]
-            np.fromfile.assert_has_calls(calls)
-        with open_fh as open_fh_ctx:
-            expected_deferred_bytes = ('mocked', open_fh_ctx.tell(),
-                                       4, np.dtype('>f4'))
-        self.assertEqual(pp_field._data, expected_deferred_bytes)
-
-    def test_read_data_call(self):
+    def test_headers(self):
+        fields = self.gen_fields([_header(bdx=0.5), _header(bdx=0.25)])
+        self.assertEqual(len(fields), 2)
+        self.assertIsInstance(fields[0], pp.PPField3)
+        self.assertEqual(fields[0].lblrec, 1)
+        self.assertEqual(fields[0].bdx, 0.5)
+        self.assertEqual(fields[1].bdx, 0.25)
+
+    def test_deferred_data(self):
+        # Checks that each field references the location of its data.
+        fields = self.gen_fields([_header(), _header()])
+        first_offset = 4 + pp.PP_HEADER_DEPTH + 4 + 4
+        field_depth = first_offset + 4 + 4
+        for i, field in enumerate(fields):
+            filename, offset, data_len, dtype = field._data
+            self.assertEqual(offset, first_offset + i * field_depth)
+            self.assertEqual(data_len, 4)
+            self.assertEqual(dtype, np.dtype('>f4'))
+
+    def test_read_data(self):
         # Checks that data is read if read_data is True.
-        pp_field = mock.Mock(lblrec=1,
-                             lbext=0,
-                             lbuser=[0])
-        with self.mock_for_field_gen([pp_field]):
-            open_fh = mock.MagicMock(spec=io.RawIOBase)
-            open.return_value = open_fh
-            next(pp._field_gen('mocked', read_data_bytes=True))
-        with open_fh as open_fh_ctx:
-            expected_loaded_bytes = pp.LoadedArrayBytes(open_fh_ctx.read(),
-                                                        np.dtype('>f4'))
-        self.assertEqual(pp_field._data, expected_loaded_bytes)
+        data = np.array([1.5], dtype='>f4').tostring()
+        field, = self.gen_fields([_header()], data, read_data_bytes=True)
+        expected_loaded_bytes = pp.LoadedArrayBytes(data, np.dtype('>f4'))
+        self.assertEqual(field._data, expected_loaded_bytes)
+
+    def test_little_ended(self):
+        data = np.array([1.5], dtype='<f4').tostring()
+        field, = self.gen_fields([_header(bdx=0.75)], data,
+                                 read_data_bytes=True, little_ended=True)
+        self.assertEqual(field.bdx, 0.75)
+        expected_loaded_bytes = pp.LoadedArrayBytes(data, np.dtype('<f4'))
+        self.assertEqual(field._data, expected_loaded_bytes)
+
+    def test_table_filter(self):
+        headers = [_header(bdx=0.5), _header(bdx=0.25), _header(bdx=0.125)]
+        table_filter = mock.Mock(return_value=[True, False, True])
+        fields = self.gen_fields(headers, table_filter=table_filter)
+        self.assertEqual([field.bdx for field in fields], [0.5, 0.125])
+        table, = table_filter.call_args[0]
+        self.assertArrayEqual(table['bdx'], [0.5, 0.25, 0.125])
+
+    def test_table_filter_invalid_header_release(self):
+        # Check that a field with an unknown LBREL value is always visited,
+        # so that it still ends the file iteration.
+        headers = [_header(bdx=0.5), _header(lbrel=0), _header(bdx=0.125)]
+        table_filter = mock.Mock(return_value=[False, False, True])
+        with mock.patch('warnings.warn') as warn:
+            fields = self.gen_fields(headers, table_filter=table_filter)
+        self.assertEqual(fields, [])
+        self.assertEqual(warn.call_count, 1)
+
+    def test_empty_file(self):
+        self.assertEqual(self.gen_fields([]), [])
+
+    def test_header_cache(self):
+        # Checks that a file's headers are only scanned once when the
+        # header cache is enabled.
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        with self.temp_filename() as temp_path:
+            with open(temp_path, 'wb') as fh:
+                _write_field(fh, _header(bdx=0.5), b'\x00\x00\x00\x00')
+            with mock.patch('iris.config.HEADER_CACHE_DIR', cache_dir), \
+                    mock.patch('iris.fileformats.pp._scan_headers',
+                               wraps=pp._scan_headers) as scan_headers:
+                first = list(pp._field_gen(temp_path, False))
+                second = list(pp._field_gen(temp_path, False))
+        self.assertEqual(scan_headers.call_count, 1)
+        self.assertEqual([field.bdx for field in first + second], [0.5, 0.5])
+        self.assertEqual(first[0]._data, second[0]._data)
+
+    def test_truncated_header(self):
+        with self.temp_filename() as temp_path:
+            with open(temp_path, 'wb') as fh:
+                _write_field(fh, _header(), b'\x00\x00\x00\x00')
+                fh.write(b'\x00' * 100)
+            generator = pp._field_gen(temp_path, False)
+            next(generator)
+            with self.assertRaises(EOFError):
+                next(generator)
 
     def test_invalid_header_release(self):
         # Check that an unknown LBREL value just results in a warning
@@ -0,0 +1,94 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.fileformats.pp.load_table` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import struct
+
+import numpy as np
+
+import iris.fileformats.pp as pp
+
+
+def _write_field(fh, longs, little_ended=False):
+    # Write a single PP field, with a four byte data record.
+    endian = '<' if little_ended else '>'
+    length = struct.Struct('{}L'.format(endian))
+    header = np.zeros(1, dtype=pp._header_table_dtype(endian))
+    header['longs'][0, 14] = 1
+    header['longs'][0, 21] = 3
+    for index, value in longs.items():
+        header['longs'][0, index] = value
+    header['floats'][0, 6] = 850
+    for record in (header.tostring(), b'\x00' * 4):
+        fh.write(length.pack(len(record)))
+        fh.write(record)
+        fh.write(length.pack(len(record)))
+
+
+class Test(tests.IrisTest):
+    def load_table(self, fields, little_ended=False, truncate=0):
+        with self.temp_filename() as temp_path:
+            with open(temp_path, 'wb') as fh:
+                for longs in fields:
+                    _write_field(fh, longs, little_ended)
+                fh.truncate(fh.tell() - truncate)
+            return pp.load_table(temp_path, little_ended=little_ended)
+
+    def test_columns(self):
+        table = self.load_table([{13: 6, 41: 16203}, {13: 12, 41: 3236}])
+        self.assertEqual(len(table), 2)
+        self.assertArrayEqual(table['lbft'], [6, 12])
+        self.assertArrayEqual(table['lbuser'][:, 3], [16203, 3236])
+        self.assertArrayEqual(table['lbrel'], [3, 3])
+        self.assertArrayEqual(table['blev'], [850, 850])
+
+    def test_data_location(self):
+        table = self.load_table([{}, {}])
+        first_offset = 4 + pp.PP_HEADER_DEPTH + 4 + 4
+        field_depth = first_offset + 4 + 4
+        self.assertArrayEqual(table['data_offset'],
+                              [first_offset, first_offset + field_depth])
+        self.assertArrayEqual(table['data_len'], [4, 4])
+
+    def test_native_byte_order(self):
+        table = self.load_table([{13: 6}])
+        self.assertTrue(table.dtype['lbft'].isnative)
+        self.assertTrue(table.dtype['blev'].isnative)
+
+    def test_little_ended(self):
+        table = self.load_table([{13: 6}], little_ended=True)
+        self.assertArrayEqual(table['lbft'], [6])
+
+    def test_empty_file(self):
+        table = self.load_table([])
+        self.assertEqual(len(table), 0)
+        self.assertIn('lbft', table.dtype.names)
+
+    def test_truncated(self):
+        with self.assertRaises(EOFError):
+            self.load_table([{}, {}], truncate=pp.PP_HEADER_DEPTH)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -31,6 +31,7 @@ import warnings
 
 import numpy as np
 
+from iris.coord_systems import GeogCS
 from iris.coords import AuxCoord, DimCoord
 from iris.fileformats._pyke_rules.compiled_krb.fc_rules_cf_fc import \
     build_dimension_coordinate
@@ -402,5 +403,62 @@ class TestCircularScalar(tests.IrisTest, RulesTestMixin):
         self._assert_circular(False)
 
 
+class TestSharedCoord(tests.IrisTest, RulesTestMixin):
+    def setUp(self):
+        RulesTestMixin.setUp(self)
+        self.engine.coord_cache = {}
+        self.cf_bounds_var = None
+        self.reads = 0
+        points = np.arange(6)
+
+        def getitem(cf_var_self, key):
+            self.reads += 1
+            return points[key]
+
+        self.cf_coord_var = mock.Mock(
+            dimensions=('foo',),
+            cf_name='wibble',
+            standard_name=None,
+            long_name='wibble',
+            units='m',
+            shape=points.shape,
+            dtype=points.dtype,
+            __getitem__=getitem)
+
+    def _build(self, dimensions, coord_system=None):
+        self.engine.cf_var = mock.Mock(dimensions=dimensions)
+        self.engine.cube = mock.Mock()
+        with self.deferred_load_patch, self.get_cf_bounds_var_patch:
+            build_dimension_coordinate(self.engine, self.cf_coord_var,
+                                       coord_system=coord_system)
+        coord, dims = self.engine.cube.add_dim_coord.call_args[0]
+        return coord, dims
+
+    def test_read_once(self):
+        coord_a, dims_a = self._build(('foo', 'bar'))
+        coord_b, dims_b = self._build(('bar', 'foo'))
+        self.assertEqual(self.reads, 1)
+        self.assertEqual(coord_a, coord_b)
+        self.assertIsNot(coord_a, coord_b)
+        self.assertEqual(dims_a, [0])
+        self.assertEqual(dims_b, [1])
+
+    def test_coord_system(self):
+        coord_a, _ = self._build(('foo',))
+        coord_system = GeogCS(6371229.0)
+        coord_b, _ = self._build(('foo',), coord_system=coord_system)
+        coord_c, _ = self._build(('foo',), coord_system=GeogCS(6371229.0))
+        self.assertEqual(self.reads, 2)
+        self.assertIsNone(coord_a.coord_system)
+        self.assertEqual(coord_b.coord_system, coord_system)
+        self.assertEqual(coord_c, coord_b)
+
+    def test_no_cache(self):
+        self.engine.coord_cache = None
+        self._build(('foo',))
+        self._build(('foo',))
+        self.assertEqual(self.reads, 2)
+
+
 if __name__ == '__main__':
     tests.main()
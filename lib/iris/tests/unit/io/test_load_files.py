@@ -0,0 +1,123 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.io.load_files` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+import iris
+import iris.io
+import iris.io.format_picker as fp
+from iris.tests import mock
+
+
+def _handler(filenames, callback):
+    # Yield a "cube" for each file, recording the calling thread's view of
+    # the FUTURE settings.
+    for filename in filenames:
+        yield (os.path.basename(filename), iris.FUTURE.netcdf_promote)
+
+
+def _grib_handler(filenames, callback):
+    # Yield a "cube" for each file, recording the calling thread's view of
+    # the GRIB conversion options.
+    load_convert = sys.modules['iris.fileformats.grib._load_convert']
+    for filename in filenames:
+        yield (os.path.basename(filename),
+               load_convert.options.warn_on_unsupported)
+
+
+def _constraint_aware_handler(filenames, callback, constraints):
+    for filename in filenames:
+        yield (os.path.basename(filename), constraints)
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.filenames = []
+        for basename in ['c.foo', 'b.bar', 'a.foo', 'e.bar', 'd.foo']:
+            filename = os.path.join(self.temp_dir, basename)
+            with open(filename, 'w'):
+                pass
+            self.filenames.append(filename)
+        agent = fp.FormatAgent()
+        agent.add_spec(fp.FormatSpecification('Foo', fp.FileExtension(),
+                                              '.foo', _handler))
+        agent.add_spec(fp.FormatSpecification(
+            'Bar', fp.FileExtension(), '.bar', _constraint_aware_handler,
+            constraint_aware_handler=True))
+        patcher = mock.patch('iris.fileformats.FORMAT_AGENT', agent)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_serial(self):
+        glob = os.path.join(self.temp_dir, '*')
+        result = list(iris.io.load_files([glob], None, mock.sentinel.cons))
+        expected = [('b.bar', mock.sentinel.cons),
+                    ('e.bar', mock.sentinel.cons),
+                    ('a.foo', False),
+                    ('c.foo', False),
+                    ('d.foo', False)]
+        self.assertEqual(result, expected)
+
+    def test_workers_same_order(self):
+        serial = list(iris.io.load_files(self.filenames, None,
+                                         mock.sentinel.cons))
+        parallel = list(iris.io.load_files(self.filenames, None,
+                                           mock.sentinel.cons, workers=3))
+        self.assertEqual(parallel, serial)
+
+    def test_workers_future(self):
+        with iris.FUTURE.context(netcdf_promote=True):
+            result = list(iris.io.load_files(self.filenames[:1], None,
+                                             workers=2))
+        self.assertEqual(result, [('c.foo', True)])
+
+    def test_workers_grib_options(self):
+        # A mock of the GRIB conversion, whose options are thread-specific,
+        # and only set in the calling thread.
+        options = threading.local()
+        options.warn_on_unsupported = True
+        load_convert = mock.Mock(options=options)
+        agent = fp.FormatAgent()
+        agent.add_spec(fp.FormatSpecification('GRIB', fp.FileExtension(),
+                                              '.foo', _grib_handler))
+        with mock.patch.dict(
+                'sys.modules',
+                {'iris.fileformats.grib._load_convert': load_convert}), \
+                mock.patch('iris.fileformats.FORMAT_AGENT', agent):
+            result = list(iris.io.load_files(self.filenames[:1], None,
+                                             workers=2))
+        self.assertEqual(result, [('c.foo', True)])
+
+
+if __name__ == "__main__":
+    tests.main()
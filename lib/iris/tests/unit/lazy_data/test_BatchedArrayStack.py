@@ -0,0 +1,154 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris._lazy_data.BatchedArrayStack` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import biggus
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import BatchedArrayStack
+from iris.tests import mock
+
+
+class _Source(object):
+    # A data source of shape (2, 3), which can be read in batches.
+    batches = []
+
+    def __init__(self, value):
+        self.value = value
+        self.shape = (2, 3)
+        self.dtype = np.dtype('f8')
+
+    def _data(self):
+        data = np.arange(6.0).reshape(2, 3) + self.value
+        return ma.masked_greater(data, 33)
+
+    def __getitem__(self, keys):
+        return self._data()[keys]
+
+    @classmethod
+    def _read_batch(cls, sources):
+        cls.batches.append([source.value for source in sources])
+        for index in range(len(sources))[::-1]:
+            yield index, sources[index]._data
+
+
+class _PlainSource(_Source):
+    _read_batch = None
+
+
+class _SparseMaskSource(_Source):
+    # A data source whose partial mask depends on its value.
+    def _data(self):
+        data = np.arange(6.0).reshape(2, 3) + self.value
+        return ma.masked_where(data % 3 == 0, data)
+
+
+def _stack(shape, source_type=_Source):
+    stack = np.empty(shape, dtype=object)
+    for index in np.ndindex(shape):
+        value = np.ravel_multi_index(index, shape) * 10
+        stack[index] = biggus.NumpyArrayAdapter(source_type(value))
+    return stack
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        _Source.batches = []
+        self.stack = _stack((2, 2))
+        self.expected = biggus.ArrayStack(self.stack).masked_array()
+
+    def test_ndarray(self):
+        result = BatchedArrayStack(self.stack).ndarray()
+        self.assertArrayEqual(result, self.expected)
+        self.assertEqual(_Source.batches, [[0, 10, 20, 30]])
+
+    def test_masked_array(self):
+        result = BatchedArrayStack(self.stack).masked_array()
+        self.assertMaskedArrayEqual(result, self.expected)
+        self.assertEqual(ma.count_masked(result), 2)
+        self.assertEqual(_Source.batches, [[0, 10, 20, 30]])
+
+    def test_masked_array_unmasked(self):
+        result = BatchedArrayStack(self.stack[:1]).masked_array()
+        self.assertMaskedArrayEqual(result, self.expected[:1])
+        self.assertIs(result.mask, ma.nomask)
+
+    def test_masked_array_serial(self):
+        for workers in (0, 1):
+            with mock.patch('iris._lazy_data._DECODE_WORKERS', workers):
+                result = BatchedArrayStack(self.stack).masked_array()
+            self.assertMaskedArrayEqual(result, self.expected)
+
+    def test_masked_array_workers(self):
+        # The masks written by concurrent workers are all kept.
+        stack = _stack((6, 5), _SparseMaskSource)
+        expected = biggus.ArrayStack(stack).masked_array()
+        with mock.patch('iris._lazy_data._DECODE_WORKERS', 4):
+            for _ in range(10):
+                result = BatchedArrayStack(stack).masked_array()
+                self.assertMaskedArrayEqual(result, expected)
+        self.assertEqual(ma.count_masked(result), 60)
+
+    def test_shared_pool(self):
+        with mock.patch('iris._lazy_data._DECODE_WORKERS', 2), \
+                mock.patch('iris._lazy_data._DECODE_POOL', None), \
+                mock.patch('iris._lazy_data.ThreadPool') as pool_type:
+            pool = pool_type.return_value
+            pool.apply_async.side_effect = \
+                lambda func, args: mock.Mock(get=lambda: func(*args))
+            BatchedArrayStack(self.stack).masked_array()
+            BatchedArrayStack(self.stack).ndarray()
+        pool_type.assert_called_once_with(2)
+
+    def test_load_error(self):
+        self.stack[1, 0].concrete._data = mock.Mock(
+            side_effect=ValueError('Bad data'))
+        with self.assertRaisesRegexp(ValueError, 'Bad data'):
+            BatchedArrayStack(self.stack).masked_array()
+
+    def test_nested(self):
+        inner = np.empty(2, dtype=object)
+        inner[0] = biggus.ArrayStack(self.stack[0])
+        inner[1] = biggus.ArrayStack(self.stack[1])
+        result = BatchedArrayStack(inner).ndarray()
+        self.assertArrayEqual(result, self.expected)
+        self.assertEqual(_Source.batches, [[0, 10, 20, 30]])
+
+    def test_indexed(self):
+        array = BatchedArrayStack(self.stack)[:, 1, 1:, ::2]
+        self.assertIsInstance(array, BatchedArrayStack)
+        self.assertArrayEqual(array.ndarray(), self.expected[:, 1, 1:, ::2])
+        self.assertEqual(_Source.batches, [[10, 30]])
+
+    def test_unbatched_sources(self):
+        stack = _stack((3,), _PlainSource)
+        result = BatchedArrayStack(stack).ndarray()
+        self.assertArrayEqual(result,
+                              biggus.ArrayStack(stack).ndarray())
+        self.assertEqual(_Source.batches, [])
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,100 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris._lazy_data.RollingWindowProxy` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import biggus
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import RollingWindowProxy
+from iris.util import rolling_window
+
+
+class _Source(object):
+    # A data source which records the shape of each read.
+    def __init__(self, data):
+        self.data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.reads = []
+
+    def __getitem__(self, keys):
+        result = self.data[keys]
+        self.reads.append(result.shape)
+        return result
+
+
+def _window_sum(data, axis=1, window=3):
+    return rolling_window(data, window=window, axis=axis).sum(axis=axis + 1)
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(4 * 10 * 2).reshape(4, 10, 2)
+        self.source = _Source(self.data)
+        self.proxy = RollingWindowProxy(biggus.NumpyArrayAdapter(self.source),
+                                        1, 3, _window_sum, self.data.dtype)
+        self.expected = _window_sum(self.data)
+
+    def test_shape(self):
+        self.assertEqual(self.proxy.shape, (4, 8, 2))
+        self.assertEqual(self.proxy.ndim, 3)
+
+    def test_all(self):
+        self.assertArrayEqual(self.proxy[...], self.expected)
+
+    def test_reads_spanned_run(self):
+        keys = (slice(1, 3), slice(2, 5), slice(None))
+        self.assertArrayEqual(self.proxy[keys], self.expected[keys])
+        self.assertEqual(self.source.reads, [(2, 5, 2)])
+
+    def test_integer_keys(self):
+        keys = (2, 4, slice(None))
+        self.assertArrayEqual(self.proxy[keys], self.expected[keys])
+        self.assertEqual(self.source.reads, [(1, 3, 2)])
+
+    def test_last_index(self):
+        keys = (-1, slice(None), -1)
+        self.assertArrayEqual(self.proxy[keys], self.expected[keys])
+
+    def test_index_array(self):
+        keys = (slice(None), np.array([6, 0, 3]))
+        self.assertArrayEqual(self.proxy[keys], self.expected[keys])
+
+    def test_masked(self):
+        data = ma.masked_greater(self.data, 40)
+        proxy = RollingWindowProxy(biggus.NumpyArrayAdapter(data), 1, 3,
+                                   _window_sum, data.dtype)
+        self.assertMaskedArrayEqual(proxy[1:3], _window_sum(data)[1:3])
+
+    def test_dtype(self):
+        proxy = RollingWindowProxy(biggus.NumpyArrayAdapter(self.source),
+                                   1, 3, _window_sum, np.float32)
+        result = proxy[0]
+        self.assertEqual(result.dtype, np.float32)
+        self.assertArrayEqual(result, self.expected[0])
+
+
+if __name__ == "__main__":
+    tests.main()
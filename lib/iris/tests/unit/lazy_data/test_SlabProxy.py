@@ -0,0 +1,126 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris._lazy_data.SlabProxy` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import biggus
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import SlabProxy
+from iris.tests import mock
+
+
+class _Source(object):
+    # A data source which records the shape of each read.
+    def __init__(self, data):
+        self.data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.reads = []
+
+    def __getitem__(self, keys):
+        result = self.data[keys]
+        self.reads.append(result.shape)
+        return result
+
+
+def _midpoints(data):
+    # Replace the second dimension with the midpoints of its values.
+    return (data[:, 1:] + data[:, :-1]) * 0.5
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(4 * 10 * 2).reshape(4, 10, 2)
+        self.source = _Source(self.data)
+        self.proxy = SlabProxy(biggus.NumpyArrayAdapter(self.source), [1],
+                               (4, 9, 2), _midpoints)
+        self.expected = _midpoints(self.data)
+
+    def test_shape(self):
+        self.assertEqual(self.proxy.shape, (4, 9, 2))
+        self.assertEqual(self.proxy.ndim, 3)
+
+    def test_dtype(self):
+        self.assertEqual(self.proxy.dtype, np.float64)
+        self.assertEqual(self.source.reads, [])
+
+    def test_explicit_dtype(self):
+        proxy = SlabProxy(biggus.NumpyArrayAdapter(self.source), [1],
+                          (4, 9, 2), _midpoints, np.float32)
+        result = proxy[0]
+        self.assertEqual(result.dtype, np.float32)
+        self.assertArrayEqual(result, self.expected[0])
+
+    def test_dtype_error(self):
+        def func(data):
+            raise ValueError('wibble')
+        with self.assertRaisesRegexp(ValueError, 'wibble'):
+            SlabProxy(biggus.NumpyArrayAdapter(self.source), [1], (4, 9, 2),
+                      func)
+
+    def test_all(self):
+        self.assertArrayEqual(self.proxy[...], self.expected)
+
+    def test_reads_whole_slabs(self):
+        keys = (slice(1, 3), slice(2, 5), 1)
+        self.assertArrayEqual(self.proxy[keys], self.expected[keys])
+        self.assertEqual(self.source.reads, [(2, 10, 1)])
+
+    def test_last_index(self):
+        keys = (-1, -1, -1)
+        self.assertArrayEqual(self.proxy[keys], self.expected[keys])
+
+    def test_index_array(self):
+        keys = (np.array([3, 0]), np.array([8, 0, 3]))
+        self.assertArrayEqual(self.proxy[keys],
+                              self.expected[np.ix_(*keys)])
+
+    def test_slabs(self):
+        # Each read is limited to the given number of values.
+        with mock.patch('iris._lazy_data._SLAB_SIZE', 25):
+            self.assertArrayEqual(self.proxy[1:], self.expected[1:])
+        self.assertEqual(self.source.reads, [(1, 10, 2)] * 3)
+        self.source.reads = []
+        with mock.patch('iris._lazy_data._SLAB_SIZE', 15):
+            self.assertArrayEqual(self.proxy[1:], self.expected[1:])
+        self.assertEqual(self.source.reads, [(1, 10, 1)] * 6)
+
+    def test_masked(self):
+        data = ma.masked_greater(self.data, 40)
+        proxy = SlabProxy(biggus.NumpyArrayAdapter(data), [1], (4, 9, 2),
+                          _midpoints)
+        self.assertMaskedArrayEqual(proxy[1:3], _midpoints(data)[1:3])
+
+    def test_masked_unmasked_slabs(self):
+        # Only some of the slabs read contain masked values.
+        data = ma.masked_greater(self.data, 60)
+        proxy = SlabProxy(biggus.NumpyArrayAdapter(data), [1], (4, 9, 2),
+                          _midpoints)
+        with mock.patch('iris._lazy_data._SLAB_SIZE', 20):
+            self.assertMaskedArrayEqual(proxy[...], _midpoints(data))
+
+
+if __name__ == "__main__":
+    tests.main()
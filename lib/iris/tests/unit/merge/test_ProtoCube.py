@@ -34,6 +34,7 @@ from iris._merge import ProtoCube
 from iris.aux_factory import HybridHeightFactory, HybridPressureFactory
 from iris.coords import DimCoord, AuxCoord
 from iris.exceptions import MergeError
+from iris.fileformats.pp import STASH
 from iris.tests import mock
 
 
@@ -85,6 +86,12 @@ class Mixin_register(six.with_metaclass(abc.ABCMeta, object)):
             result = proto_cube.register(self.cube2, error_on_mismatch=True)
             self.assertTrue(result)
 
+    def test_key(self):
+        # Cubes that can be registered together must have equal keys.
+        if not self.fragments:
+            self.assertEqual(ProtoCube.source(self.cube1).key,
+                             ProtoCube.source(self.cube2).key)
+
 
 class Test_register__match(Mixin_register, tests.IrisTest):
     @property
@@ -245,6 +252,54 @@ class Test_register__data_dtype(Mixin_register, tests.IrisTest):
         return cube
 
 
+class Test_source(tests.IrisTest):
+    def test_source(self):
+        cube = example_cube()
+        source = ProtoCube.source(cube)
+        self.assertIs(source.cube, cube)
+        self.assertEqual(source.cube_signature.defn, cube.metadata)
+        self.assertEqual(source.coord_payload.scalar.defns, [])
+        self.assertEqual(hash(source.key), hash(source.key))
+
+    def test_register_source(self):
+        proto_cube = ProtoCube(ProtoCube.source(example_cube()))
+        self.assertEqual(proto_cube.key,
+                         ProtoCube.source(example_cube()).key)
+        result = proto_cube.register(ProtoCube.source(example_cube()))
+        self.assertTrue(result)
+
+    def _keys(self, value1, value2):
+        cube1 = example_cube()
+        cube1.attributes['foo'] = value1
+        cube2 = example_cube()
+        cube2.attributes['foo'] = value2
+        return ProtoCube.source(cube1).key, ProtoCube.source(cube2).key
+
+    def test_key_stash_and_string(self):
+        key1, key2 = self._keys(STASH(1, 0, 4), 'm01s00i004')
+        self.assertEqual(key1, key2)
+
+    def test_key_numbers(self):
+        key1, key2 = self._keys(1, np.float32(1))
+        self.assertEqual(key1, key2)
+
+    def test_key_arrays(self):
+        key1, key2 = self._keys(np.arange(3), np.arange(3))
+        self.assertEqual(key1, key2)
+
+    def test_key_different_stash(self):
+        key1, key2 = self._keys(STASH(1, 0, 4), STASH(1, 0, 5))
+        self.assertNotEqual(key1, key2)
+
+    def test_key_different_coords(self):
+        cube1 = example_cube()
+        cube1.add_aux_coord(AuxCoord(0, long_name='foo'))
+        cube2 = example_cube()
+        cube2.add_aux_coord(AuxCoord(0, long_name='bar'))
+        self.assertNotEqual(ProtoCube.source(cube1).key,
+                            ProtoCube.source(cube2).key)
+
+
 class _MergeTest(object):
     # A mixin test class for common test methods implementation.
 
@@ -0,0 +1,117 @@
+# (C) British Crown Copyright 2026, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris._merge._CodedPositions` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from iris._merge import (_CodedPositions, build_indexes,
+                         derive_relation_matrix, derive_groups, derive_space)
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        # 'a' and 'b' are orthogonal, 'c' depends on both of them and 'd'
+        # is constant.
+        self.positions = [{'a': a, 'b': b, 'c': a * 10 + b, 'd': 7}
+                          for a in range(3) for b in range(2)]
+
+    def test_indexes(self):
+        coded = _CodedPositions(self.positions)
+        indexes = build_indexes(self.positions)
+        for name in 'abcd':
+            self.assertEqual(sorted(coded.indexes[name]),
+                             sorted(indexes[name]))
+
+    def test_codes(self):
+        coded = _CodedPositions(self.positions)
+        self.assertEqual(coded.codes.shape, (6, 4))
+        for name, column in zip(coded.names, coded.codes.T):
+            for position, code in zip(self.positions, column):
+                self.assertEqual(coded.indexes[name][position[name]], code)
+
+    def test_relation_matrix(self):
+        coded = _CodedPositions(self.positions)
+        expected = derive_relation_matrix(build_indexes(self.positions))
+        self.assertEqual(coded.relation_matrix(), expected)
+
+    def test_separable(self):
+        coded = _CodedPositions(self.positions)
+        self.assertTrue(coded.separable('a', 'b'))
+        self.assertTrue(coded.separable('b', 'd'))
+        self.assertFalse(coded.separable('a', 'c'))
+
+    def test_is_dependent(self):
+        coded = _CodedPositions(self.positions)
+        mapping = {}
+        self.assertTrue(coded.is_dependent('c', ['a', 'b'], mapping))
+        expected = {(position['a'], position['b']): position['c']
+                    for position in self.positions}
+        self.assertEqual(mapping, expected)
+
+    def test_is_not_dependent(self):
+        coded = _CodedPositions(self.positions)
+        mapping = {}
+        self.assertFalse(coded.is_dependent('c', ['a'], mapping))
+        self.assertEqual(mapping, {})
+
+    def test_unique_positions(self):
+        coded = _CodedPositions(self.positions)
+        result = coded.unique_positions(['b', 'd'])
+        self.assertEqual(result, self.positions[:2])
+
+    def _space(self, positions):
+        indexes = build_indexes(positions)
+        relation_matrix = derive_relation_matrix(indexes)
+        function_matrix = {}
+        space = derive_space(derive_groups(relation_matrix), relation_matrix,
+                             positions, function_matrix=function_matrix)
+        coded = _CodedPositions(positions)
+        coded_relation_matrix = coded.relation_matrix()
+        coded_function_matrix = {}
+        coded_space = derive_space(derive_groups(coded_relation_matrix),
+                                   coded_relation_matrix, coded,
+                                   function_matrix=coded_function_matrix)
+        self.assertEqual(coded_space, space)
+        self.assertEqual(coded_function_matrix, function_matrix)
+        return space
+
+    def test_space(self):
+        space = self._space(self.positions)
+        self.assertEqual(space, {'a': None, 'b': None, 'c': ('a', 'b'),
+                                 'd': None})
+
+    def test_space_combination(self):
+        positions = [{'a': 0, 'b': 10}, {'a': 0, 'b': 11},
+                     {'a': 1, 'b': 10}]
+        space = self._space(positions)
+        self.assertEqual(space, {'a': ('a-b',), 'b': ('a-b',),
+                                 'a-b': None})
+
+    def test_space_inseparable(self):
+        positions = [{'a': 0, 'b': 10}, {'a': 1, 'b': 11},
+                     {'a': 2, 'b': 11}]
+        space = self._space(positions)
+        self.assertEqual(space, {'a': None, 'b': ('a',)})
+
+
+if __name__ == "__main__":
+    tests.main()